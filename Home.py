@@ -2,7 +2,7 @@
 from __future__ import annotations
 import os
 import streamlit as st
-from ui import apply_theme, render_sidebar, get_pages_config, get_page_url
+from ui import apply_theme, render_sidebar, get_home_cards
 from settings_io import load_settings
 
 st.set_page_config(page_title="JJIF Podiums Suite", page_icon="🏁", layout="wide")
@@ -106,55 +106,14 @@ st.markdown("""
 Welcome  
 """)
 
-config = get_pages_config()
-
-for section in config:
+for section, cards in get_home_cards():
     st.subheader(f"{section['icon']} {section['header']}")
     
-    items = section["items"]
-    # 4 columns for cards
+    # 4 columns for cards (HTML prebuilt once per process, see ui.get_home_cards)
     cols = st.columns(4)
     
-    for i, item in enumerate(items):
-        col = cols[i % 4]
-        with col:
-            # Link calculation (slug)
-            # ex: "pages/01_VIP.py" -> "VIP"
-            p = item["path"]
-            if not os.path.exists(p):
-                # Card disabled if file missing
-                title = item['label']
-                icon = item['icon'] or "❓"
-                desc = item.get('description', 'Missing file')
-                html = f"""
-                <div class="dashboard-card-inner" style="opacity:0.5; cursor:not-allowed;">
-                    <div class="card-icon-box" style="filter:grayscale(1);">{icon}</div>
-                    <div class="card-content">
-                        <div class="card-title">{title}</div>
-                        <div class="card-desc">{desc}</div>
-                    </div>
-                </div>
-                """
-                st.markdown(html, unsafe_allow_html=True)
-            else:
-                # Active card with link
-                target_url = get_page_url(p)
-                
-                title = item['label']
-                icon = item['icon'] or ""
-                desc = item.get('description', '')
-                
-                html = f"""
-                <a href="{target_url}" target="_self" class="dashboard-card">
-                    <div class="dashboard-card-inner">
-                        <div class="card-icon-box">{icon}</div>
-                        <div class="card-content">
-                            <div class="card-title">{title}</div>
-                            <div class="card-desc">{desc}</div>
-                        </div>
-                    </div>
-                </a>
-                """
-                st.markdown(html, unsafe_allow_html=True)
+    for i, card_html in enumerate(cards):
+        with cols[i % 4]:
+            st.markdown(card_html, unsafe_allow_html=True)
                 
     st.markdown("<div style='margin-bottom: 24px;'></div>", unsafe_allow_html=True)
@@ -1,10 +1,11 @@
 
 from __future__ import annotations
-import json
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import Dict, Any
 
+import codec
+
 API_CFG_PATH = Path(__file__).parent / "data" / "api_config.json"
 API_CFG_PATH.parent.mkdir(parents=True, exist_ok=True)
 
@@ -29,7 +30,7 @@ def load_api() -> ApiConfig:
     cfg = ApiConfig()
     if API_CFG_PATH.exists():
         try:
-            raw = json.loads(API_CFG_PATH.read_text(encoding="utf-8"))
+            raw = codec.loads(API_CFG_PATH.read_bytes())
             cfg = ApiConfig(**_merge(asdict(cfg), raw))
         except Exception:
             pass
@@ -38,10 +39,10 @@ def load_api() -> ApiConfig:
 def save_api(new_values: Dict[str, Any]) -> ApiConfig:
     cfg = load_api()
     merged = _merge(asdict(cfg), new_values or {})
-    API_CFG_PATH.write_text(json.dumps(merged, ensure_ascii=False, indent=2), encoding="utf-8")
+    API_CFG_PATH.write_bytes(codec.dumps(merged))
     return ApiConfig(**merged)
 
 def reset_api() -> ApiConfig:
     defaults = ApiConfig()
-    API_CFG_PATH.write_text(json.dumps(asdict(defaults), ensure_ascii=False, indent=2), encoding="utf-8")
+    API_CFG_PATH.write_bytes(codec.dumps(asdict(defaults)))
     return defaults
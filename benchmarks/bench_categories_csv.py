@@ -0,0 +1,92 @@
+# benchmarks/bench_categories_csv.py
+# Import de la liste des catégories (CSV ID, Title) : ancienne lecture (décodages multiples,
+# moteur python sep=None avec puis sans en-tête, iterrows) contre
+# parsers.categories_csv_parser.read_categories_csv (sniff unique, moteur C, usecols, drop_duplicates).
+#   python benchmarks/bench_categories_csv.py [--rows 1000 20000 100000] [--repeat 3]
+from __future__ import annotations
+import argparse, io, random, statistics, sys, time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from parsers.categories_csv_parser import KEEP_RX, SEX_RX, read_categories_csv  # noqa: E402
+
+# ---------------------------
+# Ancienne version (copie figée de pages/14_Import_Categories.py)
+# ---------------------------
+def legacy_read(raw: bytes) -> list:
+    df = None
+    for enc in ("utf-8", "latin-1"):
+        try:
+            text = raw.decode(enc)
+            try:
+                df = pd.read_csv(io.StringIO(text), sep=None, engine="python", header=0)
+            except Exception:
+                df = None
+            if df is None or df.shape[1] < 2:
+                df = pd.read_csv(io.StringIO(text), sep=None, engine="python", header=None)
+            break
+        except Exception:
+            df = None
+    if df is None or df.shape[1] < 2:
+        return []
+    df = df.iloc[:, :2].copy()
+    df.columns = ["id", "title"]
+    df["id"] = df["id"].astype(str).str.strip()
+    df["title"] = df["title"].astype(str).str.strip()
+    df = df[(df["id"] != "") & (df["title"] != "")]
+    inv_mask = df["title"].str.match(SEX_RX) & df["id"].str.contains(KEEP_RX)
+    df.loc[inv_mask, "title"] = df.loc[inv_mask, "id"]
+    df = df[~df["title"].str.match(SEX_RX)]
+    df = df[df["title"].str.contains(KEEP_RX)]
+    seen, rows = set(), []
+    for _, r in df.iterrows():
+        cid, title = r["id"].strip(), r["title"].strip()
+        if cid and title and cid not in seen:
+            rows.append({"id": cid, "title": title})
+            seen.add(cid)
+    return rows
+
+# ---------------------------
+def synth_categories_csv(n: int, sep: str = ";", encoding: str = "utf-8", seed: int = 1) -> bytes:
+    """Liste fédérale synthétique avec en-tête, colonnes en plus, doublons, lignes M/F et hors sujet."""
+    rng = random.Random(seed)
+    ages = ["U14", "U16", "U18", "U21", "Adults", "Master"]
+    kinds = ["Jiu-Jitsu", "Ne-Waza", "Fighting", "Duo System", "Show", "Kata"]  # Kata : filtré
+    lines = [sep.join(["id", "title", "sex", "weight"])]
+    for i in range(n):
+        age, kind, sex = rng.choice(ages), rng.choice(kinds), rng.choice("MF")
+        w = f"-{rng.choice([46, 52, 57, 62, 69, 77, 85, 94])} kg"
+        cid = f"{age[:3].upper()}-{sex}-{rng.randint(1, n // 2 + 1)}"
+        title = f"{age} {'Men' if sex == 'M' else 'Women'} {kind} {w} Équipe"
+        if rng.random() < 0.03:
+            cid, title = title, sex  # colonnes inversées (auto-fix)
+        lines.append(sep.join([cid, title, sex, w]))
+    return ("\n".join(lines) + "\n").encode(encoding)
+
+def _median_ms(fn, raw: bytes, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(raw)
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times) * 1000
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Benchmark de l'import CSV des catégories")
+    ap.add_argument("--rows", type=int, nargs="+", default=[1000, 20000, 100000])
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    print(f"{'lignes':>8} {'encodage':>9} {'avant ms':>10} {'après ms':>10} {'gain':>7}")
+    for n in args.rows:
+        for enc in ("utf-8", "latin-1"):
+            raw = synth_categories_csv(n, encoding=enc)
+            assert read_categories_csv(raw) == legacy_read(raw), f"sorties différentes ({n}, {enc})"
+            t_old = _median_ms(legacy_read, raw, args.repeat)
+            t_new = _median_ms(read_categories_csv, raw, args.repeat)
+            print(f"{n:>8} {enc:>9} {t_old:>10.1f} {t_new:>10.1f} {t_old / t_new:>6.1f}x")
+
+if __name__ == "__main__":
+    main()
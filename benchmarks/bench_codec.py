@@ -0,0 +1,56 @@
+# benchmarks/bench_codec.py
+# Temps de lecture / écriture d'un categories.json de 2 000 catégories selon le codec.
+#   python benchmarks/bench_codec.py [--categories 2000] [--repeat 15]
+from __future__ import annotations
+import argparse, json, statistics, sys, tempfile, time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import codec  # noqa: E402
+from synth import synth_categories  # noqa: E402
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+CODECS = {
+    "json indent=2 (avant)": (lambda v: json.dumps(v, ensure_ascii=False, indent=2).encode("utf-8"),
+                              lambda b: json.loads(b.decode("utf-8"))),
+    "json compact": (lambda v: json.dumps(v, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+                     lambda b: json.loads(b.decode("utf-8"))),
+}
+if orjson is not None:
+    CODECS["orjson compact"] = (lambda v: orjson.dumps(v), orjson.loads)
+    CODECS["orjson indent=2"] = (lambda v: orjson.dumps(v, option=orjson.OPT_INDENT_2), orjson.loads)
+CODECS[f"codec.py ({codec.NAME})"] = (codec.dumps, codec.loads)
+
+def _median_ms(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times) * 1000
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--categories", type=int, default=2000)
+    ap.add_argument("--repeat", type=int, default=15)
+    args = ap.parse_args()
+
+    doc = synth_categories(args.categories)
+    print(f"{args.categories} catégories, médiane sur {args.repeat} essais\n")
+    print(f"{'codec':<24} {'taille':>10} {'écriture':>10} {'lecture':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "categories.json"
+        for name, (dumps, loads) in CODECS.items():
+            write_ms = _median_ms(lambda: path.write_bytes(dumps(doc)), args.repeat)
+            read_ms = _median_ms(lambda: loads(path.read_bytes()), args.repeat)
+            assert loads(path.read_bytes()) == doc
+            size_kb = path.stat().st_size / 1024
+            print(f"{name:<24} {size_kb:>7.0f} Ko {write_ms:>7.2f} ms {read_ms:>7.2f} ms")
+
+if __name__ == "__main__":
+    main()
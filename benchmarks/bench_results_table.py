@@ -0,0 +1,108 @@
+# benchmarks/bench_results_table.py
+# Import de résultats tabulaires (CSV / Excel / Sportdata) : ancienne boucle df.iterrows()
+# contre parsers.results_table_parser.parse_results_dataframe (traitement par colonnes).
+# Vérifie d'abord l'égalité des sorties (rangs en int Python compris).
+#   python benchmarks/bench_results_table.py [--rows 1000 10000 50000] [--repeat 3]
+from __future__ import annotations
+import argparse, random, statistics, sys, time
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from parsers.results_table_parser import parse_results_dataframe, slugify  # noqa: E402
+
+# ---------------------------
+# Ancienne version (copie figée de pages/10_Import_Results.py, st.error retiré)
+# ---------------------------
+def legacy_parse(df: pd.DataFrame) -> List[dict]:
+    df = df.copy()
+    df.columns = [str(c).strip().lower() for c in df.columns]
+    col_map = {
+        "category": ["category", "cat", "title", "division"],
+        "rank": ["rank", "place", "pos", "position", "order"],
+        "name": ["name", "athlete", "competitor"],
+        "nation": ["nation", "country", "ioc", "team"],
+        "club": ["club", "school"]
+    }
+    final_cols = {}
+    for target, candidates in col_map.items():
+        found = next((c for c in df.columns if c in candidates), None)
+        if found:
+            final_cols[target] = found
+    if "category" not in final_cols or "rank" not in final_cols or "name" not in final_cols:
+        return []
+    cats = {}
+    for _, row in df.iterrows():
+        cat_name = str(row[final_cols["category"]]).strip()
+        if not cat_name or cat_name.lower() == "nan":
+            continue
+        try:
+            rank_val = int(pd.to_numeric(row[final_cols["rank"]], errors='coerce') or 0)
+        except:  # noqa: E722
+            rank_val = 99
+        name_val = str(row[final_cols["name"]]).strip()
+        nati_val = str(row[final_cols.get("nation", "")]).strip() if "nation" in final_cols else ""
+        club_val = str(row[final_cols.get("club", "")]).strip() if "club" in final_cols else ""
+        if not name_val or name_val.lower() == "nan":
+            continue
+        cats.setdefault(cat_name, []).append({
+            "rank": rank_val,
+            "name": name_val,
+            "nation": nati_val if nati_val.lower() != "nan" else "",
+            "club": club_val if club_val.lower() != "nan" else ""
+        })
+    return [{"title": t, "id": slugify(t), "medalists": m} for t, m in cats.items()]
+
+# ---------------------------
+# Export Sportdata synthétique
+# ---------------------------
+def synth_sportdata(n_rows: int, seed: int = 1) -> pd.DataFrame:
+    rng = random.Random(seed)
+    ages = ["ADULTS", "U21", "U18", "U16", "MASTER"]
+    kinds = ["JIU-JITSU MALE", "JIU-JITSU FEMALE", "FIGHTING MALE", "NE-WAZA FEMALE", "DUO SHOW MIXED"]
+    weights = ["-45 KG", "-52 KG", "-62 KG", "-77 KG", "+94 KG", ""]
+    nations = ["FRANCE", "UZBEKISTAN", "VIETNAM", "BRAZIL", "GERMANY", None]
+    rows = []
+    while len(rows) < n_rows:
+        cat = f"{rng.choice(ages)} {rng.choice(kinds)} {rng.choice(weights)} #{rng.randint(1, n_rows // 8 + 1)}".strip()
+        for place in ("1", "2", "3", "3", "5", "DSQ", ""):
+            rows.append({
+                "Category": cat if rng.random() > 0.01 else None,
+                "Place": place,
+                "Points": rng.randint(0, 1000),
+                "Name": f"ATHLETE {rng.randint(1, 99999)}" if rng.random() > 0.02 else None,
+                "Club": f"CLUB {rng.randint(1, 500)}" if rng.random() > 0.3 else None,
+                "Nation": rng.choice(nations),
+            })
+    # comme read_csv : cellules vides -> NaN, "Place" en texte (DSQ)
+    return pd.DataFrame(rows[:n_rows]).replace({None: np.nan})
+
+def _median_ms(fn, df: pd.DataFrame, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(df)
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times) * 1000
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Benchmark de l'import de résultats tabulaires")
+    ap.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 50000])
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    print(f"{'lignes':>8} {'iterrows ms':>12} {'colonnes ms':>12} {'gain':>7}")
+    for n in args.rows:
+        df = synth_sportdata(n)
+        old, new = legacy_parse(df), parse_results_dataframe(df)
+        assert new == old, f"sorties différentes ({n} lignes)"
+        assert all(type(m["rank"]) is int for c in new for m in c["medalists"])
+        t_old = _median_ms(legacy_parse, df, args.repeat)
+        t_new = _median_ms(parse_results_dataframe, df, args.repeat)
+        print(f"{n:>8} {t_old:>12.1f} {t_new:>12.1f} {t_old / t_new:>6.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+# benchmarks/bench_results_txt.py
+# Débit (lignes/s) du parser d'export JJIF TXT : ancienne version (4 regex + repli)
+# contre l'expression unique MEDALIST_RE, sur un export synthétique de 100 000 lignes.
+# Vérifie d'abord que les deux versions donnent exactement le même résultat (catégories + stats).
+#   python benchmarks/bench_results_txt.py [--lines 100000] [--repeat 5] [--seed 1]
+from __future__ import annotations
+import argparse, random, re, statistics, sys, time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from parsers.results_txt_parser import parse_results_txt_with_stats  # noqa: E402
+
+# ---------------------------
+# Ancienne version (copie figée, référence pour l'égalité des sorties)
+# ---------------------------
+_CAT_RE = re.compile(r"^(ADULTS|U21|U18|U16|U14|MASTER)\b", re.IGNORECASE)
+_RANK_START_RE = re.compile(r"^[123]\s+[A-Za-zÀ-ÖØ-öø-ÿ]")
+_LINE_CORE_RE = re.compile(r"^(?P<rank>[123])\s+(?P<body>.+?)(?:\s+(?P<ioc>[A-Z]{3}))?\s*$")
+_MULTI_SPACE_RE = re.compile(r"\s{2,}")
+_SLASH_RE = re.compile(r"\s*/\s*")
+_IOC_AT_END_RE = re.compile(r"\b([A-Z]{3})\b$")
+
+def _legacy_clean_name(text: str) -> str:
+    text = _MULTI_SPACE_RE.sub(" ", text.strip())
+    text = _SLASH_RE.sub(" / ", text)
+    return " ".join(text.split())
+
+def _legacy_medalist(line: str):
+    m = _LINE_CORE_RE.match(line)
+    if m:
+        rank = int(m.group("rank"))
+        body = _legacy_clean_name(m.group("body") or "")
+        if not body or not re.match(r"^[A-Za-zÀ-ÖØ-öø-ÿ]", body):
+            return {}, False
+        ioc = (m.group("ioc") or "").strip()
+        return {"rank": rank, "name": body, "nation": ioc}, bool(ioc)
+    parts = re.split(r"\s{2,}|\t", line.strip())
+    first = parts[0]
+    if not first or first[0] not in "123":
+        return {}, False
+    ioc = ""
+    m_ioc = _IOC_AT_END_RE.search(line)
+    if m_ioc:
+        ioc = m_ioc.group(1)
+    body = line.strip()
+    if ioc:
+        body = re.sub(rf"\s+{ioc}\s*$", "", body)
+    body = _legacy_clean_name(re.sub(r"^[123]\s+", "", body).strip())
+    if not body or not re.match(r"^[A-Za-zÀ-ÖØ-öø-ÿ]", body):
+        return {}, False
+    return {"rank": int(first.strip()[0]), "name": body, "nation": ioc}, bool(ioc)
+
+def legacy_parse(content: str) -> Tuple[List[Dict], Dict[str, int]]:
+    categories: List[Dict] = []
+    current_cat = None
+    medalists: List[Dict] = []
+    stats = {"lines_rank_like": 0, "ignored_invalid_after_rank": 0, "imported_medalists": 0, "no_ioc": 0}
+    for raw in content.splitlines():
+        line = raw.strip()
+        if not line:
+            continue
+        if _CAT_RE.match(line):
+            if current_cat is not None:
+                current_cat["medalists"] = medalists
+                categories.append(current_cat)
+            current_cat = {"title": line.strip(), "medalists": []}
+            medalists = []
+            continue
+        if line and line[0] in "123":
+            stats["lines_rank_like"] += 1
+            if not _RANK_START_RE.match(line):
+                stats["ignored_invalid_after_rank"] += 1
+                continue
+            rec, had_ioc = _legacy_medalist(line)
+            if rec:
+                medalists.append(rec)
+                stats["imported_medalists"] += 1
+                if not had_ioc:
+                    stats["no_ioc"] += 1
+            else:
+                stats["ignored_invalid_after_rank"] += 1
+            continue
+    if current_cat is not None:
+        current_cat["medalists"] = medalists
+        categories.append(current_cat)
+    return categories, stats
+
+# ---------------------------
+# Export synthétique
+# ---------------------------
+_AGES = ["ADULTS", "U21", "U18", "U16", "U14", "MASTER", "Adults"]
+_DISCIPLINES = ["Men Fighting -62 kg", "Women Ne-Waza -57 kg", "Mixed Duo Show", "Men Duo  System",
+                "Women Jiu-Jitsu -52 kg"]
+_FIRST = ["Lucas", "Émilie", "João", "Anna-Maria", "Øyvind", "Zoë", "Karim", "Li", "Noah", "Inès"]
+_LAST = ["MARTIN", "da Silva", "Müller", "O'NEIL", "Kowalski", "NGUYEN", "van DAM", "Ibáñez"]
+_IOC = ["FRA", "BRA", "GER", "UAE", "THA", "POL", "NED", "ESP", "COL", "KAZ"]
+_NOISE = ["", "   ", "Results JJIF 2025", "Page 3 / 12", "1 (2025-10-12)", "2 / 2", "3  - ",
+          "4 Someone LAST FRA", "RANK NAME NATION", "\t"]
+
+def _medalist_line(rng: random.Random, rank: int) -> str:
+    name = f"{rng.choice(_FIRST)}  {rng.choice(_LAST)}"
+    if rng.random() < 0.3:  # duo : "A / B", espaces irréguliers autour du slash
+        name += rng.choice([" / ", "/", "  /", "/  "]) + f"{rng.choice(_FIRST)} {rng.choice(_LAST)}"
+    r = rng.random()
+    ioc = "" if r < 0.15 else (" " * rng.randint(1, 3)) + rng.choice(_IOC)
+    if 0.15 <= r < 0.18:
+        ioc += "   "  # espaces en fin de ligne
+    return f"{rank}{' ' * rng.randint(1, 2)}{name}{ioc}"
+
+def synth_export(n_lines: int, seed: int = 1) -> str:
+    rng = random.Random(seed)
+    lines: List[str] = []
+    while len(lines) < n_lines:
+        lines.append(f"{rng.choice(_AGES)} {rng.choice(_DISCIPLINES)}")
+        for rank in (1, 2, 3, 3):
+            lines.append(_medalist_line(rng, rank))
+            if rng.random() < 0.2:
+                lines.append(rng.choice(_NOISE))
+    return "\n".join(lines[:n_lines]) + "\n"
+
+# ---------------------------
+def _best_rate(fn, content: str, n_lines: int, repeat: int) -> Tuple[float, float]:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(content)
+        times.append(time.perf_counter() - t0)
+    return n_lines / min(times), statistics.median(times) * 1000
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Benchmark du parser d'export JJIF TXT")
+    ap.add_argument("--lines", type=int, default=100_000)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+
+    content = synth_export(args.lines, args.seed)
+    old_cats, old_stats = legacy_parse(content)
+    new_cats, new_stats = parse_results_txt_with_stats(content)
+    assert new_cats == old_cats, "catégories différentes de l'ancienne version"
+    assert {k: new_stats[k] for k in old_stats} == old_stats, (old_stats, new_stats)
+    print(f"{args.lines} lignes, {len(new_cats)} catégories, {new_stats['imported_medalists']} médaillés "
+          f"— sorties identiques")
+
+    rows = [("avant (4 regex + repli)", legacy_parse), ("après (MEDALIST_RE)", parse_results_txt_with_stats)]
+    print(f"{'version':<26} {'lignes/s':>12} {'médiane ms':>11}")
+    rates = []
+    for label, fn in rows:
+        rate, med = _best_rate(fn, content, args.lines, args.repeat)
+        rates.append(rate)
+        print(f"{label:<26} {rate:>12,.0f} {med:>11.1f}")
+    print(f"gain : x{rates[1] / rates[0]:.2f}")
+
+if __name__ == "__main__":
+    main()
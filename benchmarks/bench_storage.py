@@ -0,0 +1,113 @@
+# benchmarks/bench_storage.py
+# Latences p50/p95 et octets écrits de storage.load / save / load_all / _write_json
+# sur des événements synthétiques de 100, 1 000 et 10 000 catégories.
+#   python benchmarks/bench_storage.py [--scales 100 1000 10000] [--repeat 20]
+#                                      [--backend json|sqlite] [--out results.json]
+# Résultats JSON sur stdout (ou --out) pour comparer d'un commit à l'autre ; tableau lisible sur stderr.
+from __future__ import annotations
+import argparse, json, os, platform, statistics, subprocess, sys, tempfile, time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from synth import synth_event  # noqa: E402
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    ms = sorted(s * 1000 for s in samples)
+    p95 = statistics.quantiles(ms, n=20)[18] if len(ms) > 1 else ms[0]
+    return {"p50_ms": round(statistics.median(ms), 3), "p95_ms": round(p95, 3)}
+
+def _time(fn: Callable[[], Any], repeat: int, before: Callable[[], Any] = lambda: None) -> List[float]:
+    samples = []
+    for _ in range(repeat):
+        before()
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, timeout=5).stdout.strip()
+    except Exception:
+        return ""
+
+def bench_scale(storage, codec, n: int, n_vips: int, repeat: int) -> List[Dict[str, Any]]:
+    event = synth_event(n, n_vips)
+    storage.reset()
+    for key, doc in event.items():
+        storage.save(key, doc)
+    storage.flush()
+
+    cats = event["categories"]
+    key = "categories"
+    path = storage._FILES[key]
+    tmp_path = storage.DATA_DIR / "bench_write.json"
+
+    def written(p: Path, doc: Any) -> int:
+        # backend SQLite : pas de fichier par clé, on compte le document sérialisé
+        return p.stat().st_size if p.exists() else len(codec.dumps(doc))
+
+    rows = []
+    def add(op: str, samples: List[float], nbytes: int = 0, k: str = key) -> None:
+        rows.append({"categories": n, "op": op, "key": k, "n": len(samples), **_percentiles(samples),
+                     "bytes_written": nbytes})
+
+    add("_write_json", _time(lambda: storage._write_json(tmp_path, cats), repeat), tmp_path.stat().st_size)
+    tmp_path.unlink()
+
+    add("save", _time(lambda: storage.save(key, cats), repeat, storage.flush), written(path, cats))
+    add("save(wait=True)", _time(lambda: storage.save(key, cats, wait=True), repeat), written(path, cats))
+    storage.flush()
+
+    add("load (cold)", _time(lambda: storage.load(key), repeat, storage.invalidate))
+    add("load (warm)", _time(lambda: storage.load(key), repeat))
+    add("load_all (cold)", _time(storage.load_all, repeat, storage.invalidate), k="*")
+    add("load_all (warm)", _time(storage.load_all, repeat), k="*")
+    storage.reset()
+    return rows
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Benchmark storage.py à l'échelle d'un tournoi")
+    ap.add_argument("--scales", type=int, nargs="+", default=[100, 1000, 10000])
+    ap.add_argument("--vips", type=int, default=300)
+    ap.add_argument("--repeat", type=int, default=20)
+    ap.add_argument("--backend", choices=["json", "sqlite"], default="json")
+    ap.add_argument("--out", type=Path, help="fichier JSON de résultats (défaut : stdout)")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="podium-bench-") as data_dir:
+        # avant l'import : storage lit ces variables au chargement
+        os.environ["PODIUM_DATA_DIR"] = data_dir
+        os.environ["PODIUM_STORAGE_BACKEND"] = args.backend
+        import codec, storage
+
+        results = []
+        for n in args.scales:
+            results.extend(bench_scale(storage, codec, n, args.vips, args.repeat))
+
+    print(f"{'cat.':>6} {'opération':<18} {'p50 ms':>9} {'p95 ms':>9} {'octets':>11}", file=sys.stderr)
+    for r in results:
+        print(f"{r['categories']:>6} {r['op']:<18} {r['p50_ms']:>9.2f} {r['p95_ms']:>9.2f} {r['bytes_written']:>11}",
+              file=sys.stderr)
+
+    report = {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "codec": codec.NAME,
+        "backend": args.backend,
+        "vips": args.vips,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.out:
+        args.out.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+if __name__ == "__main__":
+    main()
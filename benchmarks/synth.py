@@ -0,0 +1,62 @@
+# benchmarks/synth.py
+# Événements synthétiques à l'échelle d'un tournoi, construits sur les gabarits de mock_data.py.
+from __future__ import annotations
+import random, sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from mock_data import MOCK_CATEGORIES, MOCK_VIPS  # noqa: E402
+
+NATIONS = ["FRA", "GER", "UAE", "ITA", "ESP", "NED", "KAZ", "THA", "BRA", "POL", "BUL", "BIH", "CZE", "NOR"]
+AGES = ["U16", "U18", "U21", "Adults", "Master 1"]
+
+def synth_categories(n: int, seed: int = 1) -> List[Dict[str, Any]]:
+    """`n` catégories avec 4 médaillés chacune (noms accentués, clubs, nations)."""
+    rnd = random.Random(seed)
+    cats = []
+    for i in range(n):
+        tpl = MOCK_CATEGORIES[i % len(MOCK_CATEGORIES)]
+        age = AGES[(i // len(MOCK_CATEGORIES)) % len(AGES)]
+        cats.append({
+            "id": f"{tpl['id']}-{i:05d}",
+            "title": f"{age} {tpl['title']}",
+            "discipline": tpl["discipline"],
+            "round": tpl["round"],
+            "medalists": [
+                {"rank": m["rank"], "name": f"{m['name']} {i}", "nation": rnd.choice(NATIONS),
+                 "club": m["club"] or f"Club {rnd.randint(1, 400)}"}
+                for m in tpl["medalists"]
+            ],
+        })
+    return cats
+
+def synth_vips(n: int) -> List[Dict[str, Any]]:
+    return [
+        {**MOCK_VIPS[i % len(MOCK_VIPS)], "id": f"vip{i}",
+         "name": f"{MOCK_VIPS[i % len(MOCK_VIPS)]['name']} {i}"}
+        for i in range(n)
+    ]
+
+def synth_event(n_categories: int, n_vips: int = 300, seed: int = 1) -> Dict[str, Any]:
+    """Documents storage d'un événement : categories, vip, planning, assignment, finals_days, final_block."""
+    rnd = random.Random(seed)
+    cats = synth_categories(n_categories, seed)
+    vips = synth_vips(n_vips)
+    ids = [c["id"] for c in cats]
+    days = 3
+    return {
+        "categories": cats,
+        "vip": vips,
+        "planning": [{"order": i + 1, "category_id": cid} for i, cid in enumerate(ids)],
+        "assignment": [
+            {"category_id": cid, "vip_ids": [v["id"] for v in rnd.sample(vips, min(3, len(vips)))]}
+            for cid in ids
+        ],
+        "finals_days": {str(d + 1): ids[d::days] for d in range(days)},
+        "finals_days_meta": {"num_days": days},
+        "final_block": {
+            "mats": 4,
+            "finals": [{"category_id": cid, "order": i // 4 + 1, "mat": i % 4 + 1} for i, cid in enumerate(ids)],
+        },
+    }
@@ -0,0 +1,57 @@
+from __future__ import annotations
+# codec.py
+# Encodage JSON des fichiers data/ : orjson s'il est installé, sinon json (stdlib).
+# Format compact par défaut (pas d'indentation : fichiers ~2x plus petits, écriture plus
+# rapide) ; pretty=True pour les exports destinés à être lus par un humain.
+import json, math
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # dépendance optionnelle
+    orjson = None
+
+NAME = "orjson" if orjson is not None else "json"
+
+_COMPACT = (",", ":")
+
+def dumps(value: Any, pretty: bool = False) -> bytes:
+    """Document -> octets UTF-8 (caractères non ASCII conservés tels quels)."""
+    if orjson is not None:
+        opts = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            return orjson.dumps(value, option=opts)
+        except TypeError:
+            pass  # ex. entier > 64 bits : le module json sait faire
+    return _std_dumps(value, pretty).encode("utf-8")
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # ex. NaN/Infinity écrits par json.dumps : on laisse json trancher
+    if not isinstance(data, str):
+        data = bytes(data).decode("utf-8")
+    return json.loads(data)
+
+def _std_dumps(value: Any, pretty: bool = False) -> str:
+    # NaN / Infinity -> null comme orjson : même fichier quel que soit l'encodeur
+    try:
+        return _std_dumps_strict(value, pretty)
+    except ValueError:
+        return _std_dumps_strict(_finite(value), pretty)
+
+def _std_dumps_strict(value: Any, pretty: bool) -> str:
+    if pretty:
+        return json.dumps(value, ensure_ascii=False, indent=2, allow_nan=False)
+    return json.dumps(value, ensure_ascii=False, separators=_COMPACT, allow_nan=False)
+
+def _finite(value: Any) -> Any:
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _finite(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(v) for v in value]
+    return value
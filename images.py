@@ -0,0 +1,341 @@
+from __future__ import annotations
+# images.py
+# Vignettes des photos (VIP, hôtesse) : l'original de plusieurs Mo n'est plus envoyé au
+# navigateur à chaque rerun. Vignette carrée 2x (écrans retina) en WebP (ou JPEG / PNG),
+# gardée sur disque (data/thumbs/, clé = chemin + mtime + taille) ; src (URL static/ ou
+# data URI, voir static_assets) dans un LRU.
+import hashlib, io, os, threading, time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import static_assets
+import storage
+
+THUMBS_DIR = storage.DATA_DIR / "thumbs"
+APP_ROOT = Path(__file__).resolve().parent
+PHOTOS_DIR = APP_ROOT / "assets" / "photos"
+PHOTO_EXTS = (".png", ".jpg", ".jpeg")  # ordre de priorité si plusieurs fichiers pour un même id
+RETINA = 2
+QUALITY = 80
+
+try:
+    from PIL import Image, ImageOps, features
+    HAS_PIL = True
+    HAS_WEBP = bool(features.check("webp"))
+except Exception:  # Pillow absent : on renvoie l'original (comportement d'avant)
+    HAS_PIL = HAS_WEBP = False
+
+_MIME = {".png": "image/png", ".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".webp": "image/webp",
+         ".gif": "image/gif", ".svg": "image/svg+xml"}
+
+def mime_type(path: Path) -> str:
+    return _MIME.get(Path(path).suffix.lower(), "image/jpeg")
+
+def _stat_key(path: Path) -> Optional[Tuple[str, int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return str(Path(path).resolve()), st.st_mtime_ns, st.st_size
+
+def _encode(img, has_alpha: bool) -> Tuple[bytes, str]:
+    buf = io.BytesIO()
+    if HAS_WEBP:
+        img.save(buf, "WEBP", quality=QUALITY, method=4)
+        return buf.getvalue(), "image/webp"
+    if has_alpha:  # JPEG n'a pas de transparence
+        img.save(buf, "PNG", optimize=True)
+        return buf.getvalue(), "image/png"
+    img.convert("RGB").save(buf, "JPEG", quality=QUALITY, optimize=True, progressive=True)
+    return buf.getvalue(), "image/jpeg"
+
+def _make_thumbnail(path: Path, px: int) -> Tuple[bytes, str]:
+    """Carré px*RETINA recadré au centre (comme object-fit: cover), orientation EXIF appliquée."""
+    side = px * RETINA
+    with Image.open(path) as im:
+        im = ImageOps.exif_transpose(im)
+        has_alpha = im.mode in ("RGBA", "LA", "PA") or (im.mode == "P" and "transparency" in im.info)
+        im = im.convert("RGBA" if has_alpha else "RGB")
+        side = min(side, *im.size)  # petite photo : pas d'agrandissement
+        return _encode(ImageOps.fit(im, (side, side), Image.LANCZOS), has_alpha)
+
+def thumbnail(path: Path, px: int) -> Optional[Tuple[bytes, str]]:
+    """(octets, mime) de la vignette px x px (rendu 2x), depuis le cache disque si à jour.
+    Sans Pillow ou si l'image est illisible : l'original."""
+    key = _stat_key(path)
+    if key is None:
+        return None
+    if not HAS_PIL:
+        try:
+            return Path(path).read_bytes(), mime_type(path)
+        except OSError:
+            return None
+    name = hashlib.sha1(f"{key[0]}|{key[1]}|{key[2]}|{px}|{RETINA}|{QUALITY}".encode("utf-8")).hexdigest()
+    for ext, mime in ((".webp", "image/webp"), (".jpg", "image/jpeg"), (".png", "image/png")):
+        cached = THUMBS_DIR / f"{name}{ext}"
+        if cached.exists():
+            try:
+                return cached.read_bytes(), mime
+            except OSError:
+                break
+    try:
+        data, mime = _make_thumbnail(Path(path), px)
+    except Exception:
+        try:
+            return Path(path).read_bytes(), mime_type(path)
+        except OSError:
+            return None
+    ext = {"image/webp": ".webp", "image/png": ".png"}.get(mime, ".jpg")
+    try:
+        THUMBS_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = THUMBS_DIR / f"{name}{ext}.tmp.{os.getpid()}_{threading.get_ident()}"
+        tmp.write_bytes(data)
+        os.replace(tmp, THUMBS_DIR / f"{name}{ext}")
+    except OSError:
+        pass  # cache disque facultatif (dossier en lecture seule...)
+    return data, mime
+
+@lru_cache(maxsize=512)
+def _thumbnail_src(path: str, mtime_ns: int, size: int, px: int, static: bool) -> Optional[str]:
+    thumb = thumbnail(Path(path), px)
+    if thumb is None:
+        return None
+    data, mime = thumb
+    if static:
+        return static_assets.bytes_src(data, mime)
+    return static_assets.data_uri(data, mime)
+
+def thumbnail_src(path: Path, px: int) -> Optional[str]:
+    """src="" de la vignette : URL statique hashée (cache navigateur) si le service statique
+    est actif, sinon data URI. LRU : une photo modifiée change de clé via mtime/taille."""
+    key = _stat_key(path)
+    if key is None:
+        return None
+    return _thumbnail_src(key[0], key[1], key[2], px, static_assets.static_enabled())
+
+# ---------------------------
+# Index des photos VIP : assets/photos/<id>.<ext>
+# ---------------------------
+# Un seul scandir par changement du dossier (mtime) au lieu de 3-4 stat() par VIP et par rendu.
+_PHOTO_INDEX: Optional[Tuple[int, Dict[str, Path], frozenset]] = None  # (mtime_ns, id -> chemin, noms)
+_PHOTO_LOCK = threading.Lock()
+
+def photo_index() -> Dict[str, Path]:
+    """id -> chemin de la photo dans assets/photos/ (lecture seule, partagé entre pages)."""
+    return _photo_index()[1]
+
+def _photo_index() -> Tuple[int, Dict[str, Path], frozenset]:
+    global _PHOTO_INDEX
+    try:
+        mtime = os.stat(PHOTOS_DIR).st_mtime_ns
+    except OSError:
+        return 0, {}, frozenset()
+    with _PHOTO_LOCK:
+        hit = _PHOTO_INDEX
+    if hit is not None and hit[0] == mtime:
+        return hit
+    by_id: Dict[str, Path] = {}
+    rank: Dict[str, int] = {}
+    names = set()
+    try:
+        with os.scandir(PHOTOS_DIR) as it:
+            for e in it:
+                names.add(e.name)
+                stem, ext = os.path.splitext(e.name)
+                ext = ext.lower()
+                if ext in PHOTO_EXTS and PHOTO_EXTS.index(ext) < rank.get(stem, len(PHOTO_EXTS)) and e.is_file():
+                    by_id[stem] = Path(e.path)
+                    rank[stem] = PHOTO_EXTS.index(ext)
+    except OSError:
+        return mtime, {}, frozenset()
+    index = (mtime, by_id, frozenset(names))
+    # dossier modifié à l'instant : la résolution du mtime peut masquer une écriture en cours
+    if time.time_ns() - mtime > 2_000_000_000:
+        with _PHOTO_LOCK:
+            _PHOTO_INDEX = index
+    return index
+
+def resolve_photo_path(vip: Any) -> Optional[Path]:
+    """Photo d'un VIP : champ "photo" (chemin relatif à l'app ou absolu) s'il existe,
+    sinon assets/photos/<id>.png|.jpg|.jpeg. Les fichiers de assets/photos/ passent par l'index."""
+    _, by_id, names = _photo_index()
+    p = str(vip.get("photo") or "").strip()
+    if p:
+        cand = Path(p)
+        if not cand.is_absolute():
+            cand = APP_ROOT / p
+        if cand.parent == PHOTOS_DIR:
+            if cand.name in names:
+                return cand
+        elif cand.exists():
+            return cand
+    vid = str(vip.get("id") or "").strip()
+    return by_id.get(vid) if vid else None
+
+# ---------------------------
+# Import des images envoyées (photos VIP, logos)
+# ---------------------------
+# À l'envoi : orientation EXIF appliquée, redimensionnement au plus grand côté configuré,
+# métadonnées retirées (EXIF, GPS...), réencodage (JPEG, ou PNG si transparence) ;
+# dimensions et hash notés dans le manifeste storage "assets".
+_EXT_OF = {"JPEG": ".jpg", "PNG": ".png", "WEBP": ".webp"}
+_FORMAT_OF = {".jpg": "JPEG", ".jpeg": "JPEG", ".png": "PNG", ".webp": "WEBP"}
+
+def _image_options(max_px: Optional[int], quality: Optional[int]) -> Tuple[int, int]:
+    if max_px is None or quality is None:
+        from settings_io import load_settings
+        cfg = load_settings()
+        max_px = cfg.image_max_px if max_px is None else max_px
+        quality = cfg.image_quality if quality is None else quality
+    return int(max_px), int(quality)
+
+def _relpath(path: Path) -> str:
+    try:
+        return Path(path).resolve().relative_to(APP_ROOT).as_posix()
+    except ValueError:
+        return str(path)
+
+def _normalize(data: bytes, max_px: int, quality: int, fmt: Optional[str]) -> Tuple[bytes, str, int, int]:
+    """(octets, format Pillow, largeur, hauteur) ; fmt None : JPEG, ou PNG si transparence."""
+    with Image.open(io.BytesIO(data)) as src:
+        src_format = src.format
+        had_meta = bool(src.info.get("exif") or src.getexif())
+        im = ImageOps.exif_transpose(src)
+        has_alpha = im.mode in ("RGBA", "LA", "PA") or (im.mode == "P" and "transparency" in im.info)
+        fmt = fmt or ("PNG" if has_alpha else "JPEG")
+        if fmt == "JPEG":
+            im = im.convert("RGB")
+        elif im.mode not in ("RGB", "RGBA", "L", "LA"):
+            im = im.convert("RGBA" if has_alpha else "RGB")
+        resized = max(im.size) > max_px
+        if resized:
+            im.thumbnail((max_px, max_px), Image.LANCZOS)
+        icc = src.info.get("icc_profile")  # seul bloc gardé : profil couleur
+        extra = {"icc_profile": icc} if icc else {}
+        buf = io.BytesIO()
+        if fmt == "JPEG":
+            im.save(buf, "JPEG", quality=quality, optimize=True, progressive=True, **extra)
+        elif fmt == "WEBP":
+            im.save(buf, "WEBP", quality=quality, method=4, **extra)
+        else:
+            im.save(buf, "PNG", optimize=True, **extra)
+        out = buf.getvalue()
+        # déjà optimisé (petit, sans métadonnées, même format) : on garde l'original s'il est plus léger
+        if not resized and not had_meta and src_format == fmt and len(out) >= len(data):
+            out = data
+        return out, fmt, im.size[0], im.size[1]
+
+def ingest_image(data: bytes, dest: Path, max_px: Optional[int] = None, quality: Optional[int] = None,
+                 keep_format: bool = False, replace_siblings: bool = False,
+                 fallback_ext: str = "") -> Dict[str, Any]:
+    """
+    Normalise une image envoyée et l'écrit. max_px / quality : Settings par défaut.
+    dest : chemin SANS extension (nom libre, points compris : "j.smith"), l'extension du format
+    choisi y est ajoutée ; image illisible : fallback_ext (celle du fichier envoyé).
+    keep_format=True : dest est le chemin complet, réécrit dans le format de son extension.
+    replace_siblings : supprime <dest>.png/.jpg/.jpeg/.webp d'un autre format (photo VIP remplacée).
+    Renvoie l'entrée du manifeste : {"path", "sha256", "width", "height", "bytes",
+    "original_bytes", "format", "max_px", "quality"} ; Pillow absent ou image illisible : écrit tel quel.
+    """
+    max_px, quality = _image_options(max_px, quality)
+    dest = Path(dest)
+    fmt = _FORMAT_OF.get(dest.suffix.lower()) if keep_format else None
+    width = height = 0
+    decoded = False
+    if HAS_PIL:
+        try:
+            out, fmt, width, height = _normalize(data, max_px, quality, fmt)
+            decoded = True
+        except Exception:
+            out = data
+    else:
+        out = data
+    stem = dest
+    if not keep_format:
+        # concaténation, pas with_suffix() : "j.smith" deviendrait "j.jpg" (photo d'un autre VIP)
+        ext = _EXT_OF.get(fmt, fallback_ext.lower()) if decoded else fallback_ext.lower()
+        if not decoded:
+            fmt = _FORMAT_OF.get(ext)
+        dest = stem.with_name(stem.name + ext)
+
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(f".{dest.name}.tmp.{os.getpid()}_{threading.get_ident()}")
+    tmp.write_bytes(out)
+    os.replace(tmp, dest)
+    if replace_siblings and not keep_format:
+        for ext in PHOTO_EXTS + (".webp",):
+            other = stem.with_name(stem.name + ext)
+            if other != dest and other.exists():
+                try:
+                    other.unlink()
+                except OSError:
+                    pass
+
+    rec = {"path": _relpath(dest), "sha256": hashlib.sha256(out).hexdigest(), "width": width,
+           "height": height, "bytes": len(out), "original_bytes": len(data), "format": fmt or "",
+           "max_px": max_px, "quality": quality}
+    _record_assets({rec["path"]: rec})
+    return rec
+
+def _record_assets(entries: Dict[str, Dict[str, Any]]) -> None:
+    manifest, version = storage.load_versioned("assets")
+    manifest = manifest if isinstance(manifest, dict) else {}
+    manifest.update(entries)
+    storage.save("assets", manifest, expected_version=version)
+
+def asset_manifest() -> Dict[str, Dict[str, Any]]:
+    return storage.load("assets") or {}
+
+def existing_assets() -> list:
+    """Images optimisables : assets/photos/* et logos de Settings (pas les icônes de l'app).
+    Seulement .png/.jpg/.jpeg/.webp : un .gif ou .bmp réencodé ne correspondrait plus à son nom."""
+    try:
+        paths = sorted(e.path for e in os.scandir(PHOTOS_DIR)
+                       if e.is_file() and os.path.splitext(e.name)[1].lower() in _FORMAT_OF)
+        paths = [Path(p) for p in paths]
+    except OSError:
+        paths = []
+    try:
+        from settings_io import load_settings
+        cfg = load_settings()
+        for logo in (cfg.event_logo, cfg.federation_logo):
+            if logo:
+                p = Path(logo) if Path(logo).is_absolute() else APP_ROOT / logo
+                if p.suffix.lower() in _FORMAT_OF and p.is_file() and p not in paths:
+                    paths.append(p)
+    except Exception:
+        pass
+    return paths
+
+def reoptimize_assets(paths=None, max_px: Optional[int] = None, quality: Optional[int] = None,
+                      progress=None) -> Dict[str, int]:
+    """
+    Réimporte sur place les images existantes (même nom, même format : les chemins enregistrés
+    restent valides). Fichier inchangé depuis un import avec les mêmes réglages : ignoré.
+    progress(fait, total, chemin) optionnel. Renvoie {"files", "skipped", "errors", "bytes_before", "bytes_after"}.
+    """
+    max_px, quality = _image_options(max_px, quality)
+    paths = list(paths) if paths is not None else existing_assets()
+    manifest = asset_manifest()
+    report = {"files": 0, "skipped": 0, "errors": 0, "bytes_before": 0, "bytes_after": 0}
+    for i, path in enumerate(paths, start=1):
+        path = Path(path)
+        try:
+            data = path.read_bytes()
+            prev = manifest.get(_relpath(path)) or {}
+            if path.suffix.lower() not in _FORMAT_OF:  # .gif, .bmp… : non réécrivable sous le même nom
+                report["skipped"] += 1
+            elif (prev.get("sha256") == hashlib.sha256(data).hexdigest()
+                    and prev.get("max_px") == max_px and prev.get("quality") == quality):
+                report["skipped"] += 1
+            else:
+                rec = ingest_image(data, path, max_px, quality, keep_format=True)
+                report["files"] += 1
+                report["bytes_before"] += len(data)
+                report["bytes_after"] += rec["bytes"]
+        except Exception:
+            report["errors"] += 1
+        if progress:
+            progress(i, len(paths), path)
+    return report
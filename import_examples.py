@@ -0,0 +1,38 @@
+from __future__ import annotations
+# import_examples.py
+# Fichiers d'exemple proposés au téléchargement par les pages d'import.
+# Les .xlsx sont générés une seule fois par processus (et non à chaque rerun de la page).
+import io
+from functools import lru_cache
+
+RESULTS_ROWS = [
+    {"Category": "U16 Male -46kg", "Rank": 1, "Name": "John Doe", "Nation": "FRA", "Club": "Judo Paris"},
+    {"Category": "U16 Male -46kg", "Rank": 2, "Name": "Jane Smith", "Nation": "USA", "Club": "Team USA"},
+    {"Category": "U18 Female -52kg", "Rank": 1, "Name": "Emma Stone", "Nation": "CAN", "Club": "Toronto Club"},
+]
+
+CATEGORY_ROWS = [
+    {"id": "U16-M-46",   "title": "U16 Male -46kg Jiu-Jitsu"},
+    {"id": "U18-F-52",   "title": "U18 Female -52kg Fighting"},
+    {"id": "ADULT-M-77", "title": "Adult Male -77kg Ne-Waza"},
+    {"id": "DUO-MIX",    "title": "Duo Mixed"},
+    {"id": "SHOW-OPEN",  "title": "Show Open"},
+]
+
+@lru_cache(maxsize=None)
+def results_xlsx() -> bytes:
+    """Exemple Excel de l'import des résultats (xlsxwriter)."""
+    import pandas as pd
+    buf = io.BytesIO()
+    with pd.ExcelWriter(buf, engine="xlsxwriter") as writer:
+        pd.DataFrame(RESULTS_ROWS).to_excel(writer, index=False, sheet_name="Results")
+    return buf.getvalue()
+
+@lru_cache(maxsize=None)
+def categories_xlsx() -> bytes:
+    """Exemple Excel de l'import des catégories (moteur Excel par défaut de pandas)."""
+    import pandas as pd
+    buf = io.BytesIO()
+    with pd.ExcelWriter(buf) as writer:
+        pd.DataFrame(CATEGORY_ROWS).to_excel(writer, index=False)
+    return buf.getvalue()
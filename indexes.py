@@ -0,0 +1,147 @@
+from __future__ import annotations
+# indexes.py
+# Index dérivés des documents storage, partagés par toutes les sessions et reconstruits
+# seulement quand la clé source change (storage.stamp). Lecture seule : ne pas modifier
+# les dicts renvoyés (copier avant de les éditer).
+import abc, re, threading, unicodedata
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import storage
+
+def slugify(text: Any) -> str:
+    """'U21 Women -57 kg' -> 'u21-women-57-kg' (accents retirés)."""
+    s = unicodedata.normalize("NFKD", str(text or "")).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]+", "-", s.lower()).strip("-")
+
+def normalize_title(text: Any) -> str:
+    """Titre comparable : casse, accents et espaces multiples ignorés."""
+    s = unicodedata.normalize("NFKD", str(text or ""))
+    s = "".join(ch for ch in s if not unicodedata.combining(ch))
+    return " ".join(s.casefold().split())
+
+class SharedIndex(abc.ABC):
+    """Instance courante par classe, reconstruite quand storage.stamp(SOURCE_KEYS) change."""
+    __slots__ = ()
+    SOURCE_KEYS: Tuple[str, ...] = ()
+    _current: Optional[Tuple[Any, Any]] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    @abc.abstractmethod
+    def build(cls) -> Any:
+        """Nouvelle instance à partir des documents SOURCE_KEYS courants (appelée par current())."""
+
+    @classmethod
+    def current(cls):
+        stamp = storage.stamp(cls.SOURCE_KEYS)
+        with cls._lock:
+            hit = cls.__dict__.get("_current")
+            if hit is not None and hit[0] == stamp:
+                return hit[1]
+        index = cls.build()  # hors verrou : au pire deux sessions reconstruisent en parallèle
+        with cls._lock:
+            cls._current = (stamp, index)
+        return index
+
+# ---------------------------
+# Catégories
+# ---------------------------
+class CategoryIndex(SharedIndex):
+    """Catégories normalisées (clés 'id' et 'title' toujours présentes), dans l'ordre du fichier.
+    Recherche O(1) par id, slug ou titre normalisé."""
+    SOURCE_KEYS = ("categories",)
+    __slots__ = ("items", "by_id", "_by_slug", "_by_title")
+
+    def __init__(self, cats: Any):
+        self.items: List[Dict[str, Any]] = []
+        self.by_id: Dict[str, Dict[str, Any]] = {}
+        self._by_slug: Dict[str, Dict[str, Any]] = {}
+        self._by_title: Dict[str, Dict[str, Any]] = {}
+        for c in cats or []:
+            if not isinstance(c, dict):
+                continue
+            cid = c.get("id") or c.get("cid")
+            if not cid or cid in self.by_id:
+                continue
+            cc = dict(c)
+            cc["id"] = cid
+            cc["title"] = c.get("title") or c.get("name") or c.get("Category") or c.get("category") or str(cid)
+            self.items.append(cc)
+            self.by_id[cid] = cc
+            self._by_slug.setdefault(slugify(cid), cc)
+            self._by_slug.setdefault(slugify(cc["title"]), cc)
+            self._by_title.setdefault(normalize_title(cc["title"]), cc)
+
+    @classmethod
+    def build(cls) -> "CategoryIndex":
+        return cls(storage.load("categories"))
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.items)
+
+    def __contains__(self, cid: Any) -> bool:
+        return cid in self.by_id
+
+    def get(self, cid: Any, default: Any = None) -> Any:
+        return self.by_id.get(cid, default)
+
+    def by_slug(self, slug: Any) -> Optional[Dict[str, Any]]:
+        return self._by_slug.get(slugify(slug))
+
+    def by_title(self, title: Any) -> Optional[Dict[str, Any]]:
+        return self._by_title.get(normalize_title(title))
+
+    def find(self, text: Any) -> Optional[Dict[str, Any]]:
+        """Id exact, puis titre normalisé, puis slug (ex. libellé importé d'un fichier de résultats)."""
+        return self.by_id.get(text) or self.by_title(text) or self.by_slug(text)
+
+    def title(self, cid: Any) -> str:
+        c = self.by_id.get(cid)
+        return c["title"] if c else str(cid)
+
+# ---------------------------
+# Assignations VIP
+# ---------------------------
+class AssignmentIndex:
+    """Assignations par catégorie, et index inverse par VIP : vip_id -> [(category_id, rôle)].
+    Construit une fois par version du fichier assignment (partie de models.load_event)."""
+    __slots__ = ("by_category", "by_vip")
+
+    def __init__(self, doc: Any):
+        from models import Assignment
+        self.by_category: Dict[str, Any] = {}
+        self.by_vip: Dict[str, List[Tuple[str, str]]] = {}
+        for d in doc or []:
+            if not isinstance(d, dict):
+                continue
+            a = Assignment.from_dict(d)
+            self.by_category[a.category_id] = a
+        for a in self.by_category.values():
+            for vid in a.vip_ids:
+                self.by_vip.setdefault(vid, []).append((a.category_id, a.vip_roles.get(vid) or "General"))
+
+    @classmethod
+    def current(cls) -> "AssignmentIndex":
+        from models import load_event
+        return load_event().assignments
+
+    def __len__(self) -> int:
+        return len(self.by_category)
+
+    def get(self, category_id: Any, default: Any = None) -> Any:
+        return self.by_category.get(category_id, default)
+
+    def vip_ids(self, category_id: Any) -> List[str]:
+        a = self.by_category.get(category_id)
+        return a.vip_ids if a else []
+
+    def roles(self, category_id: Any) -> Dict[str, str]:
+        a = self.by_category.get(category_id)
+        return a.vip_roles if a else {}
+
+    def for_vip(self, vip_id: Any) -> List[Tuple[str, str]]:
+        """[(category_id, rôle)] des catégories où ce VIP remet les médailles."""
+        return self.by_vip.get(vip_id, [])
@@ -1,13 +1,139 @@
+from __future__ import annotations
+# models.py
+# Modèle typé en mémoire : les documents storage (dicts bruts) sont normalisés UNE fois
+# au chargement (id/titre, rangs entiers, médaillés triés) puis partagés entre les pages.
+import sys, threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
 
-from dataclasses import dataclass
-from typing import List
-@dataclass
-class VIP: id:str; name:str; role:str=""; note:str=""
-@dataclass
-class Medalist: rank:int; name:str; nation:str=""; club:str=""
-@dataclass
-class Category: id:str; title:str; discipline:str=""; round:str=""; medalists:List[Medalist]|None=None
-@dataclass
-class PlanningItem: order:int; category_id:str
-@dataclass
-class Assignment: category_id:str; vip_ids:List[str]
+# slots=True (moins de mémoire par objet, accès plus rapide) : Python 3.10+
+SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+def _str(v: Any) -> str:
+    return "" if v is None else str(v).strip()
+
+def _int(v: Any, default: int) -> int:
+    try:
+        return int(v)
+    except (TypeError, ValueError):
+        try:
+            return int(float(v))
+        except (TypeError, ValueError):
+            return default
+
+@dataclass(**SLOTS)
+class VIP:
+    id: str; name: str; role: str = ""; note: str = ""; ioc: str = ""; photo: str = ""
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "VIP":
+        return cls(id=_str(d.get("id")), name=_str(d.get("name")), role=_str(d.get("role") or d.get("function")),
+                   note=_str(d.get("note")), ioc=_str(d.get("ioc")).upper(),
+                   photo=_str(d.get("photo") or d.get("photo_path")))
+
+@dataclass(**SLOTS)
+class Medalist:
+    rank: int; name: str; nation: str = ""; club: str = ""
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "Medalist":
+        return cls(rank=_int(d.get("rank"), 99), name=_str(d.get("name")),
+                   nation=_str(d.get("nation") or d.get("ioc")).upper(), club=_str(d.get("club")))
+
+    @property
+    def medal(self) -> str:
+        return {1: "🥇", 2: "🥈"}.get(self.rank, "🥉")
+
+@dataclass(**SLOTS)
+class Category:
+    id: str; title: str; discipline: str = ""; round: str = ""; medalists: Optional[List[Medalist]] = None
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "Category":
+        cid = _str(d.get("id") or d.get("title"))
+        title = _str(d.get("title") or d.get("name") or d.get("Category") or d.get("category")) or cid
+        meds = [Medalist.from_dict(m) for m in (d.get("medalists") or []) if isinstance(m, dict)]
+        meds.sort(key=lambda m: m.rank)
+        return cls(id=cid, title=title, discipline=_str(d.get("discipline")), round=_str(d.get("round")),
+                   medalists=meds)
+
+@dataclass(**SLOTS)
+class PlanningItem:
+    order: int; category_id: str; done: bool = False
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "PlanningItem":
+        return cls(order=_int(d.get("order"), 0), category_id=_str(d.get("category_id")), done=bool(d.get("done")))
+
+@dataclass(**SLOTS)
+class Assignment:
+    category_id: str; vip_ids: List[str]; vip_roles: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "Assignment":
+        return cls(category_id=_str(d.get("category_id")),
+                   vip_ids=[_str(v) for v in (d.get("vip_ids") or [])],
+                   vip_roles=dict(d.get("vip_roles") or {}))
+
+# ---------------------------
+# Événement complet, indexé par id
+# ---------------------------
+EVENT_KEYS = ("categories", "vip", "planning", "assignment")
+
+@dataclass(**SLOTS)
+class EventModel:
+    """Vue en lecture seule (partagée entre sessions : ne pas modifier)."""
+    categories: Dict[str, Category]
+    vips: Dict[str, VIP]
+    planning: List[PlanningItem]          # trié par `order`
+    assignments: Any                      # indexes.AssignmentIndex (par catégorie et par VIP)
+
+def _categories(doc: Any) -> Dict[str, Category]:
+    cats: Dict[str, Category] = {}
+    for d in doc or []:
+        if isinstance(d, dict):
+            c = Category.from_dict(d)
+            cats.setdefault(c.id, c)
+    return cats
+
+def _vips(doc: Any) -> Dict[str, VIP]:
+    return {v.id: v for v in (VIP.from_dict(d) for d in (doc or []) if isinstance(d, dict))}
+
+def _planning(doc: Any) -> List[PlanningItem]:
+    raw = doc or []
+    if isinstance(raw, dict):  # ancien format {id: item}
+        raw = list(raw.values())
+    return sorted((PlanningItem.from_dict(d) for d in raw if isinstance(d, dict)), key=lambda p: p.order)
+
+def _assignments(doc: Any):
+    from indexes import AssignmentIndex  # import tardif : indexes importe models
+    return AssignmentIndex(doc)
+
+_PARTS = {"categories": _categories, "vip": _vips, "planning": _planning, "assignment": _assignments}
+_FIELDS = {"categories": "categories", "vip": "vips", "planning": "planning", "assignment": "assignments"}
+
+_EVENT: Optional[Tuple[Any, EventModel]] = None
+_PART_CACHE: Dict[str, Tuple[Any, Any]] = {}  # key -> (stamp, partie normalisée)
+_EVENT_LOCK = threading.Lock()
+
+def load_event() -> EventModel:
+    """EventModel courant. Seules les parties dont la clé a changé sont renormalisées
+    (une modification d'assignment ne retraite pas 2 000 catégories)."""
+    global _EVENT
+    import storage
+    stamps = storage.stamp(EVENT_KEYS)
+    with _EVENT_LOCK:
+        if _EVENT is not None and _EVENT[0] == stamps:
+            return _EVENT[1]
+        parts = dict(_PART_CACHE)
+    fields = {}
+    for key, stamp in zip(EVENT_KEYS, stamps):
+        hit = parts.get(key)
+        if hit is None or hit[0] != stamp:
+            hit = parts[key] = (stamp, _PARTS[key](storage.load(key)))
+        fields[_FIELDS[key]] = hit[1]
+    model = EventModel(**fields)
+    with _EVENT_LOCK:
+        _PART_CACHE.update(parts)
+        _EVENT = (stamps, model)
+    return model
@@ -19,15 +19,14 @@ st.markdown("Configure general application settings.")
 cfg = load_settings()
 
 import os
-from PIL import Image
+from images import APP_ROOT, ingest_image, reoptimize_assets
 
 def save_uploaded_file(uploaded_file, filename):
+    # orienté, redimensionné, sans EXIF ; l'extension suit le format réencodé
     try:
-        if not os.path.exists("assets"):
-            os.makedirs("assets")
-        with open(os.path.join("assets", filename), "wb") as f:
-            f.write(uploaded_file.getbuffer())
-        return os.path.join("assets", filename)
+        stem, ext = os.path.splitext(filename)
+        rec = ingest_image(uploaded_file.getvalue(), APP_ROOT / "assets" / stem, fallback_ext=ext)
+        return rec["path"]
     except Exception as e:
         st.error(f"Error saving file: {e}")
         return None
@@ -83,6 +82,26 @@ with col1:
 with col2:
     show_vip_photos = st.checkbox("Show VIP photos (VIP + Hostesses)", value=getattr(cfg, "show_vip_photos", True))
 
+# ────────────── IMAGES ──────────────
+st.header("🗜️ Images")
+st.caption("Uploaded photos and logos are auto-oriented, resized, stripped of metadata and re-encoded.")
+col_i1, col_i2 = st.columns(2)
+with col_i1:
+    image_max_px = st.number_input("Max size (longest side, px)", min_value=256, max_value=8000, step=100,
+                                   value=int(getattr(cfg, "image_max_px", 1600)))
+with col_i2:
+    image_quality = st.number_input("JPEG quality", min_value=40, max_value=95, step=5,
+                                    value=int(getattr(cfg, "image_quality", 85)))
+if st.button("♻️ Re-optimize existing images"):
+    bar = st.progress(0.0)
+    rep = reoptimize_assets(max_px=int(image_max_px), quality=int(image_quality),
+                            progress=lambda done, total, _p: bar.progress(done / max(total, 1)))
+    saved_kb = (rep["bytes_before"] - rep["bytes_after"]) / 1024
+    st.success(f"{rep['files']} image(s) re-optimized, {rep['skipped']} already up to date"
+               f" — {rep['bytes_before'] / 1024:.0f} KB → {rep['bytes_after'] / 1024:.0f} KB ({saved_kb:.0f} KB saved).")
+    if rep["errors"]:
+        st.warning(f"{rep['errors']} file(s) could not be read.")
+
 
 
 # ────────────── SAVE SETTINGS ──────────────
@@ -115,7 +134,20 @@ if st.button("💾 Save all settings", use_container_width=True):
         "federation_logo": fed_path,
         "show_clubs": show_clubs,
         "show_vip_photos": show_vip_photos,
+        "image_max_px": int(image_max_px),
+        "image_quality": int(image_quality),
     }
     save_settings(new_cfg)
     st.success("Settings saved successfully ✅")
     st.rerun()
+
+# ────────────── DATA EXPORT ──────────────
+# les fichiers data/*.json sont compacts : export indenté pour relecture humaine
+from storage import export_json
+st.divider()
+# construit seulement sur demande : sinon chaque rerun de la page relirait toutes les clés
+if st.button("📦 Prepare data export", use_container_width=True):
+    st.session_state["settings_export_json"] = export_json()
+if "settings_export_json" in st.session_state:
+    st.download_button("⬇️ Export all data (readable JSON)", data=st.session_state["settings_export_json"],
+                       file_name="podium_data.json", mime="application/json", use_container_width=True)
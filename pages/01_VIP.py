@@ -1,11 +1,11 @@
 # pages/01_VIP.py
-import base64
-from pathlib import Path
 import html
+from pathlib import Path
 import streamlit as st
 
 from settings_io import load_settings
-from storage import load_all, save
+from storage import load_many, save
+from images import PHOTOS_DIR, ingest_image, resolve_photo_path, thumbnail_src
 from ui import apply_theme
 
 st.set_page_config(page_title="VIP", page_icon="🧑‍⚖️", layout="wide")
@@ -17,11 +17,9 @@ render_sidebar()
 
 st.title("🧑‍⚖️ VIP")
 
-data = load_all()
+data = load_many(["vip"])
 vips = data.get("vip") or []
 
-APP_ROOT = Path(__file__).parents[1]
-PHOTOS_DIR = APP_ROOT / "assets" / "photos"
 PHOTOS_DIR.mkdir(parents=True, exist_ok=True)
 
 # ---------- Query params helpers ----------
@@ -47,29 +45,6 @@ if "edit" in qp:
     edit_id = val if isinstance(val, str) else (val[0] if val else None)
 
 # ---------- Utils photos ----------
-def resolve_photo_path(vip: dict) -> Path | None:
-    p = str(vip.get("photo") or "").strip()
-    if p:
-        cand = Path(p)
-        if not cand.is_absolute():
-            cand = APP_ROOT / p
-        if cand.exists():
-            return cand
-    vid = str(vip.get("id") or "").strip()
-    for ext in (".png", ".jpg", ".jpeg"):
-        cand = PHOTOS_DIR / f"{vid}{ext}"
-        if cand.exists():
-            return cand
-    return None
-
-def file_to_data_uri(path: Path) -> str | None:
-    try:
-        mime = "image/png" if path.suffix.lower() == ".png" else "image/jpeg"
-        b64 = base64.b64encode(path.read_bytes()).decode("ascii")
-        return f"data:{mime};base64,{b64}"
-    except Exception:
-        return None
-
 def initials(name: str) -> str:
     parts = [x for x in (name or "").split() if x.strip()]
     if not parts: return "?"
@@ -109,11 +84,12 @@ if edit_id:
                         v.update({"id": eid, "name": ename, "role": erole, "ioc": eioc})
                         break
                 if eupload and eid:
-                    ext = Path(eupload.name).suffix.lower() or ".jpg"
-                    (PHOTOS_DIR / f"{eid}{ext}").write_bytes(eupload.getbuffer())
+                    # orientée, redimensionnée, sans EXIF (images.ingest_image)
+                    rec = ingest_image(eupload.getvalue(), PHOTOS_DIR / eid, replace_siblings=True,
+                                       fallback_ext=Path(eupload.name).suffix or ".jpg")
                     for v in vips:
                         if v.get("id") == eid:
-                            v["photo"] = f"assets/photos/{eid}{ext}"
+                            v["photo"] = rec["path"]
                 save("vip", vips)
                 st.success("VIP updated.")
                 set_query_params()  # clear ?edit
@@ -149,11 +125,11 @@ else:
             else:
                 vips.append({"id": new_id, "name": new_name, "role": new_role, "ioc": new_ioc})
             if uploaded:
-                ext = Path(uploaded.name).suffix.lower() or ".jpg"
-                (PHOTOS_DIR / f"{new_id}{ext}").write_bytes(uploaded.getbuffer())
+                rec = ingest_image(uploaded.getvalue(), PHOTOS_DIR / new_id, replace_siblings=True,
+                                   fallback_ext=Path(uploaded.name).suffix or ".jpg")
                 for v in vips:
                     if v.get("id") == new_id:
-                        v["photo"] = f"assets/photos/{new_id}{ext}"
+                        v["photo"] = rec["path"]
             save("vip", vips)
             st.success("VIP saved.")
             st.rerun()
@@ -193,8 +169,8 @@ else:
                 # vignette 120x120 uniforme
                 if cfg.vip_show_photos:
                     p = resolve_photo_path(v)
-                    if p and p.exists():
-                        uri = file_to_data_uri(p)
+                    if p:  # existence déjà vérifiée (images.resolve_photo_path)
+                        uri = thumbnail_src(p, AV_SIZE)
                         if uri:
                             st.markdown(
                                 f'<img src="{uri}" alt="{html.escape(name)}" '
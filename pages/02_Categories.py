@@ -1,7 +1,7 @@
 import streamlit as st
 from pathlib import Path
 
-from storage import load_all
+from storage import load_many
 from settings_io import load_settings
 from ui import apply_theme, get_img_tag
 
@@ -14,7 +14,7 @@ render_sidebar()
 icon_html = get_img_tag("assets/view_categories.png", width="40px", invert=True)
 st.markdown(f"# {icon_html} Categories", unsafe_allow_html=True)
 
-data = load_all()
+data = load_many(["categories"])
 cats = data.get("categories") or []
 id_to_cat = {c.get("id"): c for c in cats}
 ids = list(id_to_cat.keys())
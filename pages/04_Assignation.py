@@ -4,8 +4,9 @@ import streamlit as st
 
 from ui import apply_theme
 from settings_io import load_settings
-from storage import load_all, save, load
+from storage import load_many, load_versioned, save
 from keyer import ukey  # ukey pour les boutons généraux (pas pour les VIP)
+from timeline import CeremonyTimeline
 
 PAGE_KEY   = "assignation"
 TOGGLE_KEY = "assign_show_assigned"   # clé du widget toggle
@@ -13,6 +14,7 @@ DIM_SET_KEY = "assign_dimmed_ids"     # catégories “validées ici” (assombr
 FORCE_ON   = "_assign_force_show_on"  # flags non-widget pour piloter le toggle au prochain run
 FORCE_OFF  = "_assign_force_show_off"
 JUST_CLEARED = "_assign_just_cleared_pid"  # pid vidé à traiter au prochain run
+VERSION_KEY = "_assign_version"       # version d'assignment vue à l'ouverture (puis après chaque save)
 
 st.set_page_config(page_title="Assignation", page_icon="assets/vip_assignment.png", layout="wide")
 cfg = load_settings()
@@ -43,7 +45,8 @@ with c_tit:
 def persist_assign(assign: dict):
     """Écrit immédiatement assignment.json depuis {category_id: [vip_ids...]}."""
     new_list = [{"category_id": k, "vip_ids": v} for k, v in assign.items()]
-    save("assignment", new_list)
+    st.session_state[VERSION_KEY] = save("assignment", new_list,
+                                         expected_version=st.session_state.get(VERSION_KEY))
 
 # -------- Préparation état session (AVANT widgets) --------
 if DIM_SET_KEY not in st.session_state:
@@ -66,17 +69,20 @@ if pid_cleared:
     st.success(f"Assignations vidées pour la catégorie {pid_cleared}.")
 
 # -------- Données --------
-data = load_all()
+data = load_many(["categories", "vip"])
+# version vue à l'ouverture de l'éditeur : les clics VIP sont fusionnés avec ceux des autres
+# postes depuis ce moment (pas d'écrasement), pas seulement depuis le début de ce rerun
+data["assignment"], assign_version = load_versioned("assignment")
+st.session_state.setdefault(VERSION_KEY, assign_version)
 cats = {(c.get("id") or c.get("title")): c for c in (data.get("categories") or [])}
 vips = {v.get("id"): v for v in (data.get("vip") or [])}
 
 # Planning: garder uniquement les non réalisées (done=False)
-# --- lecture "finals_days" (Distribution) ---
-days_map = load("finals_days") or {}
-# days_map: {"1": [id...], "2": [id...]}
+# --- jours de la Distribution ("finals_days"), via le déroulé partagé ---
+timeline = CeremonyTimeline.current()
 
 # Define available options
-available_days = sorted(days_map.keys(), key=lambda x: int(x) if x.isdigit() else 999)
+available_days = timeline.days
 filter_opts = ["All"] + [f"Day {d}" for d in available_days]
 
 # UI Filter
@@ -84,31 +90,17 @@ c_fil, _ = st.columns([2, 5])
 with c_fil:
     sel_filter = st.selectbox("📅 Filter by Day", filter_opts)
 
-# Build planning list based on filter
-planning_ids = []
+# Build planning list based on filter ("All" : tous les jours, sans doublon)
 if sel_filter == "All":
-    for day_ids in days_map.values():
-        planning_ids.extend([str(x) for x in day_ids])
+    planning_ids = timeline.day_ids()
 else:
     # "Day X"
-    day_key = sel_filter.replace("Day ", "")
-    planning_ids = [str(x) for x in days_map.get(day_key, [])]
+    planning_ids = timeline.day_ids(sel_filter.replace("Day ", ""))
 
 # Convert to dict objects for compatibility with existing code
 # The existing code expects objects, so we wrap the IDs
 planning_all = [{"category_id": pid} for pid in planning_ids]
 
-# Deduplicate if "All" (just in case)
-if sel_filter == "All":
-    seen = set()
-    unique = []
-    for it in planning_all:
-        pid = it["category_id"]
-        if pid not in seen:
-            unique.append(it)
-            seen.add(pid)
-    planning_all = unique
-
 # Assignations actuelles
 assign_list = data.get("assignment") or []
 assign = {a.get("category_id"): list(a.get("vip_ids") or []) for a in assign_list}
@@ -124,7 +116,8 @@ def persist_assign_with_roles(assign_map, roles_map):
             "vip_ids": vids, 
             "vip_roles": robj
         })
-    save("assignment", new_list)
+    st.session_state[VERSION_KEY] = save("assignment", new_list,
+                                         expected_version=st.session_state.get(VERSION_KEY))
 
 # -------- Barre d’outils --------
 t1, t2, t3, t4 = st.columns([1, 1, 4, 3])  # adjusted columns
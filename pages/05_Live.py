@@ -2,9 +2,9 @@
 from __future__ import annotations
 import streamlit as st
 
-from ui import apply_theme
+from ui import apply_theme, watch_changes
 from settings_io import load_settings
-from storage import load_all
+from timeline import CeremonyTimeline
 from view_filters import get_hidden, hide, reset
 from keyer import ukey
 
@@ -18,29 +18,13 @@ render_sidebar()
 
 st.title("🎬 Live")
 
-data = load_all()
-cats = {(c.get("id") or c.get("title")): c for c in (data.get("categories") or [])}
-# --- lecture "planning" tolérante et triée ---
-raw_planning = data.get("planning") or []
-
-# Si jamais on a un dict {id: item}, on le convertit en liste
-if isinstance(raw_planning, dict):
-    raw_planning = list(raw_planning.values())
-
-# On ne garde que les objets dict valides
-safe_planning = [it for it in raw_planning if isinstance(it, dict)]
-
-# Tri sécurisé (order peut être string ou absent)
-def _ord(v):
-    try:
-        return int((v or {}).get("order", 0))
-    except Exception:
-        return 0
-
-planning_all = sorted(safe_planning, key=_ord)
+# relance auto dès qu'une de ces clés change (sinon : bouton Reload)
+watch_changes(["categories", "planning"], cfg.cycle_seconds, PAGE_KEY)
+# déroulé partagé (planning trié, catégories + médaillés joints), recalculé seulement si les données changent
+planning_all = CeremonyTimeline.current().entries
 
 hidden_ids = get_hidden(PAGE_KEY)
-planning = [p for p in planning_all if p.get("category_id") not in hidden_ids]
+planning = [p for p in planning_all if p.category_id not in hidden_ids]
 
 # barre d’outils
 t1, t2, t3, t4 = st.columns([1, 1, 4, 1])
@@ -58,17 +42,15 @@ st.divider()
 def section(idx: int, label: str):
     if idx >= len(planning):
         return None, None
-    pid = planning[idx]["category_id"]
-    cat = cats.get(pid, {})
-    st.subheader(f"{label} — {pid} : {cat.get('title', '—')}")
-    meds = cat.get("medalists") or []
-    for m in sorted(meds, key=lambda x: int(x.get("rank", 99))):
-        medal = "🥇" if str(m.get("rank")) == "1" else ("🥈" if str(m.get("rank")) == "2" else "🥉")
-        right = m.get("club") if (cfg.show_club and m.get("club")) else m.get("nation", "")
+    e = planning[idx]
+    pid = e.category_id
+    st.subheader(f"{label} — {pid} : {e.title if e.known else '—'}")
+    for m in e.medalists:
+        right = m.club if (cfg.show_club and m.club) else m.nation
         right = f" &nbsp;&nbsp; `{right}`" if right else ""
-        st.markdown(f"{medal} **{m.get('name','—')}**{right}", unsafe_allow_html=True)
+        st.markdown(f"{m.medal} **{m.name or '—'}**{right}", unsafe_allow_html=True)
     st.divider()
-    return pid, cat.get("title")
+    return pid, e.title if e.known else None
 
 cur = section(0, "Current")
 nxt = section(1, "Next")
@@ -1,8 +1,8 @@
 # pages/06_Speaker.py
 import streamlit as st
-from ui import apply_theme, render_sidebar
+from ui import apply_theme, render_sidebar, watch_changes
 from settings_io import load_settings
-from storage import load_all
+from timeline import CeremonyTimeline
 
 st.set_page_config(page_title="Speaker", page_icon="🎤", layout="wide")
 
@@ -13,30 +13,19 @@ render_sidebar()
 
 st.title("🎤 Speaker")
 
-# Chargement des données persistées
-data = load_all()
-categories = data.get("categories") or []           # liste de dicts: {id, title, medalists: [...]}
-assignments_list = data.get("assignment") or []
-assignments = {a.get("category_id"): a.get("vip_ids") for a in assignments_list if isinstance(a, dict)}
-vip_list = data.get("vip") or []                    # [{id, name, ioc, function, photo_path, ...}]
+# Déroulé partagé (catégories, médaillés et VIP déjà joints)
+# relance auto dès qu'une de ces clés change
+watch_changes(["categories", "assignment", "vip", "planning"], cfg.cycle_seconds, "speaker")
+timeline = CeremonyTimeline.current()
 
 # Index courant en session (navigation une seule catégorie à la fois)
 if "speaker_idx" not in st.session_state:
     st.session_state["speaker_idx"] = 0
 
-# Construire une liste ordonnée de catégories à afficher
-# - si un "planning" existe et non vide => respecter cet ordre
+# Liste ordonnée de catégories à afficher
+# - si un "planning" existe et non vide => respecter cet ordre (ids inconnus ignorés)
 # - sinon, on prend l’ordre tel que dans categories
-planning = data.get("planning") or []
-if planning:
-    # planning peut être une simple liste d'ids
-    ordered_ids = [p if isinstance(p, str) else p.get("id") for p in planning]
-    ordered = [c for cid in ordered_ids for c in categories if (c.get("id") == cid or c.get("title") == cid)]
-    # fallback si certains IDs ne matchent pas
-    if not ordered:
-        ordered = categories[:]
-else:
-    ordered = categories[:]
+ordered = [e for e in timeline.entries if e.known] or timeline.catalog()
 
 total = len(ordered)
 
@@ -47,8 +36,8 @@ if total == 0:
 # Sécuriser l’index
 st.session_state["speaker_idx"] = max(0, min(st.session_state["speaker_idx"], total - 1))
 cur = ordered[st.session_state["speaker_idx"]]
-cid = cur.get("id") or cur.get("title") or f"cat_{st.session_state['speaker_idx']}"
-title = cur.get("title", "Unnamed Category")
+cid = cur.category_id or f"cat_{st.session_state['speaker_idx']}"
+title = cur.title or "Unnamed Category"
 
 # Barre de navigation
 nav_l, nav_c, nav_r = st.columns([1, 6, 1])
@@ -63,13 +52,11 @@ with nav_r:
 # Option d’affichage club/IOC depuis Settings (si présent)
 show_club = getattr(cfg, "show_club_names", False)
 
-def fmt_athlete(m: dict) -> str:
-    """Rend un affichage lisible pour un médaillé."""
-    # attendu depuis l’import: {'rank': 1..3, 'name': '...', 'club': '...', 'ioc': 'FRA'}
-    rank = m.get("rank")
-    name = m.get("name") or "N/A"
-    club = m.get("club")
-    ioc = (m.get("ioc") or "").upper().strip()
+def fmt_athlete(m) -> str:
+    """Rend un affichage lisible pour un médaillé (models.Medalist)."""
+    name = m.name or "N/A"
+    club = m.club
+    ioc = m.nation  # nation ou ioc, normalisé en majuscules
 
     # Affichage IOC/club selon param
     right = ""
@@ -79,11 +66,10 @@ def fmt_athlete(m: dict) -> str:
         right = f" — {ioc}"
 
     # Emoji médaille
-    medal = {1: "🥇", 2: "🥈", 3: "🥉"}.get(int(rank) if str(rank).isdigit() else None, "🏅")
+    medal = {1: "🥇", 2: "🥈", 3: "🥉"}.get(m.rank, "🏅")
     return f"{medal} **{name}**{right}"
 
-# construire un dict id -> vip
-vip_by_id = {v.get("id") or v.get("name"): v for v in vip_list}
+vip_by_id = timeline.vips  # id -> models.VIP
 
 # Helper rendering functions
 def render_category_block(idx, is_next=False):
@@ -94,23 +80,19 @@ def render_category_block(idx, is_next=False):
         return
 
     obj = ordered[idx]
-    c_id = obj.get("id") or obj.get("title") or "Unknown"
-    c_title = obj.get("title", "Unnamed Category")
+    c_title = obj.title or "Unnamed Category"
     
     # Header
     prefix = "⏭️ Next: " if is_next else "Now: "
     st.markdown(f"### {prefix}{c_title}")
     
     # Medalists
-    meds = obj.get("medalists") or []
+    meds = obj.medalists
     if not meds:
         st.caption("No medalists.")
     else:
         # Sort desc
-        def _rk(x):
-            try: return int(x.get("rank"))
-            except: return 999
-        meds = sorted(meds, key=_rk, reverse=True)
+        meds = sorted(meds, key=lambda m: m.rank, reverse=True)
         
         for m in meds:
             st.markdown(f"{fmt_athlete(m)}")
@@ -119,11 +101,9 @@ def render_category_block(idx, is_next=False):
     st.markdown("---")
     st.caption("**Presentation**")
     
-    # Get assignments
-    # We need to find assignment object for this Category ID
-    a_obj = next((a for a in assignments_list if isinstance(a, dict) and a.get("category_id") == c_id), {})
-    v_ids = a_obj.get("vip_ids") or []
-    r_map = a_obj.get("vip_roles") or {}
+    # Assignments (joints dans le déroulé)
+    v_ids = obj.vip_ids
+    r_map = obj.vip_roles
     
     if not v_ids:
         st.caption("(No VIP assigned)")
@@ -139,10 +119,10 @@ def render_category_block(idx, is_next=False):
         sorted_vids = sorted(v_ids, key=_vip_order)
         
         for vid in sorted_vids:
-            v = vip_by_id.get(vid) or {}
-            vname = v.get("name") or vid
+            v = vip_by_id.get(vid)
+            vname = (v.name if v else "") or vid
             # Fix: The attribute in VIP data is 'role', not 'function'
-            vfun = v.get("role") or ""
+            vfun = v.role if v else ""
             role = r_map.get(vid)
             
             icon = {"Gold": "🥇", "Silver": "🥈", "Bronze": "🥉"}.get(role, "•") if (role and role!="General") else "•"
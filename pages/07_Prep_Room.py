@@ -2,9 +2,9 @@
 from __future__ import annotations
 import streamlit as st
 
-from ui import apply_theme, get_img_tag
+from ui import apply_theme, get_img_tag, watch_changes
 from settings_io import load_settings
-from storage import load_all
+from timeline import CeremonyTimeline
 from view_filters import get_hidden, hide, reset
 from keyer import ukey
 
@@ -25,34 +25,17 @@ with c_tit:
     st.title("Prep Room")
 
 # --- données ---
-data = load_all()
-cats = {(c.get("id") or c.get("title")): c for c in (data.get("categories") or [])}
-# --- lecture "planning" tolérante et triée ---
-raw_planning = data.get("planning") or []
-
-# Si jamais on a un dict {id: item}, on le convertit en liste
-if isinstance(raw_planning, dict):
-    raw_planning = list(raw_planning.values())
-
-# On ne garde que les objets dict valides
-safe_planning = [it for it in raw_planning if isinstance(it, dict)]
-
-# Tri sécurisé (order peut être string ou absent)
-def _ord(v):
-    try:
-        return int((v or {}).get("order", 0))
-    except Exception:
-        return 0
-
-planning_all = sorted(safe_planning, key=_ord)
-
+# relance auto dès qu'une de ces clés change (sinon : bouton Reload)
+watch_changes(["categories", "planning"], cfg.cycle_seconds, PAGE_KEY)
+# déroulé partagé (planning trié, catégories + médaillés joints), recalculé seulement si les données changent
+timeline = CeremonyTimeline.current()
 
 # On n’affiche que les podiums non réalisés (done=False)
-planning_todo = [p for p in planning_all if not p.get("done")]
+planning_todo = [p for p in timeline.entries if not p.done]
 
 # Masquage local spécifique à cette page (les “Send” ici ne suppriment pas globalement)
 hidden_ids = get_hidden(PAGE_KEY)
-planning = [p for p in planning_todo if p.get("category_id") not in hidden_ids]
+planning = [p for p in planning_todo if p.category_id not in hidden_ids]
 
 # --- barre d’outils ---
 t1, t2, t3 = st.columns([1, 1, 6])
@@ -74,10 +57,9 @@ else:
     subset = planning[:3]
 
     for i, it in enumerate(subset, start=1):
-        pid = it.get("category_id")
-        cat = cats.get(pid, {})
-        title = cat.get("title") or pid or "—"
-        meds = sorted(cat.get("medalists") or [], key=lambda m: int(m.get("rank", 99)))
+        pid = it.category_id
+        title = it.title
+        meds = it.medalists
 
         card = st.container()
         with card:
@@ -92,10 +74,9 @@ else:
             st.write("— Medalists —")
             if meds:
                 for m in meds:
-                    medal = "🥇" if str(m.get("rank")) == "1" else ("🥈" if str(m.get("rank")) == "2" else "🥉")
-                    right = m.get("club") if (cfg.show_club and m.get("club")) else m.get("nation", "")
+                    right = m.club if (cfg.show_club and m.club) else m.nation
                     right = f" `{right}`" if right else ""
-                    st.markdown(f"{medal} **{m.get('name','—')}**{right}", unsafe_allow_html=True)
+                    st.markdown(f"{m.medal} **{m.name or '—'}**{right}", unsafe_allow_html=True)
             else:
                 st.caption("No medalists found.")
 
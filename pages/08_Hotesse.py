@@ -1,12 +1,12 @@
 # pages/08_Hotesse.py
 from __future__ import annotations
-from pathlib import Path
-import base64
+from dataclasses import asdict
 import streamlit as st
 
 from settings_io import load_settings
-from storage import load_all
-from ui import apply_theme, get_img_tag
+from timeline import CeremonyTimeline
+from images import resolve_photo_path, thumbnail_src
+from ui import apply_theme, get_img_tag, watch_changes
 
 st.set_page_config(page_title="Hôtesse", page_icon="assets/hostess.png", layout="wide")
 
@@ -18,35 +18,13 @@ render_sidebar()
 icon_html = get_img_tag("assets/hostess.png", width="40px", invert=False, clip_circle=True)
 st.markdown(f"# {icon_html} Hôtesse", unsafe_allow_html=True)
 
-APP_ROOT = Path(__file__).parents[1]
-PHOTOS_DIR = APP_ROOT / "assets" / "photos"
 
-data = load_all()
-# --- lecture "planning" tolérante et triée (anti 'str'.get) ---
-from storage import load_all
-
-data = load_all()
-
-raw_planning = data.get("planning") or []
-
-# Si c'est un dict {id: item}, on convertit en liste
-if isinstance(raw_planning, dict):
-    raw_planning = list(raw_planning.values())
-
-# On ne garde que les dicts (ignore les strings parasites)
-safe_planning = [it for it in raw_planning if isinstance(it, dict)]
-
-# Tri sécurisé
-def _ord(v):
-    try:
-        return int((v or {}).get("order", 0))
-    except Exception:
-        return 0
-
-planning = sorted(safe_planning, key=_ord)
-cats = { (c.get("id") or c.get("title")): c for c in (data.get("categories") or []) }
-assign = { a.get("category_id"): a.get("vip_ids", []) for a in (data.get("assignment") or []) }
-vips   = { v.get("id"): v for v in (data.get("vip") or []) }
+# --- déroulé partagé : planning trié, catégories et VIP assignés déjà joints ---
+# relance auto dès qu'une de ces clés change
+watch_changes(["planning", "categories", "assignment", "vip"], cfg.cycle_seconds, "hotesse")
+timeline = CeremonyTimeline.current()
+planning = timeline.entries
+vips = timeline.vips
 
 if "hotesse_idx" not in st.session_state:
     st.session_state.hotesse_idx = 0
@@ -55,29 +33,6 @@ if "hotesse_idx" not in st.session_state:
 if planning:
     st.session_state.hotesse_idx = max(0, min(st.session_state.hotesse_idx, len(planning)-1))
 
-def resolve_photo_path(vip: dict) -> Path | None:
-    p = str(vip.get("photo") or "").strip()
-    if p:
-        cand = Path(p)
-        if not cand.is_absolute():
-            cand = APP_ROOT / p
-        if cand.exists():
-            return cand
-    vid = str(vip.get("id") or "").strip()
-    for ext in (".png", ".jpg", ".jpeg"):
-        cand = PHOTOS_DIR / f"{vid}{ext}"
-        if cand.exists():
-            return cand
-    return None
-
-def file_to_data_uri(path: Path) -> str | None:
-    try:
-        mime = "image/png" if path.suffix.lower() == ".png" else "image/jpeg"
-        b64 = base64.b64encode(path.read_bytes()).decode("ascii")
-        return f"data:{mime};base64,{b64}"
-    except Exception:
-        return None
-
 AV = 110  # taille vignette
 
 def vip_card_html(v: dict) -> str:
@@ -85,8 +40,8 @@ def vip_card_html(v: dict) -> str:
     role = (v.get("role") or "").strip()
     if cfg.hostess_show_photos:
         p = resolve_photo_path(v)
-        if p and p.exists():
-            uri = file_to_data_uri(p)
+        if p:  # existence déjà vérifiée (images.resolve_photo_path)
+            uri = thumbnail_src(p, AV)
             if uri:
                 img = f'<img src="{uri}" alt="{name}" style="width:{AV}px;height:{AV}px;border-radius:12px;object-fit:cover;object-position:center;margin-bottom:6px;">'
             else:
@@ -105,9 +60,7 @@ def render_current(idx: int):
         return
 
     cur = planning[idx]
-    cid = cur.get("category_id")
-    cat = cats.get(cid, {})
-    title = cat.get("title") or cid or "—"
+    title = cur.title
 
     # Entête + navigation
     left, center, right = st.columns([1,2,1])
@@ -124,18 +77,16 @@ def render_current(idx: int):
             st.rerun()
 
     # VIP assignés
-    vids = assign.get(cid, [])
+    vids = cur.vip_ids
     if not vids:
         st.info("No VIP assigned.")
         return
 
-    # Fetch roles
-    assign_obj = next((a for a in (data.get("assignment") or []) if a.get("category_id") == cid), {})
-    roles_map = assign_obj.get("vip_roles") or {}
+    roles_map = cur.vip_roles
 
     cards = []
     for vid in vids:
-        v = vips.get(vid, {}).copy() # copy to not mutate global state
+        v = asdict(vips[vid]) if vid in vips else {}  # dict à part : le modèle partagé reste intact
         
         # Inject medal role into the 'role' field for display, or prepend it
         medal_role = roles_map.get(vid)
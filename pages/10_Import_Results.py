@@ -1,6 +1,5 @@
 # pages/10_Import_Results.py
 from __future__ import annotations
-import re
 import io
 import os
 os.environ["KMP_DUPLICATE_LIB_OK"] = "TRUE"
@@ -10,8 +9,18 @@ import streamlit as st
 
 from ui import apply_theme
 from settings_io import load_settings
-from storage import load_all, save
+from storage import load, save, transaction
 
+from parsers.results_table_parser import MissingColumnsError, parse_results_dataframe, slugify
+from parsers.results_batch import SUPPORTED_EXT, parse_batch
+from parsers.results_merge import has_changes, merge_results
+import import_examples
+import upload_cache
+
+try:
+    from parsers.results_txt_parser import iter_results_txt, new_stats
+except Exception:
+    iter_results_txt = None
 try:
     from parsers.results_txt_parser import parse_results_txt_with_stats as parse_with_stats
 except Exception:
@@ -33,12 +42,6 @@ st.caption("Updates ONLY categories & medalists. (Planning is not modified.)")
 # --------------------------------------------------------------------------------
 # Helpers / Normalization
 # --------------------------------------------------------------------------------
-_slug_re = re.compile(r"[^A-Za-z0-9]+")
-def slugify(s: str) -> str:
-    s = (s or "").strip()
-    s = _slug_re.sub("_", s.upper()).strip("_")
-    return s or "CAT"
-
 def normalize_category(cat: dict) -> dict:
     title = (cat.get("title") or "").strip()
     cid = (cat.get("id") or "").strip() or slugify(title) or "CAT"
@@ -49,72 +52,18 @@ def normalize_category(cat: dict) -> dict:
         pass
     return {"id": cid, "title": title or cid, "medalists": meds}
 
-def _parse_dataframe(df: pd.DataFrame) -> List[dict]:
+def _parse_table_upload(upload, parser: str, read) -> List[dict]:
     """
-    Expects columns: Category, Rank, Name, Nation (optional Club).
-    Returns list of category dicts.
+    Parse an uploaded table (read = pd.read_csv / pd.read_excel on a BytesIO).
+    Cached by file content: reruns (checkbox, button) don't re-read the file.
     """
-    # Normalize inputs
-    df.columns = [str(c).strip().lower() for c in df.columns]
-    
-    # Map common names
-    col_map = {
-        "category": ["category", "cat", "title", "division"],
-        "rank": ["rank", "place", "pos", "position", "order"],
-        "name": ["name", "athlete", "competitor"],
-        "nation": ["nation", "country", "ioc", "team"],
-        "club": ["club", "school"]
-    }
-    
-    final_cols = {}
-    for target, candidates in col_map.items():
-        found = next((c for c in df.columns if c in candidates), None)
-        if found:
-            final_cols[target] = found
-            
-    if "category" not in final_cols or "rank" not in final_cols or "name" not in final_cols:
-        st.error(f"Missing required columns. Found: {list(df.columns)}. Need at least: Category, Rank, Name.")
+    try:
+        return upload_cache.parse(parser, upload.getvalue(),
+                                  lambda data: parse_results_dataframe(read(io.BytesIO(data))))
+    except MissingColumnsError as e:
+        st.error(str(e))
         return []
 
-    # Group by category
-    cats = {}
-    for _, row in df.iterrows():
-        cat_name = str(row[final_cols["category"]]).strip()
-        if not cat_name or cat_name.lower() == "nan":
-            continue
-            
-        try:
-            rank_val = int(pd.to_numeric(row[final_cols["rank"]], errors='coerce') or 0)
-        except:
-            rank_val = 99
-            
-        name_val = str(row[final_cols["name"]]).strip()
-        nati_val = str(row[final_cols.get("nation", "")]).strip() if "nation" in final_cols else ""
-        club_val = str(row[final_cols.get("club", "")]).strip() if "club" in final_cols else ""
-        
-        if not name_val or name_val.lower() == "nan":
-            continue
-
-        if cat_name not in cats:
-            cats[cat_name] = []
-            
-        cats[cat_name].append({
-            "rank": rank_val,
-            "name": name_val,
-            "nation": nati_val if nati_val.lower() != "nan" else "",
-            "club": club_val if club_val.lower() != "nan" else ""
-        })
-
-    # Convert to list
-    results = []
-    for c_title, medalists in cats.items():
-        results.append({
-            "title": c_title,
-            "id": slugify(c_title),
-            "medalists": medalists
-        })
-    return results
-
 # --------------------------------------------------------------------------------
 # EXAMPLE DATA GENERATORS
 # --------------------------------------------------------------------------------
@@ -127,21 +76,14 @@ U18 Female -52kg,1,Emma Stone,CAN,Toronto Club
 """
 
 def get_example_xlsx():
-    data = [
-        {"Category": "U16 Male -46kg", "Rank": 1, "Name": "John Doe", "Nation": "FRA", "Club": "Judo Paris"},
-        {"Category": "U16 Male -46kg", "Rank": 2, "Name": "Jane Smith", "Nation": "USA", "Club": "Team USA"},
-        {"Category": "U18 Female -52kg", "Rank": 1, "Name": "Emma Stone", "Nation": "CAN", "Club": "Toronto Club"},
-    ]
-    df = pd.DataFrame(data)
-    buf = io.BytesIO()
-    with pd.ExcelWriter(buf, engine="xlsxwriter") as writer:
-        df.to_excel(writer, index=False, sheet_name="Results")
-    return buf.getvalue()
+    return import_examples.results_xlsx()
 
 # --------------------------------------------------------------------------------
 # UI
 # --------------------------------------------------------------------------------
-tab_txt, tab_csv, tab_xls, tab_sportdata = st.tabs(["📄 TXT Import", "📊 CSV Import", "📗 Excel Import", "🥋 Sportdata Import"])
+tab_txt, tab_csv, tab_xls, tab_sportdata, tab_batch = st.tabs(
+    ["📄 TXT Import", "📊 CSV Import", "📗 Excel Import", "🥋 Sportdata Import", "📦 Batch Import"]
+)
 
 # --- TXT TAB ---
 with tab_txt:
@@ -169,14 +111,31 @@ U18 FEMALE -48 KG
     stats_txt = None
     
     if upload_txt:
-        if not (parse_with_stats or parse_simple):
+        if not (iter_results_txt or parse_with_stats or parse_simple):
             st.error("Parser not found.")
         else:
             try:
-                content = upload_txt.read().decode("utf-8", errors="replace")
-                if parse_with_stats:
-                    parsed_txt, stats_txt = parse_with_stats(content)
+                if iter_results_txt:
+                    def _parse_txt(data: bytes):
+                        # lecture en flux : catégorie par catégorie, avec progression
+                        stats = new_stats()
+                        cats = []
+                        total = len(data) or 1
+                        bar = st.progress(0.0, text="Parsing…")
+                        for i, cat in enumerate(iter_results_txt(io.BytesIO(data), stats=stats), start=1):
+                            cats.append(cat)
+                            if i % 100 == 0:
+                                bar.progress(min(1.0, stats["bytes_read"] / total),
+                                             text=f"Parsing… {i} categories")
+                        bar.empty()
+                        return cats, stats
+                    parsed_txt, stats_txt = upload_cache.parse("results_txt", upload_txt.getvalue(), _parse_txt)
+                elif parse_with_stats:
+                    parsed_txt, stats_txt = upload_cache.parse(
+                        "results_txt", upload_txt.getvalue(),
+                        lambda data: parse_with_stats(data.decode("utf-8", errors="replace")))
                 else:
+                    content = upload_txt.read().decode("utf-8", errors="replace")
                     parsed_txt, stats_txt = (parse_simple(content) or []), None
             except Exception as e:
                 st.error(f"Read/Parse error : {e}")
@@ -196,8 +155,7 @@ with tab_csv:
     
     if upload_csv:
         try:
-            df = pd.read_csv(upload_csv)
-            parsed_csv = _parse_dataframe(df)
+            parsed_csv = _parse_table_upload(upload_csv, "results_csv", pd.read_csv)
         except Exception as e:
             st.error(f"CSV Error: {e}")
 
@@ -221,8 +179,7 @@ with tab_xls:
     
     if upload_xls:
         try:
-            df = pd.read_excel(upload_xls)
-            parsed_xls = _parse_dataframe(df)
+            parsed_xls = _parse_table_upload(upload_xls, "results_excel", pd.read_excel)
         except Exception as e:
             st.error(f"Excel Error: {e}")
 
@@ -249,16 +206,63 @@ ADULTS JIU-JITSU FEMALE -45 KG,2,1000,PHUNG THI HUE,,VIE00046,24/04/1993,,,VIETN
         try:
             # Sportdata often uses comma, but let's allow pandas to sniff (sep=None)
             # This handles comma (,), semicolon (;), tab (\t), etc.
-            df_sd = pd.read_csv(upload_sd, sep=None, engine='python')
             # The generic parser handles "Place" -> "Rank", "Category" -> "Category", etc.
-            parsed_sd = _parse_dataframe(df_sd)
+            parsed_sd = _parse_table_upload(upload_sd, "results_sportdata",
+                                            lambda buf: pd.read_csv(buf, sep=None, engine='python'))
         except Exception as e:
             st.error(f"Sportdata CSV Error: {e}")
 
+# --- BATCH TAB ---
+with tab_batch:
+    st.caption("Many exports at once (one per mat, TXT / CSV / Excel) or a .zip of them. "
+               "Files are parsed in parallel and merged in file-name order; "
+               "a category found in several files keeps the medalists of the last one.")
+
+    uploads_batch = st.file_uploader(
+        "Select files or a .zip", type=[e.lstrip(".") for e in SUPPORTED_EXT] + ["zip"],
+        accept_multiple_files=True, key="up_batch",
+    )
+    parsed_batch = []
+
+    if uploads_batch:
+        files_batch = [(f.name, f.getvalue()) for f in uploads_batch]
+
+        def _parse_batch(_blobs):
+            bar = st.progress(0.0, text="Parsing…")
+            def _progress(n_done, n_total, rep):
+                bar.progress(n_done / max(n_total, 1), text=f"Parsing… {n_done}/{n_total} — {rep['file']}")
+            try:
+                return parse_batch(files_batch, on_progress=_progress)
+            finally:
+                bar.empty()
+        try:
+            parsed_batch, reports_batch, totals_batch = upload_cache.parse(
+                "results_batch", [data for _, data in files_batch], _parse_batch,
+                options=tuple(name for name, _ in files_batch),
+            )
+        except Exception as e:
+            parsed_batch, reports_batch, totals_batch = [], [], {}
+            st.error(f"Batch Error: {e}")
+
+        if reports_batch:
+            st.dataframe(
+                [{"File": r["file"], "Type": r["kind"], "Categories": r["n_categories"],
+                  "Medalists": r["n_medalists"],
+                  "Ignored lines": r["stats"].get("ignored_invalid_after_rank", ""),
+                  "No IOC": r["stats"].get("no_ioc", ""),
+                  "Time (s)": r["seconds"], "Error": r["error"]} for r in reports_batch],
+                use_container_width=True, hide_index=True,
+            )
+            failed = [r["file"] for r in reports_batch if r["error"]]
+            if failed:
+                st.warning(f"{len(failed)} file(s) not imported: {', '.join(failed)}")
+            if totals_batch.get("duplicates"):
+                st.info(f"{totals_batch['duplicates']} category(ies) found in several files (last file kept).")
+
 # --------------------------------------------------------------------------------
 # MERGE LOGIC (COMMON)
 # --------------------------------------------------------------------------------
-final_parsed = parsed_txt or parsed_csv or parsed_xls or parsed_sd
+final_parsed = parsed_txt or parsed_csv or parsed_xls or parsed_sd or parsed_batch
 
 if final_parsed:
     normalized = [normalize_category(c) for c in final_parsed]
@@ -285,28 +289,21 @@ if final_parsed:
     c1, c2 = st.columns(2)
     with c1:
         if st.button("🔁 Merge with existing", use_container_width=True):
-            data = load_all()
-            cats = data.get("categories") or []
-            # Index by ID or Title
-            index = {}
-            for i, c in enumerate(cats):
-                k = (c.get("id") or c.get("title") or "").strip()
-                if k: index[k] = i
-                
-            for inc in normalized:
-                key = (inc.get("id") or inc.get("title") or "").strip()
-                if key in index:
-                    # Update existing
-                    idx = index[key]
-                    cats[idx]["medalists"] = inc["medalists"]
-                    # Update title if present
-                    if inc.get("title"): cats[idx]["title"] = inc["title"]
-                else:
-                    # Append new
-                    cats.append(inc)
-            
-            save("categories", cats)
-            st.success("Merge done.")
+            cats, diff = merge_results(load("categories") or [], normalized)
+            if has_changes(diff):
+                save("categories", cats)
+                st.success(
+                    f"Merge done — added: {len(diff['added'])}, changed: {len(diff['changed'])}, "
+                    f"unchanged: {len(diff['unchanged'])}."
+                )
+            else:
+                st.info(f"Nothing changed ({len(diff['unchanged'])} category(ies) already up to date). No write.")
+            if diff["added"] or diff["changed"]:
+                with st.expander("Diff report", expanded=False):
+                    if diff["added"]:
+                        st.markdown("**Added:** " + ", ".join(diff["added"]))
+                    if diff["changed"]:
+                        st.markdown("**Changed:** " + ", ".join(diff["changed"]))
             
     with c2:
         confirm = st.checkbox("Confirm TOTAL replacement")
@@ -324,8 +321,7 @@ if final_parsed:
             st.caption("Removes **medalists** only. Planning safe.")
             if st.checkbox("Confirm results reset", key="chk_res"):
                 if st.button("🧨 Clear Results", use_container_width=True):
-                    data = load_all()
-                    cats = data.get("categories") or []
+                    cats = load("categories") or []
                     for c in cats:
                         c["medalists"] = []
                     save("categories", cats)
@@ -349,9 +345,10 @@ if final_parsed:
             st.caption("⚠️ **DELETES EVERYTHING**.")
             if st.checkbox("Confirm full delete", key="chk_cat"):
                 if st.button("💀 Delete ALL", use_container_width=True):
-                    save("categories", [])
-                    save("finals_days", {})
-                    save("assignment", [])
+                    with transaction():
+                        save("categories", [])
+                        save("finals_days", {})
+                        save("assignment", [])
                     st.success("All data deleted.")
                     st.rerun()
 
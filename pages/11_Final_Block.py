@@ -6,7 +6,8 @@ import streamlit as st
 
 from ui import apply_theme, render_sidebar, get_img_tag
 from settings_io import load_settings
-from storage import load, save
+from storage import load, save, load_versioned, write_status
+from indexes import CategoryIndex
 
 # ---------- Page config + thème + sidebar ----------
 st.set_page_config(page_title="Final Block", page_icon="assets/final_block.png", layout="wide")
@@ -16,12 +17,23 @@ render_sidebar()
 icon_html = get_img_tag("assets/final_block.png", width="40px", invert=True)
 st.markdown(f"# {icon_html} Final Block", unsafe_allow_html=True)
 
+_ws = write_status()
+if "final_block" in _ws["pending"] and _ws["last_error"]:
+    st.warning(f"Save pending (retrying): {_ws['last_error']}")
+
 EXPORT_PAGE_PATH = "pages/12_Final_Block_Export.py"
 
 # ---------- helpers ----------
+# Version de final_block vue à l'ouverture de l'éditeur (puis après chaque sauvegarde) :
+# les sauvegardes la passent à save() pour fusionner avec les modifications faites
+# entre-temps par un autre poste, même sur plusieurs reruns.
+FB_VERSION_KEY = "_final_block_version"
+
 def _load_fb() -> Dict[str, Any]:
     """Charge le final_block en imposant les imports à 'À assigner' (mat=0, order=0, assigned=False)."""
-    fb = load("final_block") or {}
+    fb, version = load_versioned("final_block")
+    st.session_state.setdefault(FB_VERSION_KEY, version)
+    fb = fb or {}
     mats = int(fb.get("mats") or 1)
     finals = fb.get("finals") or []  # [{"category_id","order","mat"} ou breaks]
     changed = False
@@ -64,27 +76,16 @@ def _load_fb() -> Dict[str, Any]:
                 changed = True
 
     if changed:
-        save("final_block", {"mats": max(1, mats), "finals": finals})
+        _save_fb(max(1, mats), finals)
     return {"mats": max(1, mats), "finals": finals}
 
 def _save_fb(mats: int, finals: List[Dict[str, Any]]):
-    save("final_block", {"mats": int(mats), "finals": finals})
+    st.session_state[FB_VERSION_KEY] = save("final_block", {"mats": int(mats), "finals": finals},
+                                            expected_version=st.session_state.get(FB_VERSION_KEY))
 
 def _cats_by_id() -> Dict[str, Dict[str, Any]]:
-    """Map ID -> catégorie normalisée (toujours une clé 'title')."""
-    cats = load("finals_categories") or load("categories") or []
-    by_id = {}
-    for c in cats:
-        if not isinstance(c, dict):
-            continue
-        cid = c.get("id") or c.get("cid")
-        if not cid:
-            continue
-        title = c.get("title") or c.get("name") or c.get("Category") or c.get("category") or str(cid)
-        cc = dict(c)
-        cc["title"] = title
-        by_id[cid] = cc
-    return by_id
+    """Map ID -> catégorie normalisée (toujours une clé 'title'), partagée : lecture seule."""
+    return CategoryIndex.current().by_id
 
 def _mat_items(finals: List[Dict[str, Any]], mat: int) -> List[Dict[str, Any]]:
     return sorted([f for f in finals if int(f.get("mat", 0)) == mat],
@@ -7,7 +7,8 @@ import streamlit as st
 
 from ui import apply_theme, render_sidebar
 from settings_io import load_settings
-from storage import load, save
+from storage import load, save, read_blob, migrate_blobs
+from indexes import CategoryIndex
 
 # ===== PDF (ReportLab) =====
 try:
@@ -32,18 +33,8 @@ fb: Dict[str, Any] = load("final_block") or {"mats": 1, "finals": []}
 mats: int = int(fb.get("mats", 1))
 finals: List[Dict[str, Any]] = fb.get("finals", [])
 
-cats = load("categories") or load("finals_categories") or []
-cats_map = {}
-for c in cats:
-    if not isinstance(c, dict):
-        continue
-    cid = c.get("id") or c.get("cid")
-    if not cid:
-        continue
-    title = c.get("title") or c.get("name") or c.get("Category") or c.get("category") or str(cid)
-    cc = dict(c)
-    cc["title"] = title
-    cats_map[cid] = cc
+# id -> catégorie normalisée (clé 'title'), index partagé : lecture seule
+cats_map = CategoryIndex.current().by_id
 
 # En-tête “PJ”
 day_label = st.session_state.get("final_block_export_day")
@@ -81,13 +72,20 @@ if not REPORTLAB_OK:
 
 # ────────────────── Helpers PDF ──────────────────
 def _img_reader(rec: Optional[Dict[str, Any]]) -> Optional[ImageReader]:
-    if not rec or not rec.get("bytes"):
+    view = read_blob(rec)
+    if view is None:
         return None
     try:
-        return ImageReader(io.BytesIO(bytes(rec["bytes"])))
+        # BytesIO partage le buffer de l'objet bytes sous-jacent (pas de copie)
+        return ImageReader(io.BytesIO(view.obj))
     except Exception:
         return None
 
+# logos enregistrés dans data/blobs/ : repli quand le fichier des Settings est absent
+migrate_blobs()
+_stored_logos = {"event": _img_reader(load("final_block_logo")),
+                 "federation": _img_reader(load("final_block_jjif_logo"))}
+
 def _group_by_mat(finals: List[Dict[str, Any]], mats: int) -> Dict[int, List[Dict[str, Any]]]:
     g = {m: [] for m in range(1, mats+1)}
     for f in finals:
@@ -108,10 +106,12 @@ def _offer(pdf_bytes: bytes, filename: str):
             height=920,
         )
 
-def _draw_logo(c: canvas.Canvas, path: str, x: float, y: float, w: float, h: float):
-    if path and os.path.exists(path):
+def _draw_logo(c: canvas.Canvas, path: str, x: float, y: float, w: float, h: float,
+               fallback: Optional[ImageReader] = None):
+    src = path if path and os.path.exists(path) else fallback
+    if src is not None:
         try:
-            c.drawImage(path, x, y, width=w, height=h, preserveAspectRatio=True, mask='auto')
+            c.drawImage(src, x, y, width=w, height=h, preserveAspectRatio=True, mask='auto')
         except Exception:
             pass
 
@@ -128,8 +128,8 @@ def _draw_overview_header(c: canvas.Canvas, page_w: float, page_h: float,
     evt_logo = getattr(cfg, "event_logo", "")
     fed_logo = getattr(cfg, "federation_logo", "")
     
-    _draw_logo(c, evt_logo, 15*mm, logo_y, logo_w, logo_h)
-    _draw_logo(c, fed_logo, page_w - 15*mm - logo_w, logo_y, logo_w, logo_h)
+    _draw_logo(c, evt_logo, 15*mm, logo_y, logo_w, logo_h, _stored_logos["event"])
+    _draw_logo(c, fed_logo, page_w - 15*mm - logo_w, logo_y, logo_w, logo_h, _stored_logos["federation"])
 
     # Text
     current_y = page_h - top_margin
@@ -301,8 +301,8 @@ def _draw_header_block(c: canvas.Canvas, page_w: float, page_h: float,
     
     evt_logo = getattr(cfg, "event_logo", "")
     fed_logo = getattr(cfg, "federation_logo", "")
-    _draw_logo(c, evt_logo, margin, logo_y, logo_w, logo_h)
-    _draw_logo(c, fed_logo, page_w - margin - logo_w, logo_y, logo_w, logo_h)
+    _draw_logo(c, evt_logo, margin, logo_y, logo_w, logo_h, _stored_logos["event"])
+    _draw_logo(c, fed_logo, page_w - margin - logo_w, logo_y, logo_w, logo_h, _stored_logos["federation"])
 
     # 1. Event
     c.setFont("Helvetica-Bold", 16)
@@ -5,6 +5,7 @@ import streamlit as st
 
 from ui import apply_theme, render_sidebar
 from storage import load, save
+from indexes import CategoryIndex
 
 st.set_page_config(page_title="Distribution Categories — Day", page_icon="🧩", layout="wide")
 apply_theme()
@@ -14,22 +15,8 @@ st.title("🧩 Distribution Categories — Day")
 
 # ---------- Data helpers ----------
 def _load_categories() -> List[Dict[str, Any]]:
-    """Loads categories from finals_categories (priority) or categories.
-       Normalizes the 'title' field from name/Category/category if absent."""
-    cats = load("finals_categories") or load("categories") or []
-    norm = []
-    for c in cats:
-        if not isinstance(c, dict):
-            continue
-        cid = c.get("id") or c.get("cid")
-        if not cid:
-            continue
-        title = c.get("title") or c.get("name") or c.get("Category") or c.get("category") or str(cid)
-        cc = dict(c)
-        cc["id"] = cid
-        cc["title"] = title
-        norm.append(cc)
-    return norm
+    """Categories with normalized 'id' and 'title' (shared index: read-only)."""
+    return CategoryIndex.current().items
 
 def _load_days_meta() -> int:
     meta = load("finals_days_meta") or {}
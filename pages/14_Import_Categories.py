@@ -9,7 +9,10 @@ import pandas as pd
 
 from ui import apply_theme, render_sidebar
 from settings_io import load_settings
-from storage import save
+from storage import save, transaction
+import import_examples
+import upload_cache
+from parsers.categories_csv_parser import KEEP_RX, SEX_RX, read_categories_csv
 
 st.set_page_config(page_title="Import Categories", page_icon="📥", layout="wide")
 
@@ -19,51 +22,49 @@ render_sidebar()
 
 st.title("📥 Import Categories")
 
-KEEP_RX = re.compile(r"(JIU[- ]?JITSU|NE[- ]?WAZA|DUO|SHOW|FIGHTING)", re.IGNORECASE)
-SEX_RX  = re.compile(r"^[mfMF]$")
-
-def _read_csv_first_two_cols(file) -> list[dict]:
-    """CSV → prend strictement les 2 premières colonnes (ID, Title), corrige M/F, filtre catégories plausibles."""
-    raw = file.read()
-    df = None
-    for enc in ("utf-8", "latin-1"):
-        try:
-            text = raw.decode(enc)
-            try:
-                df = pd.read_csv(io.StringIO(text), sep=None, engine="python", header=0)
-            except Exception:
-                df = None
-            if df is None or df.shape[1] < 2:
-                df = pd.read_csv(io.StringIO(text), sep=None, engine="python", header=None)
-            break
-        except Exception:
-            df = None
-    if df is None or df.shape[1] < 2:
-        return []
-
-    df = df.iloc[:, :2].copy()
-    df.columns = ["id", "title"]
-    df["id"] = df["id"].astype(str).str.strip()
-    df["title"] = df["title"].astype(str).str.strip()
-
-    df = df[(df["id"] != "") & (df["title"] != "")]
-    # auto-fix : si title = M/F mais id = vraie catégorie → title = id
-    inv_mask = df["title"].str.match(SEX_RX) & df["id"].str.contains(KEEP_RX)
-    df.loc[inv_mask, "title"] = df.loc[inv_mask, "id"]
-    # supprime lignes où title reste M/F
-    df = df[~df["title"].str.match(SEX_RX)]
-    # garde uniquement les titres plausibles
-    df = df[df["title"].str.contains(KEEP_RX)]
-
-    # dédoublonnage par id
+def _txt_rows(data: bytes) -> list[dict]:
+    """TXT → une catégorie par ligne plausible, id dérivé du titre (dédoublonné)."""
+    lines = data.decode("utf-8", errors="ignore").splitlines()
+    rows = []
     seen = set()
+    for line in lines:
+        t = line.strip()
+        if not t: 
+            continue
+        if SEX_RX.match(t): 
+            continue
+        if not KEEP_RX.search(t):
+            continue
+        cid = re.sub(r"[^a-z0-9]+", "-", t.lower()).strip("-") or "cat"
+        if cid in seen:
+            k = 2; base = cid
+            while f"{base}-{k}" in seen:
+                k += 1
+            cid = f"{base}-{k}"
+        seen.add(cid)
+        rows.append({"id": cid, "title": t})
+    return rows
+
+def _excel_rows(data: bytes, sheet: str = "") -> list[dict]:
+    """XLS/XLSX → colonnes title (ou name) et id optionnel ; id dérivé du titre sinon."""
+    df = pd.read_excel(io.BytesIO(data), sheet_name=(sheet or 0))
+    recs: List[Dict[str, Any]] = df.to_dict(orient="records")
     rows = []
-    for _, r in df.iterrows():
-        cid = r["id"].strip()
-        title = r["title"].strip()
-        if cid and title and cid not in seen:
-            rows.append({"id": cid, "title": title})
-            seen.add(cid)
+    seen = set()
+    for r in recs:
+        title = (r.get("title") or r.get("name") or "").strip()
+        if not title:
+            continue
+        if SEX_RX.match(title) or not KEEP_RX.search(title):
+            continue
+        cid = (r.get("id") or re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-") or "cat").strip()
+        if cid in seen:
+            k = 2; base = cid
+            while f"{base}-{k}" in seen:
+                k += 1
+            cid = f"{base}-{k}"
+        seen.add(cid)
+        rows.append({"id": cid, "title": title})
     return rows
 
 # RESET (facultatif, pratique ici)
@@ -71,9 +72,10 @@ with st.expander("🧹 Reset categories (and clear related)", expanded=False):
     st.warning("This will empty **Categories**, and also clear **Planning** and **Day assignments**.")
     cols = st.columns([1, 1, 3])
     if cols[0].button("🧨 Reset now", use_container_width=True):
-        save("categories", [])
-        save("planning", [])
-        save("finals_days", {})
+        with transaction():
+            save("categories", [])
+            save("planning", [])
+            save("finals_days", {})
         st.success("Reset done.")
         st.rerun()
 
@@ -97,7 +99,7 @@ SHOW-OPEN,Show Open"""
     f = st.file_uploader("Upload CSV", type=["csv"], key="csv_up")
     if f is not None:
         try:
-            rows = _read_csv_first_two_cols(f)
+            rows = upload_cache.parse("categories_csv", f.getvalue(), read_categories_csv)
             if not rows:
                 st.error("No valid rows found (need at least two columns with a real category name).")
             else:
@@ -114,26 +116,7 @@ with tab_txt:
     f = st.file_uploader("Upload TXT", type=["txt"], key="txt_up")
     if f is not None:
         try:
-            lines = f.read().decode("utf-8", errors="ignore").splitlines()
-            rows = []
-            seen = set()
-            for line in lines:
-                t = line.strip()
-                if not t: 
-                    continue
-                if SEX_RX.match(t): 
-                    continue
-                if not KEEP_RX.search(t):
-                    continue
-                cid = re.sub(r"[^a-z0-9]+", "-", t.lower()).strip("-") or "cat"
-                if cid in seen:
-                    k = 2; base = cid
-                    while f"{base}-{k}" in seen:
-                        k += 1
-                    cid = f"{base}-{k}"
-                seen.add(cid)
-                rows.append({"id": cid, "title": t})
-
+            rows = upload_cache.parse("categories_txt", f.getvalue(), _txt_rows)
             cats = [{"id": r["id"], "title": r["title"], "medalists": []} for r in rows]
             if not cats:
                 st.error("No valid lines detected.")
@@ -148,39 +131,9 @@ with tab_txt:
 with tab_xls:
     st.caption("Expected columns: **title** (required), **id** (optional).")
     
-    # Generate example Excel in memory
-    def _get_example_xlsx():
-        data = [
-            {"id": "U16-M-46",   "title": "U16 Male -46kg Jiu-Jitsu"},
-            {"id": "U18-F-52",   "title": "U18 Female -52kg Fighting"},
-            {"id": "ADULT-M-77", "title": "Adult Male -77kg Ne-Waza"},
-            {"id": "DUO-MIX",    "title": "Duo Mixed"},
-            {"id": "SHOW-OPEN",  "title": "Show Open"},
-        ]
-        df_ex = pd.DataFrame(data)
-        buf = io.BytesIO()
-        with pd.ExcelWriter(buf, engine="xlsxwriter") as writer:
-             df_ex.to_excel(writer, index=False, sheet_name="Categories")
-        return buf.getvalue()
-
-    # Note: openpyxl or xlsxwriter must be installed. 
-    # Since pd.read_excel works, openpyxl is likely present.
-    # We'll try using default engine or openpyxl if xlsxwriter is missing, 
-    # but pandas inside streamlit usually handles to_excel if deps are there.
-    # Actually, let's keep it simple: just try default.
-    
     try:
-        # Create a simple valid buffer
-        b_out = io.BytesIO()
-        with pd.ExcelWriter(b_out) as writer:
-            pd.DataFrame([
-                {"id": "U16-M-46",   "title": "U16 Male -46kg Jiu-Jitsu"},
-                {"id": "U18-F-52",   "title": "U18 Female -52kg Fighting"},
-                {"id": "ADULT-M-77", "title": "Adult Male -77kg Ne-Waza"},
-                {"id": "DUO-MIX",    "title": "Duo Mixed"},
-                {"id": "SHOW-OPEN",  "title": "Show Open"},
-            ]).to_excel(writer, index=False)
-        st.download_button("⬇️ Download example XLSX", data=b_out.getvalue(), 
+        # généré une fois par processus (import_examples)
+        st.download_button("⬇️ Download example XLSX", data=import_examples.categories_xlsx(), 
                            file_name="categories_example.xlsx", 
                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
     except Exception as e:
@@ -190,25 +143,8 @@ with tab_xls:
     sheet = st.text_input("Sheet name (optional, leave empty for first sheet)", value="")
     if f is not None:
         try:
-            df = pd.read_excel(f, sheet_name=(sheet or 0))
-            recs: List[Dict[str, Any]] = df.to_dict(orient="records")
-            rows = []
-            seen = set()
-            for r in recs:
-                title = (r.get("title") or r.get("name") or "").strip()
-                if not title:
-                    continue
-                if SEX_RX.match(title) or not KEEP_RX.search(title):
-                    continue
-                cid = (r.get("id") or re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-") or "cat").strip()
-                if cid in seen:
-                    k = 2; base = cid
-                    while f"{base}-{k}" in seen:
-                        k += 1
-                    cid = f"{base}-{k}"
-                seen.add(cid)
-                rows.append({"id": cid, "title": title})
-
+            rows = upload_cache.parse("categories_excel", f.getvalue(),
+                                      lambda data: _excel_rows(data, sheet), options=(sheet,))
             cats = [{"id": r["id"], "title": r["title"], "medalists": []} for r in rows]
             if not cats:
                 st.error("No valid rows found.")
@@ -0,0 +1,74 @@
+import codecs
+import csv
+import io
+import re
+from typing import Dict, List, Tuple
+
+# Titres de catégories plausibles / colonne sexe seule (M/F)
+KEEP_RX = re.compile(r"(?:JIU[- ]?JITSU|NE[- ]?WAZA|DUO|SHOW|FIGHTING)", re.IGNORECASE)
+SEX_RX = re.compile(r"^[mfMF]$")
+
+SNIFF_BYTES = 64 * 1024
+DELIMITERS = ",;\t|"
+
+
+def sniff(raw: bytes) -> Tuple[str, str, str]:
+    """
+    (encodage, séparateur, guillemet) déduits des SNIFF_BYTES premiers octets, une seule fois.
+    Encodage : utf-8 (BOM retiré) si l'échantillon est valide, sinon latin-1.
+    """
+    head = raw[:SNIFF_BYTES]
+    if head.startswith(codecs.BOM_UTF8):
+        encoding = "utf-8-sig"
+    else:
+        encoding = "utf-8"
+    try:
+        # final=False : un caractère coupé en fin d'échantillon n'est pas une erreur
+        text = codecs.getincrementaldecoder(encoding)().decode(head, final=False)
+    except UnicodeDecodeError:
+        encoding = "latin-1"
+        text = head.decode(encoding)
+    if len(raw) > SNIFF_BYTES and "\n" in text:
+        text = text[: text.rindex("\n")]  # lignes complètes seulement
+    try:
+        dialect = csv.Sniffer().sniff(text, delimiters=DELIMITERS)
+        return encoding, dialect.delimiter, dialect.quotechar or '"'
+    except csv.Error:
+        return encoding, ",", '"'
+
+
+def read_categories_csv(raw: bytes) -> List[Dict[str, str]]:
+    """
+    CSV -> [{"id", "title"}] : strictement les 2 premières colonnes (ID, Title).
+      - en-tête facultatif : une ligne d'en-tête ("id,title") n'a pas de titre plausible et part au filtre
+      - auto-fix : title = M/F mais id = vraie catégorie -> title = id
+      - garde les titres plausibles (KEEP_RX), dédoublonne par id (première occurrence)
+    Moteur C de pandas, usecols=[0, 1], tout en texte (pas de "nan").
+    """
+    import pandas as pd
+
+    if not raw:
+        return []
+    encoding, sep, quotechar = sniff(raw)
+
+    def read(enc: str):
+        return pd.read_csv(io.BytesIO(raw), sep=sep, quotechar=quotechar, header=None, usecols=[0, 1],
+                           dtype=str, keep_default_na=False, encoding=enc,
+                           engine="c", skip_blank_lines=True)
+    try:
+        try:
+            df = read(encoding)
+        except UnicodeDecodeError:  # utf-8 valide au début, pas plus loin
+            df = read("latin-1")
+    except (ValueError, pd.errors.ParserError):  # moins de 2 colonnes, fichier illisible
+        return []
+
+    df.columns = ["id", "title"]
+    df["id"] = df["id"].str.strip()
+    df["title"] = df["title"].str.strip()
+    df = df[(df["id"] != "") & (df["title"] != "")]
+    inv_mask = df["title"].str.match(SEX_RX) & df["id"].str.contains(KEEP_RX)
+    df.loc[inv_mask, "title"] = df.loc[inv_mask, "id"]
+    df = df[~df["title"].str.match(SEX_RX) & df["title"].str.contains(KEEP_RX)]
+    df = df.drop_duplicates(subset="id", keep="first")
+    return df.to_dict(orient="records")
@@ -0,0 +1,161 @@
+import io
+import os
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Import par lots : plusieurs exports (un par tapis), ou un .zip, analysés en parallèle
+# dans des processus séparés avec les parsers existants (TXT JJIF et tableaux).
+TEXT_EXT = (".txt",)
+CSV_EXT = (".csv",)
+EXCEL_EXT = (".xlsx", ".xls")
+SUPPORTED_EXT = TEXT_EXT + CSV_EXT + EXCEL_EXT
+MAX_MEMBER_BYTES = 100 * 1024 * 1024  # membre de zip plus gros : ignoré (archive piégée)
+
+
+def file_kind(name: str) -> str:
+    """'txt' / 'csv' / 'excel', ou "" si l'extension n'est pas reconnue."""
+    ext = os.path.splitext(name.lower())[1]
+    if ext in TEXT_EXT:
+        return "txt"
+    if ext in CSV_EXT:
+        return "csv"
+    if ext in EXCEL_EXT:
+        return "excel"
+    return ""
+
+
+def expand_uploads(files: Sequence[Tuple[str, bytes]]) -> Tuple[List[Tuple[str, bytes]], List[str]]:
+    """
+    [(nom, octets)] -> ([(nom, octets)] triés par nom, [fichiers ignorés]).
+    Les .zip sont dépliés : "lot.zip/tapis1.txt". Ordre stable quel que soit l'ordre d'envoi.
+    """
+    out: List[Tuple[str, bytes]] = []
+    skipped: List[str] = []
+    for name, data in files:
+        if name.lower().endswith(".zip"):
+            try:
+                with zipfile.ZipFile(io.BytesIO(data)) as zf:
+                    for info in zf.infolist():
+                        member = info.filename
+                        if info.is_dir() or member.startswith("__MACOSX/") or os.path.basename(member).startswith("."):
+                            continue
+                        label = f"{name}/{member}"
+                        if not file_kind(member) or info.file_size > MAX_MEMBER_BYTES:
+                            skipped.append(label)
+                            continue
+                        out.append((label, zf.read(info)))
+            except zipfile.BadZipFile:
+                skipped.append(name)
+        elif file_kind(name):
+            out.append((name, data))
+        else:
+            skipped.append(name)
+    out.sort(key=lambda f: f[0].lower())
+    return out, skipped
+
+
+def parse_file(name: str, data: bytes) -> Dict[str, Any]:
+    """
+    Analyse UN fichier (exécuté dans un processus du pool : arguments et retour picklables).
+    Retour : {"file", "kind", "categories": [...], "stats": {...}, "error": "" | message, "seconds"}
+    """
+    t0 = time.perf_counter()
+    kind = file_kind(name)
+    report: Dict[str, Any] = {"file": name, "kind": kind, "categories": [], "stats": {}, "error": ""}
+    try:
+        if kind == "txt":
+            from parsers.results_txt_parser import parse_results_txt_with_stats
+            cats, stats = parse_results_txt_with_stats(data.decode("utf-8", errors="replace"))
+            report["categories"], report["stats"] = cats, stats
+        elif kind in ("csv", "excel"):
+            import pandas as pd
+            from parsers.results_table_parser import parse_results_dataframe
+            if kind == "csv":
+                # séparateur détecté (virgule, point-virgule, tabulation : exports Sportdata)
+                df = pd.read_csv(io.BytesIO(data), sep=None, engine="python")
+            else:
+                df = pd.read_excel(io.BytesIO(data))
+            report["categories"] = parse_results_dataframe(df)
+            report["stats"] = {"rows": int(len(df))}
+        else:
+            report["error"] = "unsupported file type"
+    except Exception as e:
+        report["error"] = f"{type(e).__name__}: {e}"
+    report["seconds"] = round(time.perf_counter() - t0, 3)
+    return report
+
+
+def merge_categories(reports: Sequence[Dict[str, Any]]) -> Tuple[List[Dict], Dict[str, int]]:
+    """
+    Fusionne les catégories des fichiers, dans l'ordre des fichiers puis du fichier.
+    Même catégorie (même id, ou titre) dans plusieurs fichiers : place de la première
+    apparition, médaillés du DERNIER fichier (export corrigé / plus récent).
+    Retour : (catégories, {"categories", "medalists", "duplicates"}).
+    """
+    from parsers.results_table_parser import slugify
+    merged: Dict[str, Dict] = {}
+    duplicates = 0
+    for rep in reports:
+        for cat in rep.get("categories") or []:
+            title = (cat.get("title") or "").strip()
+            key = (cat.get("id") or "").strip() or slugify(title)
+            if key in merged:
+                duplicates += 1
+            merged[key] = dict(cat, medalists=list(cat.get("medalists") or []))
+    cats = list(merged.values())
+    return cats, {
+        "categories": len(cats),
+        "medalists": sum(len(c["medalists"]) for c in cats),
+        "duplicates": duplicates,
+    }
+
+
+def parse_batch(files: Sequence[Tuple[str, bytes]], max_workers: Optional[int] = None,
+                on_progress: Optional[Callable[[int, int, Dict[str, Any]], None]] = None
+                ) -> Tuple[List[Dict], List[Dict[str, Any]], Dict[str, int]]:
+    """
+    Analyse tous les fichiers (zip dépliés) et renvoie (catégories fusionnées, rapports, totaux).
+    Rapports dans l'ordre des fichiers (sans "categories", avec "n_categories" / "n_medalists").
+    Pool de processus "spawn" (sûr depuis le serveur Streamlit multi-thread) ; un seul
+    fichier, ou pool indisponible : analyse dans le processus courant.
+    on_progress(fait, total, rapport) est appelé à chaque fichier terminé.
+    """
+    items, skipped = expand_uploads(files)
+    total = len(items)
+    reports: List[Optional[Dict[str, Any]]] = [None] * total
+
+    def done(i: int, rep: Dict[str, Any]) -> None:
+        reports[i] = rep
+        if on_progress:
+            on_progress(sum(r is not None for r in reports), total, rep)
+
+    workers = min(max_workers or os.cpu_count() or 1, total)
+    if workers > 1:
+        try:
+            import multiprocessing
+            ctx = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+                futures = {pool.submit(parse_file, name, data): i for i, (name, data) in enumerate(items)}
+                for fut in as_completed(futures):
+                    done(futures[fut], fut.result())
+        except Exception:
+            pass  # pool cassé (environnement restreint) : on termine en séquentiel
+    for i, (name, data) in enumerate(items):
+        if reports[i] is None:
+            done(i, parse_file(name, data))
+
+    cats, totals = merge_categories(reports)
+    out: List[Dict[str, Any]] = []
+    for rep in reports:
+        rep = dict(rep)
+        parsed = rep.pop("categories")
+        rep["n_categories"] = len(parsed)
+        rep["n_medalists"] = sum(len(c.get("medalists") or []) for c in parsed)
+        out.append(rep)
+    out.extend({"file": name, "kind": "", "stats": {}, "error": "skipped (unsupported or unreadable)",
+                "seconds": 0.0, "n_categories": 0, "n_medalists": 0} for name in skipped)
+    totals["files"] = total
+    totals["skipped"] = len(skipped)
+    return cats, out, totals
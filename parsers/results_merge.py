@@ -0,0 +1,70 @@
+import hashlib
+from typing import Any, Dict, List, Sequence, Tuple
+
+# Fusion incrémentale des résultats importés : chaque catégorie a une empreinte
+# (hash des médaillés triés) ; seules les catégories dont l'empreinte change sont modifiées.
+
+
+def _medalist_key(m: Dict[str, Any]) -> Tuple[int, str, str, str]:
+    try:
+        rank = int(m.get("rank", 99))
+    except (TypeError, ValueError):
+        rank = 99
+    return (rank, str(m.get("name") or "").strip(), str(m.get("nation") or "").strip(),
+            str(m.get("club") or "").strip())
+
+
+def fingerprint(cat: Dict[str, Any]) -> str:
+    """Empreinte des médaillés : hash des tuples (rank, name, nation, club) triés.
+    Indépendante de l'ordre des lignes, de "1" vs 1 et d'un "club" absent vs vide."""
+    h = hashlib.blake2b(digest_size=16)
+    for t in sorted(_medalist_key(m) for m in (cat.get("medalists") or []) if isinstance(m, dict)):
+        h.update("\x1f".join(map(str, t)).encode("utf-8"))
+        h.update(b"\x1e")
+    return h.hexdigest()
+
+
+def _key(cat: Dict[str, Any]) -> str:
+    return (cat.get("id") or cat.get("title") or "").strip()
+
+
+def merge_results(existing: Sequence[Dict[str, Any]], incoming: Sequence[Dict[str, Any]]
+                  ) -> Tuple[List[Dict[str, Any]], Dict[str, List[str]]]:
+    """
+    Fusionne des catégories importées (normalisées) dans la liste existante.
+    Correspondance par id (ou titre) ; catégorie existante : médaillés (et titre) remplacés
+    seulement si l'empreinte ou le titre diffère ; nouvelle catégorie : ajoutée à la fin.
+    Retour : (catégories, {"added": [ids], "changed": [ids], "unchanged": [ids]}).
+    Si added et changed sont vides, la liste renvoyée est identique à l'existante (rien à écrire).
+    """
+    cats = list(existing or [])
+    index: Dict[str, int] = {}
+    for i, c in enumerate(cats):
+        k = _key(c)
+        if k:
+            index[k] = i
+    report: Dict[str, List[str]] = {"added": [], "changed": [], "unchanged": []}
+    for inc in incoming or []:
+        k = _key(inc)
+        if k in index:
+            i = index[k]
+            cur = cats[i]
+            title = inc.get("title") or cur.get("title")
+            if fingerprint(cur) == fingerprint(inc) and title == cur.get("title"):
+                report["unchanged"].append(k)
+                continue
+            upd = dict(cur, medalists=inc.get("medalists") or [])
+            if title:
+                upd["title"] = title
+            cats[i] = upd
+            report["changed"].append(k)
+        else:
+            if k:
+                index[k] = len(cats)
+            cats.append(inc)
+            report["added"].append(k)
+    return cats, report
+
+
+def has_changes(report: Dict[str, List[str]]) -> bool:
+    return bool(report.get("added") or report.get("changed"))
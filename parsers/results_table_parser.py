@@ -0,0 +1,90 @@
+import re
+from typing import Any, Dict, List
+
+# Colonnes reconnues (noms comparés en minuscules, sans espaces autour)
+COLUMN_ALIASES = {
+    "category": ["category", "cat", "title", "division"],
+    "rank": ["rank", "place", "pos", "position", "order"],
+    "name": ["name", "athlete", "competitor"],
+    "nation": ["nation", "country", "ioc", "team"],
+    "club": ["club", "school"],
+}
+REQUIRED_COLUMNS = ("category", "rank", "name")
+
+_slug_re = re.compile(r"[^A-Za-z0-9]+")
+
+
+class MissingColumnsError(ValueError):
+    """Le tableau n'a pas les colonnes Category / Rank / Name."""
+
+
+def slugify(s: str) -> str:
+    """Id de catégorie : 'Adults -62 kg' -> 'ADULTS_62_KG'."""
+    s = (s or "").strip()
+    s = _slug_re.sub("_", s.upper()).strip("_")
+    return s or "CAT"
+
+
+def map_columns(columns) -> Dict[str, int]:
+    """{"category": <position de la colonne>, "rank": ..., ...} — première colonne qui correspond."""
+    lowered = [str(c).strip().lower() for c in columns]
+    found: Dict[str, int] = {}
+    for target, candidates in COLUMN_ALIASES.items():
+        pos = next((i for i, c in enumerate(lowered) if c in candidates), None)
+        if pos is not None:
+            found[target] = pos
+    return found
+
+
+def _text(col) -> Any:
+    """Colonne -> texte nettoyé ; NaN et "nan" littéral -> ""."""
+    s = col.fillna("").astype(str).str.strip()
+    return s.mask(s.str.lower() == "nan", "")
+
+
+def parse_results_dataframe(df) -> List[Dict]:
+    """
+    Tableau de résultats (CSV / Excel / Sportdata) -> [{"title","id","medalists":[...]}, ...]
+    Colonnes : Category, Rank, Name (obligatoires), Nation, Club (optionnelles), alias dans COLUMN_ALIASES.
+    Traitement par colonnes entières (pas de boucle par ligne pandas) :
+      - rang : to_numeric sur la colonne, tronqué en entier ; non numérique -> 99
+      - lignes sans catégorie ou sans nom ignorées
+      - catégories dans l'ordre de première apparition, médaillés dans l'ordre du fichier
+    Lève MissingColumnsError s'il manque une colonne obligatoire.
+    """
+    import numpy as np
+    import pandas as pd
+
+    cols = map_columns(df.columns)
+    if any(k not in cols for k in REQUIRED_COLUMNS):
+        found = [str(c).strip().lower() for c in df.columns]
+        raise MissingColumnsError(f"Missing required columns. Found: {found}. Need at least: Category, Rank, Name.")
+
+    def column(key):
+        return df.iloc[:, cols[key]]  # par position : colonnes en double sans ambiguïté
+
+    cat = _text(column("category"))
+    name = _text(column("name"))
+    keep = (cat != "") & (name != "")
+    if not keep.any():
+        return []
+
+    rank = pd.to_numeric(column("rank"), errors="coerce").astype("float64")
+    # hors int64 (ex. 1e30), astype boucle vers -2**63 et trierait en tête : 99 comme NaN
+    in_range = np.isfinite(rank) & (rank >= -2.0**63) & (rank < 2.0**63)
+    rank = rank.where(in_range, 99).astype("int64")  # int() tronque vers 0, comme astype
+
+    empty = pd.Series("", index=df.index)
+    nation = _text(column("nation")) if "nation" in cols else empty
+    club = _text(column("club")) if "club" in cols else empty
+
+    cat, rank, name, nation, club = (s[keep] for s in (cat, rank, name, nation, club))
+    # numéro de groupe dans l'ordre de première apparition
+    group = cat.groupby(cat, sort=False).ngroup()
+    titles = cat.drop_duplicates().tolist()
+
+    results = [{"title": t, "id": slugify(t), "medalists": []} for t in titles]
+    buckets = [r["medalists"] for r in results]
+    for g, r, n, nat, cl in zip(group.tolist(), rank.tolist(), name.tolist(), nation.tolist(), club.tolist()):
+        buckets[g].append({"rank": r, "name": n, "nation": nat, "club": cl})
+    return results
@@ -1,25 +1,25 @@
+import codecs
+import io
 import re
-from typing import List, Dict, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 # Catégories valides (ligne de titre)
 CAT_RE = re.compile(r"^(ADULTS|U21|U18|U16|U14|MASTER)\b", re.IGNORECASE)
 
-# Ligne podium : 1/2/3 + au moins un espace + première lettre (nom qui suit)
-RANK_START_RE = re.compile(r"^[123]\s+[A-Za-zÀ-ÖØ-öø-ÿ]")
-
-# Variante "large" : rank + corps + (IOC optionnel)
-LINE_CORE_RE = re.compile(r"^(?P<rank>[123])\s+(?P<body>.+?)(?:\s+(?P<ioc>[A-Z]{3}))?\s*$")
-
-# Aide au nettoyage
-MULTI_SPACE_RE = re.compile(r"\s{2,}")
-SLASH_RE = re.compile(r"\s*/\s*")
-IOC_AT_END_RE = re.compile(r"\b([A-Z]{3})\b$")
+# Ligne podium, en UNE seule expression :
+#   rang 1/2/3 + espaces + nom commençant par une lettre + IOC optionnel (3 majuscules en fin de ligne)
+# Le corps est non gourmand : l'IOC final, s'il existe, n'est jamais avalé par le nom.
+# Une ligne "1/2/3 ..." qui ne correspond pas (ex: "1 (2025-...)", "1 / 1") est ignorée et comptée.
+MEDALIST_RE = re.compile(
+    r"^(?P<rank>[123])\s+(?P<body>[A-Za-zÀ-ÖØ-öø-ÿ].*?)(?:\s+(?P<ioc>[A-Z]{3}))?\s*$"
+)
+_RANKS = {"1": 1, "2": 2, "3": 3}
 
 
 def _clean_name(text: str) -> str:
     """Nettoie le nom (espaces multiples, slashs) sans changer la casse."""
-    text = MULTI_SPACE_RE.sub(" ", text.strip())
-    text = SLASH_RE.sub(" / ", text)
+    if "/" in text:
+        text = text.replace("/", " / ")
     return " ".join(text.split())
 
 
@@ -29,111 +29,63 @@ def _parse_medalist_line(line: str):
     record_dict = {"rank":int, "name":str, "nation":str}
     had_ioc = True si un IOC AAA était présent, False sinon.
     """
-    m = LINE_CORE_RE.match(line)
-    if m:
-        try:
-            rank = int(m.group("rank"))
-        except Exception:
-            return {}, False
-        body = _clean_name(m.group("body") or "")
-        if not body or not re.match(r"^[A-Za-zÀ-ÖØ-öø-ÿ]", body):
-            return {}, False
-        ioc = (m.group("ioc") or "").strip()
-        return {"rank": rank, "name": body, "nation": ioc}, bool(ioc)
-
-    # Fallback (colonnes irrégulières)
-    parts = re.split(r"\s{2,}|\t", line.strip())
-    if not parts:
-        return {}, False
-
-    first = parts[0]
-    if not first or first[0] not in "123":
+    m = MEDALIST_RE.match(line.strip())
+    if not m:
         return {}, False
+    rank, body, ioc = m.group("rank", "body", "ioc")
+    ioc = ioc or ""
+    return {"rank": _RANKS[rank], "name": _clean_name(body), "nation": ioc}, bool(ioc)
 
-    # Tenter IOC à la toute fin (optionnel)
-    ioc = ""
-    m_ioc = IOC_AT_END_RE.search(line)
-    if m_ioc:
-        ioc = m_ioc.group(1)
 
-    # Retirer l'IOC final du body si présent
-    body = line.strip()
-    if ioc:
-        body = re.sub(rf"\s+{ioc}\s*$", "", body)
-
-    # Retirer le rang initial
-    body = re.sub(r"^[123]\s+", "", body).strip()
-    body = _clean_name(body)
-
-    if not body or not re.match(r"^[A-Za-zÀ-ÖØ-öø-ÿ]", body):
-        return {}, False
-
-    try:
-        rank = int(first.strip()[0])
-    except Exception:
-        return {}, False
-
-    return {"rank": rank, "name": body, "nation": ioc}, bool(ioc)
-
-
-def parse_results_txt_with_stats(content: str) -> Tuple[List[Dict], Dict[str, int]]:
-    """
-    Parse un export JJIF et renvoie (categories, stats)
-      categories: [{"title": "...", "medalists":[{"rank":1,"name":"...","nation":"FRA"}, ...]}, ...]
-      stats: {
-        "lines_rank_like": <nb de lignes qui commencent par 1/2/3>,
-        "ignored_invalid_after_rank": <nb ignorées car pas de lettre après le rang>,
-        "imported_medalists": <nb de médaillés ajoutés>,
-        "no_ioc": <nb de médaillés importés sans IOC>
-      }
-    Règles :
-      - Catégorie: ligne commençant par ADULTS/U21/U18/U16/U14/MASTER
-      - Podium: ligne commençant par 1/2/3 puis une lettre (sinon ignorée et comptée)
-      - IOC en fin de ligne optionnel (nation="" si absent)
-      - On ENREGISTRE la catégorie même sans médaillés
-    """
-    categories: List[Dict] = []
-    current_cat: Dict = None
-    medalists: List[Dict] = []
-
-    stats = {
+def new_stats() -> Dict[str, int]:
+    """Compteurs mis à jour au fil du parsing (voir parse_results_txt_with_stats)."""
+    return {
         "lines_rank_like": 0,
         "ignored_invalid_after_rank": 0,
         "imported_medalists": 0,
         "no_ioc": 0,
+        "categories": 0,
+        "bytes_read": 0,
     }
 
-    for raw in content.splitlines():
+
+def _iter_categories(lines: Iterable[str], stats: Dict[str, int]) -> Iterator[Dict]:
+    """Cœur du parser : produit chaque catégorie dès que son bloc est fermé
+    (ligne de catégorie suivante ou fin du flux)."""
+    current_cat: Optional[Dict] = None
+    medalists: List[Dict] = []
+    match_cat, match_medalist = CAT_RE.match, MEDALIST_RE.match  # lookups locaux (boucle chaude)
+
+    for raw in lines:
         line = raw.strip()
         if not line:
             continue
 
         # Nouvelle catégorie
-        if CAT_RE.match(line):
+        if match_cat(line):
             # Flush précédente
             if current_cat is not None:
                 current_cat["medalists"] = medalists
-                categories.append(current_cat)
+                stats["categories"] += 1
+                yield current_cat
             current_cat = {"title": line.strip(), "medalists": []}
             medalists = []
             continue
 
         # Lignes podium
-        if line and line[0] in "123":
+        if line[0] in "123":
             stats["lines_rank_like"] += 1
-            if not RANK_START_RE.match(line):
+            m = match_medalist(line)
+            if m is None:
                 # ex: "1 (2025-...)" ou "1 / 1" -> ignorer + compter
                 stats["ignored_invalid_after_rank"] += 1
                 continue
-            rec, had_ioc = _parse_medalist_line(line)
-            if rec:
-                medalists.append(rec)
-                stats["imported_medalists"] += 1
-                if not had_ioc:
-                    stats["no_ioc"] += 1
-            else:
-                # échec de parsing malgré le préfiltre
-                stats["ignored_invalid_after_rank"] += 1
+            rank, body, ioc = m.group("rank", "body", "ioc")
+            if ioc is None:
+                ioc = ""
+                stats["no_ioc"] += 1
+            medalists.append({"rank": _RANKS[rank], "name": _clean_name(body), "nation": ioc})
+            stats["imported_medalists"] += 1
             continue
 
         # Autres -> ignorées
@@ -141,8 +93,69 @@ def parse_results_txt_with_stats(content: str) -> Tuple[List[Dict], Dict[str, in
     # Dernière catégorie (même si 0 médaillés)
     if current_cat is not None:
         current_cat["medalists"] = medalists
-        categories.append(current_cat)
+        stats["categories"] += 1
+        yield current_cat
+
+
+def _iter_lines(fileobj: Any, stats: Dict[str, int], encoding: str, errors: str,
+                chunk_size: int) -> Iterator[str]:
+    """Lignes d'un flux binaire, décodé par morceaux (mêmes coupures que str.splitlines)."""
+    if isinstance(fileobj, io.TextIOBase):
+        for line in fileobj:
+            stats["bytes_read"] += len(line)
+            yield line
+        return
+    decoder = codecs.getincrementaldecoder(encoding)(errors=errors)
+    tail = ""
+    while True:
+        chunk = fileobj.read(chunk_size)
+        final = not chunk
+        if not final:
+            stats["bytes_read"] += len(chunk)
+        text = tail + decoder.decode(chunk or b"", final=final)
+        parts = text.splitlines(keepends=True)
+        # dernière ligne sans fin de ligne : incomplète, on la garde pour le morceau suivant
+        tail = parts.pop() if parts and not final and parts[-1].splitlines()[0] == parts[-1] else ""
+        for line in parts:
+            yield line
+        if final:
+            return
+
+
+def iter_results_txt(fileobj: Any, stats: Optional[Dict[str, int]] = None, encoding: str = "utf-8",
+                     errors: str = "replace", chunk_size: int = 1 << 16) -> Iterator[Dict]:
+    """
+    Version streaming de parse_results_txt_with_stats pour un fichier (binaire ou texte) :
+    décode par morceaux de `chunk_size` octets et produit chaque catégorie dès que son
+    bloc est fermé ; la mémoire ne dépend pas de la taille du fichier.
+    `stats` (voir new_stats) est mis à jour en continu, y compris "bytes_read"
+    pour une barre de progression.
+    """
+    if stats is None:
+        stats = new_stats()
+    return _iter_categories(_iter_lines(fileobj, stats, encoding, errors, chunk_size), stats)
+
 
+def parse_results_txt_with_stats(content: str) -> Tuple[List[Dict], Dict[str, int]]:
+    """
+    Parse un export JJIF et renvoie (categories, stats)
+      categories: [{"title": "...", "medalists":[{"rank":1,"name":"...","nation":"FRA"}, ...]}, ...]
+      stats: {
+        "lines_rank_like": <nb de lignes qui commencent par 1/2/3>,
+        "ignored_invalid_after_rank": <nb ignorées car pas de lettre après le rang>,
+        "imported_medalists": <nb de médaillés ajoutés>,
+        "no_ioc": <nb de médaillés importés sans IOC>,
+        "categories": <nb de catégories>,
+        "bytes_read": <0 ici ; renseigné par iter_results_txt>
+      }
+    Règles :
+      - Catégorie: ligne commençant par ADULTS/U21/U18/U16/U14/MASTER
+      - Podium: ligne commençant par 1/2/3 puis une lettre (sinon ignorée et comptée)
+      - IOC en fin de ligne optionnel (nation="" si absent)
+      - On ENREGISTRE la catégorie même sans médaillés
+    """
+    stats = new_stats()
+    categories = list(_iter_categories(content.splitlines(), stats))
     return categories, stats
 
 
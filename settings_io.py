@@ -1,11 +1,12 @@
 # settings_io.py
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import Any, Dict
 
+import codec
+
 APP_ROOT = Path(__file__).parent
 DATA_DIR = APP_ROOT / "data"
 DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -34,6 +35,10 @@ class Settings:
     vip_show_photos: bool = True
     hostess_show_photos: bool = True
 
+    # Images envoyées (photos VIP, logos) : normalisées à l'import (images.ingest_image)
+    image_max_px: int = 1600    # plus grand côté, en pixels
+    image_quality: int = 85     # qualité JPEG / WebP (40-95)
+
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
@@ -44,7 +49,7 @@ def _read_json_safe(path: Path) -> Dict[str, Any]:
     if not path.exists():
         return {}
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = codec.loads(path.read_bytes())
         return data if isinstance(data, dict) else {}
     except Exception:
         return {}
@@ -52,7 +57,7 @@ def _read_json_safe(path: Path) -> Dict[str, Any]:
 
 def _atomic_write_json(path: Path, payload: Dict[str, Any]) -> None:
     tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    tmp.write_bytes(codec.dumps(payload))
     tmp.replace(path)
 
 
@@ -80,6 +85,14 @@ def _coerce_types(raw: Dict[str, Any]) -> Dict[str, Any]:
         out["cycle_seconds"] = int(r.get("cycle_seconds", 10))
     except Exception:
         out["cycle_seconds"] = 10
+    try:
+        out["image_max_px"] = min(8000, max(256, int(r.get("image_max_px", 1600))))
+    except Exception:
+        out["image_max_px"] = 1600
+    try:
+        out["image_quality"] = min(95, max(40, int(r.get("image_quality", 85))))
+    except Exception:
+        out["image_quality"] = 85
 
     # strings
     out["competition_name"]    = str(r.get("competition_name", ""))
@@ -0,0 +1,53 @@
+from __future__ import annotations
+# static_assets.py
+# Publication des images dans static/ (servi par Streamlit sous app/static/, voir
+# .streamlit/config.toml : enableStaticServing). Nom de fichier = hash du contenu : une URL
+# ne change jamais de contenu, le navigateur peut la garder en cache (ETag / Last-Modified)
+# au lieu de recevoir un data: URI base64 (+33 %) à chaque rerun.
+# Service statique désactivé : repli sur les data URI (comportement d'avant).
+import base64, hashlib, os, threading
+from pathlib import Path
+
+APP_ROOT = Path(__file__).resolve().parent
+STATIC_DIR = APP_ROOT / "static"   # à côté de Home.py (script principal)
+URL_PREFIX = "app/static/"         # relatif : fonctionne aussi avec server.baseUrlPath
+
+_EXT = {"image/png": ".png", "image/jpeg": ".jpg", "image/webp": ".webp", "image/gif": ".gif",
+        "image/svg+xml": ".svg"}
+_MIME = {v: k for k, v in _EXT.items()}
+_MIME[".jpeg"] = "image/jpeg"
+
+def static_enabled() -> bool:
+    """server.enableStaticServing (lu dans la config Streamlit) ; False hors Streamlit."""
+    try:
+        import streamlit as st
+        return bool(st.get_option("server.enableStaticServing"))
+    except Exception:
+        return False
+
+def mime_of(path: Path) -> str:
+    return _MIME.get(Path(path).suffix.lower(), "image/png")
+
+def data_uri(data: bytes, mime: str) -> str:
+    return f"data:{mime};base64,{base64.b64encode(data).decode('ascii')}"
+
+def publish_bytes(data: bytes, mime: str) -> str:
+    """Copie dans static/<sha256[:20]><ext> (si absent) et renvoie l'URL."""
+    name = hashlib.sha256(data).hexdigest()[:20] + _EXT.get(mime, ".bin")
+    target = STATIC_DIR / name
+    if not target.exists():
+        STATIC_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = STATIC_DIR / f".{name}.tmp.{os.getpid()}_{threading.get_ident()}"
+        tmp.write_bytes(data)
+        os.replace(tmp, target)
+    return URL_PREFIX + name
+
+def bytes_src(data: bytes, mime: str) -> str:
+    """Valeur de src="" pour des octets en mémoire (vignette dérivée, etc.) : URL statique
+    hashée, ou data URI en repli."""
+    if static_enabled():
+        try:
+            return publish_bytes(data, mime)
+        except OSError:
+            pass
+    return data_uri(data, mime)
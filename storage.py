@@ -1,13 +1,17 @@
 from __future__ import annotations
 # storage.py
-import json, os, time, shutil
+import os, time, shutil, marshal, threading, hashlib, queue, atexit, itertools
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import codec
 
 DATA_DIR = Path(__file__).resolve().parent / "data"
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-def _write_json(path: Path, value):
-    """Écrit JSON de façon robuste sous Windows/OneDrive.
+def _write_json(path: Path, value, pretty: bool = False):
+    """Écrit JSON (compact, voir codec.py) de façon robuste sous Windows/OneDrive.
     1) écrit dans un .tmp unique
     2) tente os.replace()
     3) fallback: delete + move
@@ -18,7 +22,8 @@ def _write_json(path: Path, value):
     tmp = path.with_suffix(path.suffix + f".tmp.{os.getpid()}_{int(time.time()*1000)}")
 
     # 1) écrire le JSON dans un .tmp
-    tmp.write_text(json.dumps(value, ensure_ascii=False, indent=2), encoding="utf-8")
+    payload = codec.dumps(value, pretty=pretty)
+    tmp.write_bytes(payload)
 
     # 2) tenter le replace avec retries
     attempts = 6
@@ -43,7 +48,7 @@ def _write_json(path: Path, value):
 
     # 5) dernier recours: écriture non atomique
     try:
-        path.write_text(json.dumps(value, ensure_ascii=False, indent=2), encoding="utf-8")
+        path.write_bytes(payload)
     finally:
         try:
             tmp.unlink(missing_ok=True)
@@ -51,7 +56,8 @@ def _write_json(path: Path, value):
             pass
 
 APP_ROOT = Path(__file__).parent.resolve()
-DATA_DIR = (APP_ROOT / "data").resolve()
+# PODIUM_DATA_DIR : autre dossier de données (benchmarks, essais) sans toucher à data/
+DATA_DIR = Path(os.environ.get("PODIUM_DATA_DIR") or (APP_ROOT / "data")).resolve()
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 _FILES = {
@@ -66,6 +72,7 @@ _FILES = {
     # 👇 nouveaux fichiers
     "finals_days":              DATA_DIR / "finals_days.json",       # { "1":[ids], "2":[ids], ... }
     "finals_days_meta":         DATA_DIR / "finals_days_meta.json",  # { "num_days": int }
+    "assets":                   DATA_DIR / "assets.json",            # manifeste des images (images.ingest_image)
 }
 
 _DEFAULTS: Dict[str, Any] = {
@@ -80,53 +87,672 @@ _DEFAULTS: Dict[str, Any] = {
     # 👇 nouveaux défauts
     "finals_days": {},            # mapping jour -> liste d'IDs de catégories
     "finals_days_meta": {"num_days": 1},
+    "assets": {},                 # chemin relatif -> {sha256, width, height, bytes, ...}
 }
 
 def _read_json(path: Path, default: Any) -> Any:
     if not path.exists():
         return default
     try:
-        text = path.read_text(encoding="utf-8")
-        if not text.strip():
+        data = path.read_bytes()
+        if not data.strip():
             return default
-        return json.loads(text)
+        return codec.loads(data)
     except Exception:
         return default
 
+# ---------------------------
+# Versions : chaque document stocké porte un numéro croissant
+# ---------------------------
+# JSON   : enveloppe {"_version": n, "data": <document>} (un fichier ancien = version 0)
+# SQLite : colonne `version` de la table documents
+def _unwrap(doc: Any) -> Tuple[Any, int]:
+    if isinstance(doc, dict) and len(doc) == 2 and "_version" in doc and "data" in doc:
+        try:
+            return doc["data"], int(doc["_version"] or 0)
+        except (TypeError, ValueError):
+            return doc["data"], 0
+    return doc, 0
+
+# ---------------------------
+# Backend : fichiers JSON (défaut) ou SQLite WAL (PODIUM_STORAGE_BACKEND=sqlite)
+# ---------------------------
+BACKEND = os.environ.get("PODIUM_STORAGE_BACKEND", "json").strip().lower()
+DB_PATH = DATA_DIR / "podium.sqlite3"
+_store = None
+if BACKEND == "sqlite":
+    from storage_sqlite import SqliteStore
+    _store = SqliteStore(DB_PATH)
+    if _store.is_empty():
+        # premier démarrage : on reprend les fichiers JSON existants
+        with _store.transaction():
+            for _k, _p in _FILES.items():
+                _v, _ = _unwrap(_read_json(_p, None))
+                if _v is not None:
+                    _store.put(_k, codec.dumps(_v).decode("utf-8"))
+
+# ---------------------------
+# Verrous inter-processus : data/.locks/<key>.lock
+# ---------------------------
+try:
+    import msvcrt  # Windows
+except ImportError:
+    msvcrt = None
+    import fcntl
+
+LOCKS_DIR = DATA_DIR / ".locks"
+_KEY_LOCKS: Dict[str, threading.RLock] = {}
+_KEY_LOCKS_GUARD = threading.Lock()
+_held = threading.local()  # key -> (profondeur, fichier verrouillé) pour le thread courant
+
+def _lock_file(key: str, timeout: float):
+    LOCKS_DIR.mkdir(parents=True, exist_ok=True)
+    fh = open(LOCKS_DIR / f"{key}.lock", "a+b")
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if msvcrt is not None:
+                fh.seek(0)
+                msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return fh
+        except OSError:
+            if time.monotonic() >= deadline:
+                fh.close()
+                raise TimeoutError(f"Storage lock busy: {key}")
+            time.sleep(0.02)
+
+def _unlock_file(fh) -> None:
+    try:
+        if msvcrt is not None:
+            fh.seek(0)
+            msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+    finally:
+        fh.close()
+
+@contextmanager
+def lock(key: str, timeout: float = 10.0):
+    """Verrou exclusif sur `key`, partagé entre threads ET processus ; ré-entrant dans un thread."""
+    with _KEY_LOCKS_GUARD:
+        rlock = _KEY_LOCKS.setdefault(key, threading.RLock())
+    if not rlock.acquire(timeout=timeout):
+        raise TimeoutError(f"Storage lock busy: {key}")
+    held = getattr(_held, "keys", None)
+    if held is None:
+        held = _held.keys = {}
+    try:
+        if key not in held:
+            held[key] = [0, _lock_file(key, timeout)]
+        held[key][0] += 1
+        try:
+            yield
+        finally:
+            held[key][0] -= 1
+            if held[key][0] == 0:
+                _unlock_file(held.pop(key)[1])
+    finally:
+        rlock.release()
+
+# ---------------------------
+# Cache process (partagé par toutes les sessions Streamlit)
+# ---------------------------
+# key -> (stamp, version, objet sérialisé via marshal)
+#   stamp = (mtime_ns, size) du fichier JSON, ou la version de la ligne SQLite.
+# On garde le JSON déjà parsé sous forme marshal : marshal.loads() est bien plus
+# rapide que relire + décoder le JSON, et chaque appelant reçoit sa PROPRE copie
+# (les pages modifient les listes/dicts en place avant de sauvegarder).
+_CACHE: Dict[str, Tuple[Any, int, bytes]] = {}
+_CACHE_LOCK = threading.Lock()
+
+# Documents tels que lus par load_versioned() : base des fusions 3 voies.
+# key -> {version: blob marshal}, limité aux _BASES_PER_KEY dernières versions
+# (et aux _BASES_PER_KEY derniers jetons d'écriture en attente).
+_BASES: Dict[str, Dict[int, bytes]] = {}
+_BASES_PER_KEY = 8
+
+def _stamp(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+def _copy(value: Any) -> Any:
+    return marshal.loads(marshal.dumps(value))
+
+def _key_stamp(key: str) -> Any:
+    if _store is not None:
+        return _store.version(key)
+    return _stamp(_FILES[key])
+
+def _read_entry(key: str) -> Tuple[Any, int, Any]:
+    """(stamp, version, document) lus ensemble ; document None si absent/illisible."""
+    if _store is not None:
+        row = _store.get(key)
+        if row is None:
+            return None, 0, None
+        try:
+            return row[0], row[0], codec.loads(row[1])
+        except Exception:
+            return row[0], row[0], None
+    # stamp pris AVANT la lecture : au pire on relira au prochain appel
+    stamp = _stamp(_FILES[key])
+    value, version = _unwrap(_read_json(_FILES[key], None))
+    return stamp, version, value
+
+def _cached_entry(key: str) -> Tuple[int, bytes]:
+    """(version, blob marshal) du document courant, relu seulement si le stamp a bougé."""
+    if getattr(_tx, "direct", False):
+        # transaction SQLite en cours : la ligne peut ne pas être validée, jamais en cache
+        _, version, value = _read_entry(key)
+        return version, marshal.dumps(value)
+    stamp = _key_stamp(key)
+    if stamp is None:
+        return 0, marshal.dumps(None)
+    with _CACHE_LOCK:
+        hit = _CACHE.get(key)
+    if hit is None or hit[0] != stamp:
+        stamp, version, value = _read_entry(key)
+        hit = (stamp, version, marshal.dumps(value))
+        with _CACHE_LOCK:
+            _CACHE[key] = hit
+    return hit[1], hit[2]
+
+def _value_of(key: str, blob: bytes) -> Any:
+    value = marshal.loads(blob)
+    return _copy(_DEFAULTS.get(key, None)) if value is None else value
+
+def _remember_base(key: str, version: int, blob: bytes) -> None:
+    with _CACHE_LOCK:
+        bases = _BASES.setdefault(key, {})
+        bases[version] = blob
+        # versions disque et jetons d'attente (négatifs) ont chacun leur quota :
+        # une rafale de sauvegardes ne doit pas évincer la version lue par une autre session
+        same = [v for v in bases if (v < 0) == (version < 0)]
+        for v in same[:-_BASES_PER_KEY]:
+            del bases[v]  # les plus anciennes enregistrées
+
+def _lookup_base(key: str, version: Optional[int]) -> Optional[bytes]:
+    if version is None:
+        return None
+    with _CACHE_LOCK:
+        return _BASES.get(key, {}).get(version)
+
+def invalidate(key: Optional[str] = None) -> None:
+    """Oublie la version en cache de `key` (ou de toutes les clés si None)."""
+    with _CACHE_LOCK:
+        if key is None:
+            _CACHE.clear()
+        else:
+            _CACHE.pop(key, None)
+
+# ---------------------------
+# Fusion 3 voies (conflits de save(..., expected_version))
+# ---------------------------
+_MISSING = object()
+
+def _item_id(item: Any) -> Any:
+    if isinstance(item, dict):
+        return item.get("id") or item.get("category_id")
+    return None
+
+def _by_id(items: Any) -> Optional[Dict[Any, Any]]:
+    """Index id -> élément si `items` est une liste d'objets identifiables sans doublon."""
+    if not isinstance(items, list):
+        return None
+    out = {}
+    for it in items:
+        iid = _item_id(it)
+        if iid is None or iid in out:
+            return None
+        out[iid] = it
+    return out
+
+def _merge3(base: Any, ours: Any, theirs: Any) -> Any:
+    """Applique nos changements (base -> ours) sur la version concurrente (theirs).
+    Dicts : clé par clé ; listes d'objets avec id/category_id : élément par élément ;
+    conflit sur une même valeur : notre écriture l'emporte (dernier écrivain)."""
+    if ours == base:
+        return theirs
+    if theirs == base or theirs == ours:
+        return ours
+    if isinstance(base, dict) and isinstance(ours, dict) and isinstance(theirs, dict):
+        out = {}
+        for k in dict.fromkeys([*theirs, *ours, *base]):
+            v = _merge3(base.get(k, _MISSING), ours.get(k, _MISSING), theirs.get(k, _MISSING))
+            if v is not _MISSING:
+                out[k] = v
+        return out
+    b, o, t = _by_id(base), _by_id(ours), _by_id(theirs)
+    if b is not None and o is not None and t is not None:
+        out = []
+        for iid in dict.fromkeys([*t, *o]):  # ordre concurrent, puis nos ajouts
+            v = _merge3(b.get(iid, _MISSING), o.get(iid, _MISSING), t.get(iid, _MISSING))
+            if v is not _MISSING:
+                out.append(v)
+        return out
+    return ours
+
+# ---------------------------
+# Transactions multi-clés
+# ---------------------------
+_tx = threading.local()  # pending: écritures JSON différées du thread ; direct: transaction SQLite
+# bases: key -> (version, blob) écrits dans la transaction SQLite, enregistrés comme bases
+#        de fusion seulement après le COMMIT (un ROLLBACK réutiliserait ces numéros de version)
+
+@contextmanager
+def transaction():
+    """Regroupe plusieurs save() (écrits de façon synchrone, hors file d'attente) :
+    - SQLite : une seule transaction (tout ou rien) ;
+    - JSON   : écritures différées jusqu'à la fin du bloc, abandonnées si exception
+               (chaque fichier reste remplacé séparément)."""
+    if getattr(_tx, "pending", None) is not None or getattr(_tx, "direct", False):  # bloc imbriqué
+        yield
+        return
+    flush()  # ne pas laisser une écriture différée plus ancienne passer après la transaction
+    if _store is not None:
+        _tx.direct, _tx.bases = True, {}
+        try:
+            with _store.transaction():
+                yield
+            for key, (version, blob) in _tx.bases.items():
+                _remember_base(key, version, blob)
+        finally:
+            touched = _tx.bases
+            _tx.direct, _tx.bases = False, None
+            for key in touched:
+                invalidate(key)
+        return
+    _tx.pending = {}
+    try:
+        yield
+        pending, _tx.pending = _tx.pending, None
+        for key, (value, expected_version) in pending.items():
+            _commit(key, value, expected_version)
+    finally:
+        _tx.pending = None
+
+def _write_doc(key: str, value: Any, current: int) -> bool:
+    """Écrit la version current+1 ; False si SQLite a vu une autre écriture depuis `current`
+    (en JSON, le verrou de clé suffit)."""
+    try:
+        if _store is not None:
+            return _store.put(key, codec.dumps(value).decode("utf-8"), current)
+        _write_json(_FILES[key], {"_version": current + 1, "data": value})
+        return True
+    finally:
+        invalidate(key)
+
+def _commit(key: str, value: Any, expected_version: Optional[int], base: Optional[bytes] = None) -> int:
+    """Écriture sous verrou : compare-and-swap, avec fusion 3 voies en cas de conflit."""
+    with lock(key):
+        while True:
+            # relecture directe (pas le cache) : le stamp seul peut manquer une écriture concurrente
+            _, current, theirs = _read_entry(key)
+            merged = value
+            if expected_version is not None and expected_version != current:
+                if base is None:
+                    base = _lookup_base(key, expected_version)
+                if base is not None:  # document encore absent à la lecture : base = défaut de la clé
+                    merged = _merge3(_value_of(key, base), value,
+                                     _copy(_DEFAULTS.get(key)) if theirs is None else theirs)
+                # base inconnue : impossible de fusionner, notre écriture l'emporte (comportement historique)
+            # SQLite : le verrou de clé ne couvre pas une transaction d'un autre processus
+            # validée entre la relecture et l'écriture -> on relit et on refusionne
+            if _write_doc(key, merged, current):
+                break
+        version = current + 1
+        if getattr(_tx, "direct", False):
+            _tx.bases[key] = (version, marshal.dumps(merged))
+        else:
+            _remember_base(key, version, marshal.dumps(merged))
+    return version
+
+# ---------------------------
+# Écritures différées (write-behind)
+# ---------------------------
+# save() rend la main tout de suite : un thread d'écriture fait le remplacement de fichier
+# (et ses retries OneDrive). Un seul élément en attente par clé : les sauvegardes
+# successives d'une même clé sont regroupées (la dernière gagne, ou fusion 3 voies si elle
+# porte une expected_version) et l'élément garde la base de fusion d'origine.
+# La file ne contient donc jamais plus de ~2 entrées par clé.
+#
+# Une valeur en attente n'a pas encore de version sur disque : load_versioned() et save()
+# renvoient alors un jeton négatif, enregistré comme base de fusion de cette valeur.
+_WRITE_QUEUE: "queue.Queue[str]" = queue.Queue(maxsize=64)
+_PENDING: Dict[str, Dict[str, Any]] = {}  # key -> {"blob", "expected", "base", "seq", "attempts"}
+_TOKENS = itertools.count(1)
+_PENDING_COND = threading.Condition()
+_WRITE_STATUS: Dict[str, Any] = {"writes": 0, "last_write": None, "last_error": None}
+_MAX_ATTEMPTS = 5
+_writer_thread: Optional[threading.Thread] = None
+
+def _ensure_writer() -> None:
+    global _writer_thread
+    with _PENDING_COND:
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(target=_writer_loop, name="storage-writer", daemon=True)
+            _writer_thread.start()
+
+def _after_fork() -> None:
+    # processus enfant : ni le thread d'écriture ni les verrous du parent n'existent ici
+    global _WRITE_QUEUE, _PENDING_COND, _writer_thread, _watch_thread, _KEY_LOCKS_GUARD, _CACHE_LOCK
+    _WRITE_QUEUE = queue.Queue(maxsize=64)
+    _PENDING.clear()
+    _PENDING_COND = threading.Condition()
+    _writer_thread = _watch_thread = None
+    _KEY_LOCKS.clear()
+    _KEY_LOCKS_GUARD = threading.Lock()
+    _CACHE_LOCK = threading.Lock()
+    _held.__dict__.clear()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork)
+
+def _pending_token(key: str, blob: bytes) -> int:
+    token = -next(_TOKENS)
+    _remember_base(key, token, blob)
+    return token
+
+def _enqueue(key: str, value: Any, expected_version: Optional[int]) -> int:
+    _ensure_writer()
+    with _PENDING_COND:
+        item = _PENDING.get(key)
+        is_new = item is None
+        if is_new:
+            item = _PENDING[key] = {"expected": expected_version, "base": _lookup_base(key, expected_version),
+                                    "seq": 0, "attempts": 0}
+        elif expected_version is None:
+            item["expected"] = item["base"] = None  # save() simple : dernier écrivain
+            item["seq"] += 1
+        else:
+            base = _lookup_base(key, expected_version)
+            if base is not None:  # ex. autre session partie de la même version disque
+                value = _merge3(_value_of(key, base), value, marshal.loads(item["blob"]))
+            item["seq"] += 1
+        blob = item["blob"] = marshal.dumps(value)
+        token = _pending_token(key, blob)
+    _bump(key)  # visible tout de suite dans ce processus via load()
+    if is_new:
+        _WRITE_QUEUE.put(key)
+    return token
+
+def _writer_loop() -> None:
+    while True:
+        key = _WRITE_QUEUE.get()
+        try:
+            with _PENDING_COND:
+                item = _PENDING.get(key)
+                if item is None:
+                    continue
+                seq = item["seq"]
+                blob, expected, base = item["blob"], item["expected"], item["base"]
+            error = None
+            try:
+                _commit(key, marshal.loads(blob), expected, base)
+            except Exception as e:
+                error = e
+            requeue = False
+            with _PENDING_COND:
+                if error is None:
+                    _WRITE_STATUS["writes"] += 1
+                    _WRITE_STATUS["last_write"] = time.time()
+                    requeue = item["seq"] != seq  # nouvelle valeur arrivée pendant l'écriture
+                else:
+                    item["attempts"] += 1
+                    _WRITE_STATUS["last_error"] = f"{key}: {error}"
+                    requeue = item["attempts"] < _MAX_ATTEMPTS or item["seq"] != seq
+                if _PENDING.get(key) is not item:
+                    # reset() pendant l'écriture : l'élément n'est plus suivi ; une sauvegarde
+                    # arrivée depuis a son propre élément, déjà dans la file
+                    requeue = False
+                elif not requeue:
+                    del _PENDING[key]
+                _PENDING_COND.notify_all()
+            if requeue:
+                if error is not None:
+                    time.sleep(0.5)
+                _WRITE_QUEUE.put(key)
+        finally:
+            _WRITE_QUEUE.task_done()
+
+def _pending_blob(key: str) -> Optional[bytes]:
+    with _PENDING_COND:
+        item = _PENDING.get(key)
+        return item["blob"] if item is not None else None
+
+def flush(timeout: Optional[float] = None, key: Optional[str] = None) -> bool:
+    """Attend que les écritures différées (de `key`, ou toutes) soient sur disque.
+    Renvoie False si le délai est dépassé."""
+    deadline = None if timeout is None else time.monotonic() + timeout
+    with _PENDING_COND:
+        while (key in _PENDING) if key is not None else _PENDING:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            _PENDING_COND.wait(remaining)
+    return True
+
+def write_status() -> Dict[str, Any]:
+    """État de durabilité : clés pas encore écrites, nombre d'écritures, dernière erreur."""
+    with _PENDING_COND:
+        return {"pending": sorted(_PENDING), **_WRITE_STATUS}
+
+atexit.register(flush, 5.0)
+
+def sweep_tmp(max_age: float = 60.0) -> int:
+    """Supprime les fichiers temporaires abandonnés (*.tmp, *.tmp.<pid>_<ms>) de data/ et data/blobs/."""
+    removed = 0
+    now = time.time()
+    for folder in (DATA_DIR, BLOBS_DIR):
+        if not folder.is_dir():
+            continue
+        for p in folder.iterdir():
+            if not (p.name.endswith(".tmp") or ".tmp." in p.name):
+                continue
+            try:
+                if now - p.stat().st_mtime >= max_age:
+                    p.unlink()
+                    removed += 1
+            except OSError:
+                pass
+    return removed
+
+# ---------------------------
+# Flux de changements : un compteur de génération par clé
+# ---------------------------
+# Un thread surveille data/ (stat des fichiers, ou versions SQLite en une requête) et
+# incrémente la génération des clés modifiées, par ce processus ou un autre.
+# Les pages d'affichage comparent generations() à celle de leur dernier rendu au lieu
+# de tout relire à chaque tic.
+_GENERATIONS: Dict[str, int] = {k: 0 for k in _FILES}
+_WATCH_INTERVAL = 0.25
+_watch_thread: Optional[threading.Thread] = None
+
+def _bump(key: str) -> None:
+    with _CACHE_LOCK:
+        _GENERATIONS[key] = _GENERATIONS.get(key, 0) + 1
+
+def _all_stamps() -> Dict[str, Any]:
+    if _store is not None:
+        return _store.versions()
+    return {k: _stamp(p) for k, p in _FILES.items()}
+
+def _watch_loop() -> None:
+    seen = _all_stamps()
+    while True:
+        time.sleep(_WATCH_INTERVAL)
+        try:
+            now = _all_stamps()
+        except Exception:
+            continue
+        for k in _FILES:
+            if now.get(k) != seen.get(k):
+                _bump(k)
+        seen = now
+
+def _ensure_watcher() -> None:
+    global _watch_thread
+    with _PENDING_COND:
+        if _watch_thread is None or not _watch_thread.is_alive():
+            _watch_thread = threading.Thread(target=_watch_loop, name="storage-watcher", daemon=True)
+            _watch_thread.start()
+
+def generations(keys=None) -> Dict[str, int]:
+    """{clé: génération} ; la génération change dès que la clé est modifiée (délai < 0,5 s)."""
+    _ensure_watcher()
+    with _CACHE_LOCK:
+        return {k: _GENERATIONS.get(k, 0) for k in (_FILES if keys is None else keys)}
+
+def stamp(keys) -> Tuple[Any, ...]:
+    """Empreinte de `keys` pour les caches dérivés (index, modèles) : change dès qu'une clé change.
+    Versions disque (écritures d'autres processus, immédiat) + générations (sauvegardes en attente ici)."""
+    gens = generations(keys)
+    return tuple((version(k), gens[k]) for k in keys)
+
+# ---------------------------
+# API publique
+# ---------------------------
 def load(key: str) -> Any:
-    path = _FILES.get(key)
-    if not path:
+    if key not in _FILES:
         return None
-    default = _DEFAULTS.get(key, None)
-    return _read_json(path, default)
+    pending = getattr(_tx, "pending", None)
+    if pending is not None and key in pending:
+        return _copy(pending[key][0])
+    blob = _pending_blob(key)
+    if blob is not None:  # écriture pas encore sur disque : on relit ce qu'on a écrit
+        return _value_of(key, blob)
+    return _value_of(key, _cached_entry(key)[1])
+
+def load_versioned(key: str) -> Tuple[Any, int]:
+    """(document, version) : passer cette version à save(..., expected_version=...)."""
+    if key not in _FILES:
+        return None, 0
+    with _PENDING_COND:
+        item = _PENDING.get(key)
+        if item is not None:
+            return _value_of(key, item["blob"]), _pending_token(key, item["blob"])
+    version, blob = _cached_entry(key)
+    if key not in (getattr(_tx, "bases", None) or ()):  # pas une écriture non validée de ce thread
+        _remember_base(key, version, blob)
+    return _value_of(key, blob), version
+
+def version(key: str) -> int:
+    """Version courante de `key` (0 si jamais écrite)."""
+    if key not in _FILES:
+        return 0
+    return _cached_entry(key)[0]
 
-def save(key: str, value: Any) -> None:
-    path = _FILES.get(key)
-    if not path:
+def save(key: str, value: Any, expected_version: Optional[int] = None, wait: bool = False) -> Optional[int]:
+    """Enregistre `key` en arrière-plan et renvoie la version à passer au prochain save().
+    Avec `expected_version` (issue de load_versioned) : si quelqu'un a écrit entre-temps,
+    nos changements sont fusionnés élément par élément dans la version courante.
+    wait=True attend l'écriture sur disque et renvoie la nouvelle version.
+    Dans un bloc transaction() JSON, l'écriture est différée et None est renvoyé."""
+    if key not in _FILES:
         raise KeyError(f"Unknown storage key: {key}")
-    _write_json(path, value)
+    pending = getattr(_tx, "pending", None)
+    if pending is not None:
+        pending[key] = (_copy(value), expected_version)
+        return None
+    if getattr(_tx, "direct", False):
+        return _commit(key, value, expected_version)
+    ticket = _enqueue(key, value, expected_version)
+    if wait:
+        flush(key=key)
+        return version(key)
+    return ticket
+
+def load_many(keys) -> Dict[str, Any]:
+    """Comme load_all(), mais ne lit QUE les clés demandées.
+    À préférer dans les pages : évite de relire les logos (plusieurs centaines de Ko)."""
+    return {k: load(k) for k in keys}
 
 def load_all() -> Dict[str, Any]:
-    from typing import Dict
-    return {k: _read_json(p, _DEFAULTS.get(k, None)) for k, p in _FILES.items()}
+    return {k: load(k) for k in _FILES}
 
 def reset() -> None:
-    for p in _FILES.values():
-        if p.exists():
-            p.unlink()
+    # écritures différées abandonnées : rejouées après coup, elles recréeraient les documents
+    with _PENDING_COND:
+        _PENDING.clear()
+        _PENDING_COND.notify_all()
+    with ExitStack() as held:
+        for key in _FILES:  # attend une écriture déjà en cours (_commit tient le verrou de clé)
+            held.enter_context(lock(key))
+        if _store is not None:
+            _store.delete_all()
+        else:
+            for p in _FILES.values():
+                if p.exists():
+                    p.unlink()
+        invalidate()
 
 def data_dir() -> Path:
     return DATA_DIR
 
+def export_json(keys=None, pretty: bool = True) -> bytes:
+    """Tous les documents (ou `keys`) en un seul JSON indenté, lisible par un humain."""
+    return codec.dumps(load_many(_FILES if keys is None else keys), pretty=pretty)
+
 # ---------------------------
-# Ecriture atomique (no-op locks)
+# Blobs binaires (logos) : data/blobs/<sha256><ext>
 # ---------------------------
-_write_lock_flag = False
+# Le JSON ne garde qu'un petit descripteur {"name", "sha256", "size", "blob"} ;
+# les anciens fichiers stockaient les octets en liste d'entiers ("bytes": [137, 80, ...]).
+BLOBS_DIR = DATA_DIR / "blobs"
+_BLOB_KEYS = ("final_block_logo", "final_block_jjif_logo")
+_BLOB_CACHE: Dict[str, bytes] = {}  # sha256 -> octets (contenu immuable)
 
-def begin_planning_write() -> None:
-    global _write_lock_flag
-    _write_lock_flag = True
+def save_blob(key: str, name: str, data: bytes) -> Dict[str, Any]:
+    """Écrit `data` dans data/blobs/ et enregistre son descripteur sous `key`."""
+    digest = hashlib.sha256(data).hexdigest()
+    blob = BLOBS_DIR / f"{digest}{Path(name).suffix.lower()}"
+    if not blob.exists():
+        BLOBS_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = blob.with_suffix(blob.suffix + f".tmp.{os.getpid()}_{int(time.time()*1000)}")
+        tmp.write_bytes(data)
+        os.replace(tmp, blob)
+    desc = {"name": name, "sha256": digest, "size": len(data), "blob": blob.name}
+    save(key, desc)
+    return desc
+
+def read_blob(rec: Any) -> Optional[memoryview]:
+    """Octets du blob décrit par `rec` (descripteur ou clé de stockage), sans copie.
+    Le memoryview repose sur un objet `bytes` (view.obj) gardé en cache : io.BytesIO(view.obj)
+    partage ce buffer au lieu de le recopier."""
+    if isinstance(rec, str):
+        rec = load(rec)
+    if not isinstance(rec, dict):
+        return None
+    if isinstance(rec.get("bytes"), list):  # ancien format non migré
+        return memoryview(bytes(rec["bytes"]))
+    digest, name = rec.get("sha256"), rec.get("blob")
+    if not digest or not name:
+        return None
+    data = _BLOB_CACHE.get(digest)
+    if data is None:
+        try:
+            data = (BLOBS_DIR / name).read_bytes()
+        except OSError:
+            return None
+        if hashlib.sha256(data).hexdigest() != digest:
+            return None
+        _BLOB_CACHE[digest] = data
+    return memoryview(data)
+
+def migrate_blobs() -> None:
+    """Migration unique : convertit les logos encore stockés en liste d'entiers.
+    Sans effet une fois faite ; load() ne migre rien (read_blob lit aussi l'ancien format)."""
+    for key in _BLOB_KEYS:
+        legacy = load(key)
+        if isinstance(legacy, dict) and isinstance(legacy.get("bytes"), list):
+            try:
+                save_blob(key, legacy.get("name") or key, bytes(legacy["bytes"]))
+            except Exception:
+                pass
 
-def end_planning_write() -> None:
-    global _write_lock_flag
-    _write_lock_flag = False
+# ménage au démarrage (ex. final_block_jjif_logo.json.tmp laissé par une écriture interrompue)
+sweep_tmp()
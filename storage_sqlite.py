@@ -0,0 +1,105 @@
+from __future__ import annotations
+# storage_sqlite.py
+# Backend SQLite (mode WAL) pour storage.py : une seule table clé -> document JSON.
+# Activé avec la variable d'environnement PODIUM_STORAGE_BACKEND=sqlite.
+import sqlite3, threading, time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    key        TEXT PRIMARY KEY,
+    value      TEXT NOT NULL,
+    version    INTEGER NOT NULL DEFAULT 1,
+    updated_at REAL NOT NULL
+)
+"""
+
+class SqliteStore:
+    """Documents JSON (texte) versionnés, une connexion par thread.
+    En WAL, les lecteurs ne bloquent jamais l'écrivain (et inversement) :
+    plus de conflits os.replace / OneDrive entre sessions."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._local = threading.local()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # isolation_level=None : autocommit, les transactions sont explicites (BEGIN IMMEDIATE)
+            conn = sqlite3.connect(str(self.path), timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SCHEMA)
+            self._local.conn = conn
+            self._local.depth = 0
+        return conn
+
+    def is_empty(self) -> bool:
+        return self._conn().execute("SELECT 1 FROM documents LIMIT 1").fetchone() is None
+
+    def version(self, key: str) -> Optional[int]:
+        row = self._conn().execute("SELECT version FROM documents WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def versions(self) -> Dict[str, int]:
+        """{clé: version} de tous les documents, en une seule requête."""
+        return dict(self._conn().execute("SELECT key, version FROM documents").fetchall())
+
+    def get(self, key: str) -> Optional[Tuple[int, str]]:
+        """(version, texte JSON) ou None si la clé n'existe pas."""
+        row = self._conn().execute("SELECT version, value FROM documents WHERE key = ?", (key,)).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def put(self, key: str, text: str, current: Optional[int] = None) -> bool:
+        """Écrit `key`. Avec `current` (version relue juste avant, 0 = absente) : compare-and-swap,
+        renvoie False sans rien écrire si une autre connexion a écrit entre-temps."""
+        conn, now = self._conn(), time.time()
+        if current is None:
+            conn.execute(
+                "INSERT INTO documents (key, value, version, updated_at) VALUES (?, ?, 1, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value, "
+                "version = documents.version + 1, updated_at = excluded.updated_at",
+                (key, text, now),
+            )
+            return True
+        if current == 0:
+            cur = conn.execute(
+                "INSERT OR IGNORE INTO documents (key, value, version, updated_at) VALUES (?, ?, 1, ?)",
+                (key, text, now),
+            )
+        else:
+            cur = conn.execute(
+                "UPDATE documents SET value = ?, version = version + 1, updated_at = ? "
+                "WHERE key = ? AND version = ?",
+                (text, now, key, current),
+            )
+        return cur.rowcount == 1
+
+    def delete_all(self) -> None:
+        self._conn().execute("DELETE FROM documents")
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """BEGIN IMMEDIATE ... COMMIT ; les blocs imbriqués rejoignent la transaction englobante."""
+        conn = self._conn()
+        if self._local.depth:
+            self._local.depth += 1
+            try:
+                yield
+            finally:
+                self._local.depth -= 1
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        self._local.depth = 1
+        try:
+            yield
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+        finally:
+            self._local.depth = 0
@@ -0,0 +1,26 @@
+# tests/test_storage_merge.py
+# storage lit PODIUM_DATA_DIR / PODIUM_STORAGE_BACKEND à l'import : chaque cas tourne
+# dans un interpréteur à part, sur un dossier de données temporaire.
+import json, os, subprocess, sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+_FIRST_WRITES = """
+import json, storage
+# deux stations partent du même document encore absent (version 0)
+_, v1 = storage.load_versioned("assignment")
+_, v2 = storage.load_versioned("assignment")
+storage.save("assignment", [{"category_id": "c1", "vip_ids": ["a"]}], expected_version=v1, wait=True)
+storage.save("assignment", [{"category_id": "c2", "vip_ids": ["b"]}], expected_version=v2, wait=True)
+print(json.dumps(storage.load("assignment")))
+"""
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_concurrent_first_writes_are_merged(tmp_path, backend):
+    env = dict(os.environ, PODIUM_DATA_DIR=str(tmp_path), PODIUM_STORAGE_BACKEND=backend)
+    out = subprocess.run([sys.executable, "-c", _FIRST_WRITES], cwd=ROOT, env=env,
+                         capture_output=True, text=True, check=True).stdout
+    assert [a["category_id"] for a in json.loads(out)] == ["c1", "c2"]
@@ -0,0 +1,125 @@
+from __future__ import annotations
+# timeline.py
+# Déroulé de la cérémonie, calculé une fois et partagé par Live, Prep Room, Hôtesse, Speaker
+# et Assignation : planning x catégories x médaillés x VIP x jours x tapis Final Block,
+# aplati en un tableau ordonné. Les pages ne font plus que des accès par position / id.
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import storage
+from indexes import SharedIndex
+from models import SLOTS, Medalist, VIP, load_event
+
+@dataclass(**SLOTS)
+class CeremonyEntry:
+    index: int                       # position dans le déroulé
+    category_id: str
+    title: str
+    medalists: List[Medalist]        # triés par rang
+    vip_ids: List[str]
+    vip_roles: Dict[str, str]        # vip_id -> "Gold" / "Silver" / "Bronze" / "General"
+    done: bool = False
+    day: str = ""                    # jour (Distribution), "" si non distribuée
+    mat: int = 0                     # tapis Final Block (0 = à assigner)
+    mat_order: int = 0
+    known: bool = True               # False : id du planning absent des catégories
+
+class CeremonyTimeline(SharedIndex):
+    """Déroulé ordonné (ordre du planning). Lecture seule : partagé entre sessions.
+    Construit de façon incrémentale à partir du déroulé précédent (`prev`) : une entrée n'est
+    recalculée que si sa position, son statut, sa catégorie, son assignation, son jour ou sa
+    place Final Block ont changé ; les autres sont reprises telles quelles."""
+    SOURCE_KEYS = ("categories", "vip", "planning", "assignment", "finals_days", "final_block")
+    __slots__ = ("entries", "vips", "days", "_pos", "_by_day", "_catalog", "_parts")
+
+    def __init__(self, event, finals_days: Any, final_block: Any,
+                 prev: Optional["CeremonyTimeline"] = None):
+        self.vips: Dict[str, VIP] = event.vips
+        # jours : "1" -> [ids] dans l'ordre de la distribution ; id -> premier jour
+        self._by_day: Dict[str, List[str]] = {}
+        day_of: Dict[str, str] = {}
+        for d, ids in (finals_days or {}).items():
+            if isinstance(ids, list):
+                self._by_day[str(d)] = [str(x) for x in ids]
+                for cid in self._by_day[str(d)]:
+                    day_of.setdefault(cid, str(d))
+        self.days: List[str] = sorted(self._by_day, key=lambda x: int(x) if x.isdigit() else 999)
+        mat_of: Dict[str, Tuple[int, int]] = {}
+        for f in (final_block or {}).get("finals") or []:
+            if isinstance(f, dict) and not f.get("is_break") and f.get("category_id"):
+                mat_of[str(f["category_id"])] = (_to_int(f.get("mat")), _to_int(f.get("order")))
+        self._parts = (event, day_of, mat_of)
+
+        self.entries: List[CeremonyEntry] = [
+            self._reuse(prev, i, p.category_id, p.done) for i, p in enumerate(event.planning)
+        ]
+        self._pos: Dict[str, int] = {}
+        for e in self.entries:
+            self._pos.setdefault(e.category_id, e.index)
+        self._catalog: Optional[List[CeremonyEntry]] = None
+
+    def _entry(self, i: int, cid: str, done: bool = False) -> CeremonyEntry:
+        event, day_of, mat_of = self._parts
+        cat = event.categories.get(cid)
+        a = event.assignments.get(cid)
+        mat, mat_order = mat_of.get(cid, (0, 0))
+        return CeremonyEntry(
+            index=i, category_id=cid, title=(cat.title if cat else cid) or "—",
+            medalists=(cat.medalists if cat else None) or [],
+            vip_ids=a.vip_ids if a else [], vip_roles=a.vip_roles if a else {},
+            done=done, day=day_of.get(cid, ""), mat=mat, mat_order=mat_order, known=cat is not None,
+        )
+
+    def _reuse(self, prev: Optional["CeremonyTimeline"], i: int, cid: str, done: bool) -> CeremonyEntry:
+        old = prev.entries[i] if prev is not None and i < len(prev.entries) else None
+        if old is not None and old.category_id == cid and old.done == done and prev._same_inputs(self, cid):
+            return old
+        return self._entry(i, cid, done)
+
+    def _same_inputs(self, other: "CeremonyTimeline", cid: str) -> bool:
+        (event, day_of, mat_of), (o_event, o_day_of, o_mat_of) = self._parts, other._parts
+        return (day_of.get(cid) == o_day_of.get(cid) and mat_of.get(cid) == o_mat_of.get(cid)
+                and _same(event.categories.get(cid), o_event.categories.get(cid))
+                and _same(event.assignments.get(cid), o_event.assignments.get(cid)))
+
+    @classmethod
+    def build(cls) -> "CeremonyTimeline":
+        docs = storage.load_many(["finals_days", "final_block"])
+        hit = cls.__dict__.get("_current")
+        return cls(load_event(), docs["finals_days"], docs["final_block"], prev=hit[1] if hit else None)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __getitem__(self, i: int) -> CeremonyEntry:
+        return self.entries[i]
+
+    def position(self, category_id: Any) -> Optional[int]:
+        return self._pos.get(category_id)
+
+    def get(self, category_id: Any) -> Optional[CeremonyEntry]:
+        i = self._pos.get(category_id)
+        return None if i is None else self.entries[i]
+
+    def day_ids(self, day: Optional[str] = None) -> List[str]:
+        """Ids d'un jour de la Distribution ; day=None : tous les jours, sans doublon."""
+        if day is not None:
+            return self._by_day.get(str(day), [])
+        return list(dict.fromkeys(cid for ids in self._by_day.values() for cid in ids))
+
+    def catalog(self) -> List[CeremonyEntry]:
+        """Toutes les catégories dans l'ordre du fichier (repli quand le planning est vide)."""
+        if self._catalog is None:
+            event = self._parts[0]
+            self._catalog = [self._entry(i, cid) for i, cid in enumerate(event.categories)]
+        return self._catalog
+
+def _same(a: Any, b: Any) -> bool:
+    # identité d'abord : load_event() garde les objets des parties dont la clé n'a pas bougé
+    return a is b or a == b
+
+def _to_int(v: Any) -> int:
+    try:
+        return int(v)
+    except (TypeError, ValueError):
+        return 0
@@ -3,7 +3,10 @@ import streamlit as st
 import os
 from pathlib import Path
 
-import base64
+import threading
+from functools import lru_cache
+
+import static_assets
 
 # ============================================================
 # 🎨 Thème global JJIF + Sidebar customisée
@@ -11,16 +14,28 @@ import base64
 
 def get_img_tag(path: str, width: str = "100%", invert: bool = False, clip_circle: bool = False) -> str:
     """
-    Read file, base64 encode it, and return an img tag.
+    Return an img tag for the file: hashed URL under static/ (browser-cacheable), or base64 data URI
+    when static serving is off.
     :param invert: if True, applies filter: invert(1); mix-blend-mode: screen;
     :param clip_circle: if True, applies border-radius: 50%; to crop corners (useful for circular icons with white corners).
+    Mémorisé par (chemin, mtime, taille, options) : le fichier n'est relu que s'il change.
     """
     try:
-        if not os.path.exists(path):
-            return "❓"
+        st_ = os.stat(path)
+    except OSError:
+        return "❓"
+    return _img_tag(path, st_.st_mtime_ns, st_.st_size, width, invert, clip_circle,
+                    static_assets.static_enabled())
+
+@lru_cache(maxsize=128)
+def _img_tag(path: str, mtime_ns: int, size: int, width: str, invert: bool, clip_circle: bool,
+             static: bool) -> str:
+    try:
         with open(path, "rb") as f:
             data = f.read()
-        raw_b64 = base64.b64encode(data).decode()
+        # URL static/ hashée (cache navigateur), ou data URI si le service statique est coupé
+        mime = static_assets.mime_of(Path(path))
+        src = static_assets.bytes_src(data, mime) if static else static_assets.data_uri(data, mime)
         
         style = f"width:{width}; height:auto; object-fit:contain;"
         if invert:
@@ -29,7 +44,7 @@ def get_img_tag(path: str, width: str = "100%", invert: bool = False, clip_circl
         if clip_circle:
             style += " border-radius: 50%;"
             
-        return f'<img src="data:image/png;base64,{raw_b64}" style="{style}">'
+        return f'<img src="{src}" style="{style}">'
     except Exception:
         return "❓"
 
@@ -277,25 +292,62 @@ def apply_theme():
 # 🧭 MENU LATÉRAL PERSONNALISÉ
 # ============================================================
 
+# Icônes image du menu (chemin, options de get_img_tag)
+_MENU_ICONS = {
+    "vip": ("assets/vip_assignment.png", dict(width="70%", invert=True)),
+    "prep": ("assets/prep_room.png", dict(width="70%", invert=False, clip_circle=True)),
+    "view_cat": ("assets/view_categories.png", dict(width="70%", invert=True)),
+    "hostess": ("assets/hostess.png", dict(width="70%", invert=False, clip_circle=True)),
+    "final_block": ("assets/final_block.png", dict(width="70%", invert=True)),
+}
+
+def _mtime(path: str) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+def _layout_stamp() -> tuple:
+    """Change quand une page est ajoutée / retirée (mtime de pages/, assets/) ou qu'une icône change."""
+    return (os.getcwd(), _mtime("pages"), _mtime("assets")) + tuple(_mtime(p) for p, _ in _MENU_ICONS.values())
+
+_LAYOUT_LOCK = threading.Lock()
+_LAYOUT = {}  # nom -> (stamp, valeur) : configuration et HTML du menu, un exemplaire par processus
+
+def _layout_cached(name: str, build):
+    stamp = _layout_stamp()
+    with _LAYOUT_LOCK:
+        hit = _LAYOUT.get(name)
+        if hit is not None and hit[0] == stamp:
+            return hit[1]
+    value = build()
+    with _LAYOUT_LOCK:
+        _LAYOUT[name] = (stamp, value)
+    return value
+
 def get_pages_config():
-    """Retourne la configuration centralisée des pages et sections."""
+    """Retourne la configuration centralisée des pages et sections.
+    Construite une fois par processus (reconstruite si pages/ ou assets/ changent) : lecture seule."""
+    return _layout_cached("config", _build_pages_config)
+
+def _build_pages_config():
     # Chemin dynamique pour l'export
     export_path = "pages/12_Final_Block_Export_From_Template.py" if Path("pages/12_Final_Block_Export_From_Template.py").exists() else "pages/12_Final_Block_Export.py"
 
     # L'image personnalisée pour VIP Assignation (on inverse)
-    vip_icon = get_img_tag("assets/vip_assignment.png", width="70%", invert=True)
+    vip_icon = get_img_tag(_MENU_ICONS["vip"][0], **_MENU_ICONS["vip"][1])
 
     # L'image personnalisée pour Prep Room (pas d'inversion mais CLIP CIRCLE pour virer le blanc)
-    prep_icon = get_img_tag("assets/prep_room.png", width="70%", invert=False, clip_circle=True)
+    prep_icon = get_img_tag(_MENU_ICONS["prep"][0], **_MENU_ICONS["prep"][1])
 
     # Icone View Categories
-    view_cat_icon = get_img_tag("assets/view_categories.png", width="70%", invert=True)
+    view_cat_icon = get_img_tag(_MENU_ICONS["view_cat"][0], **_MENU_ICONS["view_cat"][1])
 
     # Icone Hostess (Hotesse)
-    hostess_icon = get_img_tag("assets/hostess.png", width="70%", invert=False, clip_circle=True)
+    hostess_icon = get_img_tag(_MENU_ICONS["hostess"][0], **_MENU_ICONS["hostess"][1])
 
     # Icone Final Block
-    final_block_icon = get_img_tag("assets/final_block.png", width="70%", invert=True)
+    final_block_icon = get_img_tag(_MENU_ICONS["final_block"][0], **_MENU_ICONS["final_block"][1])
 
     return [
         {
@@ -354,54 +406,85 @@ def get_page_url(path: str) -> str:
     slug = re.sub(r'^\d+_', '', slug)
     return slug
 
+def _build_sidebar_html() -> str:
+    """Tout le menu latéral en un seul bloc HTML (sans ligne vide : un seul bloc markdown)."""
+    card = ('<a href="{url}" target="_self" class="sidebar-card"><div class="sidebar-card-inner">'
+            '<div class="sidebar-icon-box">{icon}</div><div class="sidebar-label">{label}</div></div></a>')
+    parts = [card.format(url=".", icon="🏠", label="HOME DASHBOARD"), '<div class="sidebar-sep"></div>']
+    for section in get_pages_config():
+        # Titre de section
+        parts.append(f'<div class="section-title">{section["icon"]} {section["header"]}</div>')
+        for item in section["items"]:
+            if os.path.exists(item["path"]):
+                parts.append(card.format(url=get_page_url(item["path"]), icon=item["icon"], label=item["label"]))
+            else:
+                # Page absente : carte désactivée (minimaliste, pour ne pas polluer)
+                parts.append('<div class="sidebar-card" style="opacity:0.4;cursor:not-allowed;">'
+                             '<div class="sidebar-card-inner">'
+                             f'<div class="sidebar-icon-box">{item["icon"]}</div>'
+                             f'<div class="sidebar-label">{item["label"]}</div></div></div>')
+        # Séparateur après chaque section
+        parts.append('<div class="sidebar-sep"></div>')
+    return "\n".join(parts)
+
+def _build_home_cards():
+    """[(section, [html de carte, ...])] du tableau de bord d'accueil."""
+    out = []
+    for section in get_pages_config():
+        cards = []
+        for item in section["items"]:
+            p = item["path"]
+            if not os.path.exists(p):
+                # Carte désactivée si le fichier manque
+                cards.append(
+                    '<div class="dashboard-card-inner" style="opacity:0.5; cursor:not-allowed;">'
+                    f'<div class="card-icon-box" style="filter:grayscale(1);">{item["icon"] or "❓"}</div>'
+                    f'<div class="card-content"><div class="card-title">{item["label"]}</div>'
+                    f'<div class="card-desc">{item.get("description", "Missing file")}</div></div></div>'
+                )
+            else:
+                cards.append(
+                    f'<a href="{get_page_url(p)}" target="_self" class="dashboard-card">'
+                    '<div class="dashboard-card-inner">'
+                    f'<div class="card-icon-box">{item["icon"] or ""}</div>'
+                    f'<div class="card-content"><div class="card-title">{item["label"]}</div>'
+                    f'<div class="card-desc">{item.get("description", "")}</div></div></div></a>'
+                )
+        out.append((section, cards))
+    return out
+
+def get_home_cards():
+    """Cartes HTML de l'accueil, préparées une fois par processus (comme le menu latéral)."""
+    return _layout_cached("home", _build_home_cards)
+
 def render_sidebar():
     """
     Construit le menu latéral en utilisant la configuration centralisée.
-    Rendu style "Mini Cards" HTML.
+    Rendu style "Mini Cards" HTML, en un seul st.markdown ; le HTML est préparé une fois par
+    processus et reconstruit seulement quand pages/ ou assets/ changent.
     """
-    import os
-    config = get_pages_config()
-
     with st.sidebar:
-        # Bouton Retour Accueil
-        st.markdown("""
-        <a href="." target="_self" class="sidebar-card">
-            <div class="sidebar-card-inner">
-                <div class="sidebar-icon-box">🏠</div>
-                <div class="sidebar-label">HOME DASHBOARD</div>
-            </div>
-        </a>
-        <div class="sidebar-sep"></div>
-        """, unsafe_allow_html=True)
-
-        for section in config:
-            # Titre de section
-            st.markdown(f'<div class="section-title">{section["icon"]} {section["header"]}</div>', unsafe_allow_html=True)
-            
-            # Liens
-            for item in section["items"]:
-                p = item["path"]
-                if os.path.exists(p):
-                    target_url = get_page_url(p)
-                    
-                    label = item["label"]
-                    icon = item["icon"]
-                    
-                    html = f"""
-                    <a href="{target_url}" target="_self" class="sidebar-card">
-                        <div class="sidebar-card-inner">
-                            <div class="sidebar-icon-box">{icon}</div>
-                            <div class="sidebar-label">{label}</div>
-                        </div>
-                    </a>
-                    """
-                    st.markdown(html, unsafe_allow_html=True)
-                else:
-                    # Bouton désactivé (style minimaliste pour ne pas polluer)
-                    st.button(f"{item['icon']} {item['label']}", disabled=True, key=f"dead_{item['label']}")
+        st.markdown(_layout_cached("sidebar", _build_sidebar_html), unsafe_allow_html=True)
 
-            
-            # Séparateur après chaque section
-            st.markdown('<div class="sidebar-sep"></div>', unsafe_allow_html=True)
-        
 
+def watch_changes(keys, every: float, state_key: str):
+    """
+    Rafraîchit la page quand une des clés storage `keys` change.
+    Un fragment tourne toutes les `every` secondes et ne compare que des compteurs
+    (storage.generations) : la page n'est relancée que si les données ont bougé.
+    À appeler AVANT de charger les données. Sans st.fragment (Streamlit ancien),
+    ne fait rien : le bouton Reload reste disponible.
+    """
+    from storage import generations
+    fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+    if fragment is None:
+        return
+    gen_key = f"_generations_{state_key}"
+    st.session_state[gen_key] = generations(keys)  # état des données de ce run
+
+    @fragment(run_every=max(1, every))
+    def _tick():
+        if generations(keys) != st.session_state.get(gen_key):
+            st.rerun()
+
+    _tick()
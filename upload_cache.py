@@ -0,0 +1,62 @@
+from __future__ import annotations
+# upload_cache.py
+# Résultat du parsing des fichiers envoyés (Import Results / Import Categories), gardé
+# d'un rerun Streamlit à l'autre : un clic sur une case à cocher ne relit plus le fichier.
+# Clé = (sha256 du contenu, parser, options) ; LRU partagé par les sessions du processus.
+import hashlib, marshal, threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Sequence, Tuple, Union
+
+MAX_ENTRIES = 16
+
+# clé -> (est_marshal, valeur) ; valeur = blob marshal (copie neuve à chaque lecture)
+_CACHE: "OrderedDict[Tuple[str, str, Hashable], Tuple[bool, Any]]" = OrderedDict()
+_LOCK = threading.Lock()
+_STATS = {"hits": 0, "misses": 0}
+
+def digest(data: Union[bytes, Sequence[bytes]]) -> str:
+    """sha256 d'un contenu, ou de plusieurs (import par lots) dans l'ordre donné."""
+    h = hashlib.sha256()
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        h.update(data)
+    else:
+        for blob in data:
+            h.update(len(blob).to_bytes(8, "little"))
+            h.update(blob)
+    return h.hexdigest()
+
+def parse(parser: str, data: Union[bytes, Sequence[bytes]], fn: Callable[[Any], Any],
+          options: Hashable = ()) -> Any:
+    """
+    fn(data) mémorisé par (sha256(data), parser, options). Chaque appel renvoie une copie
+    (le résultat peut être modifié par la page). Les exceptions ne sont pas mémorisées.
+    """
+    key = (digest(data), parser, options)
+    with _LOCK:
+        hit = _CACHE.get(key)
+        if hit is not None:
+            _CACHE.move_to_end(key)
+            _STATS["hits"] += 1
+    if hit is not None:
+        packed, value = hit
+        return marshal.loads(value) if packed else value
+    result = fn(data)
+    try:
+        entry = (True, marshal.dumps(result))
+    except ValueError:  # types non sérialisables par marshal : objet gardé tel quel
+        entry = (False, result)
+    with _LOCK:
+        _STATS["misses"] += 1
+        _CACHE[key] = entry
+        _CACHE.move_to_end(key)
+        while len(_CACHE) > MAX_ENTRIES:
+            _CACHE.popitem(last=False)
+    return result
+
+def clear() -> None:
+    with _LOCK:
+        _CACHE.clear()
+
+def stats() -> dict:
+    with _LOCK:
+        return dict(_STATS, entries=len(_CACHE))
@@ -1,20 +1,21 @@
-import json
 from pathlib import Path
 from typing import Dict, List, Set
 
+import codec
+
 FILE = Path(__file__).parent / "data" / "view_filters.json"
 FILE.parent.mkdir(parents=True, exist_ok=True)
 
 def _read() -> Dict[str, List[str]]:
     if FILE.exists():
         try:
-            return json.loads(FILE.read_text(encoding="utf-8")) or {}
+            return codec.loads(FILE.read_bytes()) or {}
         except Exception:
             return {}
     return {}
 
 def _write(data: Dict[str, List[str]]):
-    FILE.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    FILE.write_bytes(codec.dumps(data))
 
 def get_hidden(page_key: str) -> Set[str]:
     data = _read()